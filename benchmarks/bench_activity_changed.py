@@ -0,0 +1,161 @@
+"""
+Micro-benchmark of SpeakingEyeApp.__on_activity_changed components (per activity transition)
+and of notification threshold checks computed from ActivityStatHolder vs SessionAccumulator.
+SpeakingEyeApp itself needs GTK, so the same steps are called directly.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_activity_changed.py [--transitions N]
+"""
+import argparse
+import tempfile
+import time
+from functools import partial
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, cast, Dict, List, Tuple
+
+from bench_activity_writer import TmpFilesProvider
+from speaking_eye.activity import Activity
+from speaking_eye.activity_coalescer import ActivityCoalescer
+from speaking_eye.activity_stat_holder import ActivityStatHolder
+from speaking_eye.activity_writer import ActivityWriter
+from speaking_eye.application_info import ApplicationInfo
+from speaking_eye.application_info_matcher import ApplicationInfoMatcher
+from speaking_eye.datetime_helper import DatetimeHelper
+from speaking_eye.files_provider import FilesProvider
+from speaking_eye.flush_mode import FlushMode
+from speaking_eye.session_accumulator import SessionAccumulator
+
+DETAILED_APP_INFOS = [
+    ApplicationInfo('IDE', 'jetbrains-pycharm', '', False),
+    ApplicationInfo('Internet', 'Chromium|Firefox', '', False),
+]
+DISTRACTING_APP_INFOS = [
+    ApplicationInfo('YouTube', 'Chromium|Firefox', 'YouTube', True),
+]
+WORK_TIME_LIMIT = timedelta(hours=9)
+DISTRACTING_APPS_LIMIT = timedelta(minutes=15)
+
+
+def generate_transitions(transitions_count: int, start_time: datetime = datetime(2021, 7, 4, 9)) -> List[Activity]:
+    wm_classes = ['jetbrains-pycharm', 'Firefox', 'Firefox']
+    window_names = ['speaking_eye.py', 'Docs - Firefox', 'Cats - YouTube - Firefox']
+
+    return [Activity(wm_classes[i % 3], f'{window_names[i % 3]} {i % 7}', start_time + timedelta(seconds=5 * i), True)
+            for i in range(transitions_count)]
+
+
+def measure_us(step: Callable[[], None], count: int) -> float:
+    started = time.perf_counter()
+    step()
+
+    return (time.perf_counter() - started) * 10 ** 6 / count
+
+
+ActivityPairs = List[Tuple[Activity, Activity]]
+
+
+def coalesce(coalescer: ActivityCoalescer, pairs: ActivityPairs) -> None:
+    for previous_activity, next_activity in pairs:
+        coalescer.is_continuation(previous_activity, next_activity)
+        coalescer.is_too_short(previous_activity, next_activity, next_activity.start_time)
+
+
+def finish(pairs: ActivityPairs) -> None:
+    for previous_activity, next_activity in pairs:
+        previous_activity.set_end_time(next_activity.start_time)
+
+
+def match(matcher: ApplicationInfoMatcher, activities: List[Activity]) -> None:
+    for activity in activities:
+        matcher.set_if_matched(activity)
+
+
+def update_holder(holder: ActivityStatHolder, pairs: ActivityPairs) -> None:
+    for activity, _ in pairs:
+        holder.update_stat(activity)
+
+
+def update_session(session: SessionAccumulator, pairs: ActivityPairs) -> None:
+    for previous_activity, next_activity in pairs:
+        session.finish(previous_activity, next_activity.start_time)
+        session.start(next_activity)
+
+
+def write(files_provider: FilesProvider, flush_mode: FlushMode, pairs: ActivityPairs) -> None:
+    writer = ActivityWriter(files_provider, flush_mode, flush_max_activities=100)
+
+    for activity, _ in pairs:
+        writer.write(activity)
+
+    writer.close()
+
+
+def get_transition_steps(activities: List[Activity], holder: ActivityStatHolder, session: SessionAccumulator,
+                         raw_data_dir: Path) -> Dict[str, Callable[[], None]]:
+    """Steps in the same order as in SpeakingEyeApp.__on_activity_changed"""
+    pairs = list(zip(activities, activities[1:]))
+    coalescer = ActivityCoalescer(min_activity_ms=1000, title_normalization_re=r'^\(\d+\) ')
+    matcher = ApplicationInfoMatcher(DETAILED_APP_INFOS, DISTRACTING_APP_INFOS)
+    files_provider = cast(FilesProvider, TmpFilesProvider(raw_data_dir))
+
+    steps = {
+        'coalescer': partial(coalesce, coalescer, pairs),
+        'set_end_time': partial(finish, pairs),
+        'matcher': partial(match, matcher, activities),
+        'holder.update_stat': partial(update_holder, holder, pairs),
+        'session finish+start': partial(update_session, session, pairs),
+    }
+
+    for flush_mode in FlushMode:
+        steps[f'writer ({flush_mode.value})'] = partial(write, files_provider, flush_mode, pairs)
+
+    return steps
+
+
+def get_check_steps(current_activity: Activity, holder: ActivityStatHolder, session: SessionAccumulator,
+                    count: int) -> Dict[str, Callable[[], None]]:
+    title = SessionAccumulator.get_title(current_activity)
+    now = current_activity.start_time + timedelta(minutes=1)
+    now_us = DatetimeHelper.to_epoch_microseconds(now)
+    work_time_limit_us = DatetimeHelper.to_microseconds(WORK_TIME_LIMIT)
+    distracting_apps_limit_us = DatetimeHelper.to_microseconds(DISTRACTING_APPS_LIMIT)
+
+    def check_with_holder() -> None:
+        for _ in range(count):
+            seconds_in_current_activity = (now - current_activity.start_time).total_seconds()
+            _ = seconds_in_current_activity + holder.total_work_time.total_seconds() \
+                >= WORK_TIME_LIMIT.total_seconds()
+            _ = (now - current_activity.start_time + holder[title].work_time).total_seconds() \
+                < DISTRACTING_APPS_LIMIT.total_seconds()
+
+    def check_with_session() -> None:
+        for _ in range(count):
+            _ = session.get_work_us(now_us) >= work_time_limit_us
+            _ = session.get_current_title_work_us(now_us) < distracting_apps_limit_us
+
+    return {'holder': check_with_holder, 'session': check_with_session}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--transitions', type=int, default=100_000)
+    args = parser.parse_args()
+
+    activities = generate_transitions(args.transitions)
+    count = len(activities) - 1
+    holder = ActivityStatHolder([])
+    session = SessionAccumulator()
+
+    with tempfile.TemporaryDirectory() as raw_data_dir:
+        print('Per transition:')
+        for name, step in get_transition_steps(activities, holder, session, Path(raw_data_dir)).items():
+            print(f'{name:>24}: {measure_us(step, count):8.3f} us')
+
+    print('Per overtime + distracting app check:')
+    for name, step in get_check_steps(activities[-1], holder, session, count).items():
+        print(f'{name:>24}: {measure_us(step, count):8.3f} us')
+
+
+if __name__ == '__main__':
+    main()
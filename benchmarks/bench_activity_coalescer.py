@@ -0,0 +1,98 @@
+"""
+Benchmark of ActivityCoalescer: how many activities/bytes are written for a stream of window name changes
+with animated titles (counters, progress) with and without coalescing. Total time per wm_class should not change.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_activity_coalescer.py [--changes N] [--min-activity-ms N]
+"""
+import argparse
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_coalescer import ActivityCoalescer
+from speaking_eye.activity_converter import ActivityConverter
+
+TITLE_NORMALIZATION_RE = r'^\(\d+\) |\d+%'
+
+
+def generate_changes(changes_count: int, start_time: datetime = datetime(2021, 7, 4, 9)) -> Iterator[Activity]:
+    """Mostly sub-second title updates of a few apps and sometimes long activities"""
+    random_generator = random.Random(42)
+    now = start_time
+
+    for i in range(changes_count):
+        kind = random_generator.random()
+
+        if kind < 0.4:
+            activity = Activity('Slack', f'({i % 20}) Slack | general', now, True)
+        elif kind < 0.8:
+            activity = Activity('Firefox', f'Downloading {i % 100}% - Firefox', now, True)
+        else:
+            activity = Activity('Gnome-terminal', f'Terminal {i % 3}', now, True)
+
+        yield activity
+
+        now += timedelta(milliseconds=random_generator.choice([100, 200, 500, 3000, 60000]))
+
+
+def write_changes(changes: List[Activity], coalescer: Optional[ActivityCoalescer], stop_time: datetime) -> List[str]:
+    """The same logic as in SpeakingEyeApp.__on_activity_changed"""
+    lines = []
+    current_activity: Optional[Activity] = None
+
+    for next_activity in changes:
+        now = next_activity.start_time
+
+        if current_activity is not None:
+            if coalescer is not None and coalescer.is_continuation(current_activity, next_activity):
+                continue
+
+            if coalescer is not None and coalescer.is_too_short(current_activity, next_activity, now):
+                next_activity.start_time = current_activity.start_time
+            else:
+                lines.append(ActivityConverter.to_string(current_activity.set_end_time(now)))
+
+        current_activity = next_activity
+
+    if current_activity is not None:
+        lines.append(ActivityConverter.to_string(current_activity.set_end_time(stop_time)))
+
+    return lines
+
+
+def get_total_times(lines: List[str]) -> Dict[str, timedelta]:
+    total_times: Dict[str, timedelta] = defaultdict(timedelta)
+
+    for line in lines:
+        activity = ActivityConverter.from_string(line)
+        total_times[activity.wm_class] += activity.end_time - activity.start_time  # type: ignore[operator]
+
+    return dict(total_times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--changes', type=int, default=100_000)
+    parser.add_argument('--min-activity-ms', type=int, default=1000)
+    args = parser.parse_args()
+
+    coalescers = {
+        'without coalescing': None,
+        'with coalescing': ActivityCoalescer(args.min_activity_ms, TITLE_NORMALIZATION_RE),
+    }
+
+    for name, coalescer in coalescers.items():
+        changes = list(generate_changes(args.changes))
+        lines = write_changes(changes, coalescer, stop_time=changes[-1].start_time + timedelta(minutes=1))
+        size = sum(len(line.encode('utf-8')) for line in lines)
+
+        print(f'{name:>18}: {len(lines):8} activities, {size:10} bytes')
+        for wm_class, total_time in sorted(get_total_times(lines).items()):
+            print(f'{wm_class:>28}: {total_time}')
+
+
+if __name__ == '__main__':
+    main()
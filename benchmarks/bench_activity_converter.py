@@ -0,0 +1,68 @@
+"""
+Microbenchmark of ActivityConverter.from_string: lines/second before and after the fast-path timestamp parser.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_activity_converter.py [--lines N] [--repeat N]
+"""
+import argparse
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_converter import ActivityConverter
+from speaking_eye.bool_parser import BoolParser
+from speaking_eye.datetime_formatter import DatetimeFormatter
+
+
+def generate_lines(lines_count: int, start_time: datetime = datetime(2021, 7, 4, 9, 0, 0)) -> List[str]:
+    lines = []
+
+    for i in range(lines_count):
+        # NOTE: every 10th timestamp has no microseconds, just like datetime.now() at the start of a second
+        end_time = start_time + timedelta(seconds=7, microseconds=0 if i % 10 == 0 else 12345)
+        activity = Activity(f'wm_class{i % 20}', f'window_name{i % 500}', start_time, i % 3 != 0)
+        lines.append(ActivityConverter.to_string(activity.set_end_time(end_time)))
+        start_time = end_time
+
+    return lines
+
+
+def from_string_with_strptime(value: str) -> Activity:
+    """ActivityConverter.from_string as it was before the fast-path parser"""
+    start_time_str, end_time_str, _, wm_class, window_name, is_work_time_str = value.split(sep='\t')
+    start_time = DatetimeFormatter.parse_string_with_optional_milliseconds(start_time_str)
+    end_time = DatetimeFormatter.parse_string_with_optional_milliseconds(end_time_str)
+    is_work_time = BoolParser.parse(is_work_time_str.replace('\n', ''))
+
+    return Activity(wm_class, window_name, start_time, is_work_time).set_end_time(end_time)
+
+
+def measure_lines_per_second(parse: Callable[[str], Activity], lines: List[str], repeat: int) -> float:
+    def parse_all() -> None:
+        for line in lines:
+            parse(line)
+
+    best_seconds = min(timeit.repeat(parse_all, number=1, repeat=repeat))
+
+    return len(lines) / best_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='ActivityConverter.from_string microbenchmark')
+    parser.add_argument('--lines', type=int, default=100_000, help='number of generated lines')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    lines = generate_lines(args.lines)
+
+    before = measure_lines_per_second(from_string_with_strptime, lines, args.repeat)
+    after = measure_lines_per_second(ActivityConverter.from_string, lines, args.repeat)
+
+    print(f'strptime:  {before:12,.0f} lines/s')
+    print(f'fast path: {after:12,.0f} lines/s')
+    print(f'speedup:   {after / before:12.1f}x')
+
+
+if __name__ == '__main__':
+    main()
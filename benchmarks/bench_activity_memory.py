@@ -0,0 +1,75 @@
+"""
+Memory benchmark: bytes per activity loaded from raw data before and after compact Activity layout.
+"Before" is emulated with a copy of the old Activity class (per-instance __dict__, not interned strings).
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_activity_memory.py [--lines N]
+"""
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional
+
+from bench_activity_converter import generate_lines
+from speaking_eye.activity_converter import ActivityConverter
+from speaking_eye.datetime_formatter import DatetimeFormatter
+
+
+class ActivityWithDict:
+    """Activity layout before __slots__"""
+
+    def __init__(self, wm_class: str, window_name: str, start_time: datetime, is_work_time: bool) -> None:
+        self.wm_class = wm_class
+        self.window_name = window_name
+        self.start_time = start_time
+        self.end_time: Optional[datetime] = None
+        self.activity_time: Optional[timedelta] = None
+        self.is_work_time = is_work_time
+        self.application_info = None
+
+    def set_end_time(self, end_time: datetime) -> 'ActivityWithDict':
+        self.end_time = end_time
+        self.activity_time = self.end_time - self.start_time
+
+        return self
+
+
+def from_string_with_dict(value: str) -> ActivityWithDict:
+    start_time_str, end_time_str, _, wm_class, window_name, is_work_time_str = value.split(sep='\t')
+
+    return ActivityWithDict(wm_class, window_name, DatetimeFormatter.parse_str_datetime(start_time_str),
+                            is_work_time_str == 'True\n')\
+        .set_end_time(DatetimeFormatter.parse_str_datetime(end_time_str))
+
+
+def measure_bytes_per_activity(parse: Callable[[str], Any], lines: List[str]) -> float:
+    gc.collect()
+    tracemalloc.start()
+
+    activities = [parse(line) for line in lines]
+    allocated_bytes, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del activities
+
+    return allocated_bytes / len(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Activity memory benchmark')
+    parser.add_argument('--lines', type=int, default=100_000, help='number of generated lines')
+    args = parser.parse_args()
+
+    lines = generate_lines(args.lines)
+
+    before = measure_bytes_per_activity(from_string_with_dict, lines)
+    after = measure_bytes_per_activity(ActivityConverter.from_string, lines)
+
+    print(f'__dict__:  {before:8.1f} bytes/activity')
+    print(f'__slots__: {after:8.1f} bytes/activity')
+    print(f'saved:     {100 * (1 - after / before):8.1f} %')
+
+
+if __name__ == '__main__':
+    main()
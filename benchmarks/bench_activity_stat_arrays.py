@@ -0,0 +1,61 @@
+"""
+Benchmark of day aggregation for reports: ActivityStatHolder built activity by activity
+vs ActivityStatArrays (numpy group by title) built from the same DayColumns (e.g. loaded from ActivityDayCache).
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_activity_stat_arrays.py [--lines N] [--repeat N]
+"""
+import argparse
+import timeit
+
+from bench_activity_converter import generate_lines
+from speaking_eye.activity_converter import ActivityConverter
+from speaking_eye.activity_day_cache import DayColumns, DayColumnsBuilder
+from speaking_eye.activity_stat_arrays import ActivityStatArrays
+from speaking_eye.activity_stat_holder import ActivityStatHolder
+from speaking_eye.application_info import ApplicationInfo
+from speaking_eye.application_info_matcher import ApplicationInfoMatcher
+
+
+def aggregate_with_holder(columns: DayColumns, matcher: ApplicationInfoMatcher) -> ActivityStatHolder:
+    """The way ActivityReader.iter_read() & ActivityStatHolder do it"""
+    holder = ActivityStatHolder([])
+
+    for activity in columns.iter_activities():
+        matcher.set_if_matched(activity)
+        holder.update_stat(activity)
+
+    return holder
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--lines', type=int, default=200_000, help='number of generated activities')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    columns_builder = DayColumnsBuilder()
+    for line in generate_lines(args.lines):
+        columns_builder.append(ActivityConverter.from_string(line))
+    columns = columns_builder.build()
+
+    matcher = ApplicationInfoMatcher(
+        [ApplicationInfo(f'title{i}', f'wm_class{i}', f'window_name{i}', False) for i in range(10)],
+        [ApplicationInfo('distracting', 'wm_class1[0-9]', 'window_name[0-9]+0', True)],
+    )
+
+    holder = aggregate_with_holder(columns, matcher)
+    arrays_holder = ActivityStatArrays.from_columns(columns, matcher).to_holder()
+    assert list(holder.items()) == list(arrays_holder.items()), 'results of aggregations should be equal'
+    assert holder.total_work_time == arrays_holder.total_work_time
+
+    holder_seconds = min(timeit.repeat(lambda: aggregate_with_holder(columns, matcher), number=1, repeat=args.repeat))
+    arrays_seconds = min(timeit.repeat(lambda: ActivityStatArrays.from_columns(columns, matcher).to_holder(),
+                                       number=1, repeat=args.repeat))
+
+    print(f'    holder: {args.lines / holder_seconds:12.0f} activities/s')
+    print(f'vectorized: {args.lines / arrays_seconds:12.0f} activities/s ({holder_seconds / arrays_seconds:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark of ActivityWriter: activities/second written to a raw data file in each FlushMode.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_activity_writer.py [--activities N] [--flush-max-activities N]
+"""
+import argparse
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import cast, List
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_writer import ActivityWriter
+from speaking_eye.files_provider import FilesProvider
+from speaking_eye.flush_mode import FlushMode
+from speaking_eye.raw_data_catalog import RawDataCatalog
+
+
+class TmpFilesProvider:
+    """Provide raw data files from a temporary dir instead of the user data dir"""
+
+    def __init__(self, raw_data_dir: Path) -> None:
+        self.raw_data_dir = raw_data_dir
+        self.raw_data_catalog = RawDataCatalog(raw_data_dir, lambda file_name: None)
+
+    def get_raw_data_file_path(self, day: date) -> Path:
+        return self.raw_data_dir / f'{day}_speaking_eye_raw_data.tsv'
+
+
+def generate_activities(activities_count: int, start_time: datetime = datetime(2021, 7, 4, 9)) -> List[Activity]:
+    """Activities of one day like browser tab titles that are changed every second"""
+    activities = []
+
+    for i in range(activities_count):
+        activity_start_time = start_time + timedelta(microseconds=i)
+        activity = Activity('Chromium', f'Tab title {i % 50} - Chromium', activity_start_time, is_work_time=True)
+        activities.append(activity.set_end_time(activity_start_time + timedelta(microseconds=1)))
+
+    return activities
+
+
+def measure(flush_mode: FlushMode, flush_max_activities: int, activities: List[Activity]) -> float:
+    with tempfile.TemporaryDirectory() as root_dir:
+        files_provider = cast(FilesProvider, TmpFilesProvider(Path(root_dir)))
+        writer = ActivityWriter(files_provider, flush_mode, flush_max_activities)
+
+        started = time.perf_counter()
+        for activity in activities:
+            writer.write(activity)
+        writer.close()
+        elapsed = time.perf_counter() - started
+
+    return len(activities) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--activities', type=int, default=100_000)
+    parser.add_argument('--flush-max-activities', type=int, default=100)
+    args = parser.parse_args()
+
+    activities = generate_activities(args.activities)
+
+    for flush_mode in FlushMode:
+        activities_per_second = measure(flush_mode, args.flush_max_activities, activities)
+        print(f'{flush_mode.value:>8}: {activities_per_second:12.0f} activities/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark of DayStatLoader: time to load a 365-day report range sequentially and with pools of workers.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_day_stat_loader.py [--days N] [--lines-per-day N] [--max-workers N]
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import List
+
+from raw_data_generator import RawDataGenerator
+from speaking_eye.activity_reader import ActivityReader
+from speaking_eye.activity_stat_holder import ActivityStatHolder
+from speaking_eye.application_info_matcher import ApplicationInfoMatcher
+from speaking_eye.day_stat_loader import DayStatLoader
+from speaking_eye.pool_type import PoolType
+
+
+def measure_seconds(loader: DayStatLoader, raw_data_files: List[Path]) -> float:
+    # NOTE: start workers before measuring since executor is reused between reports
+    list(loader.load(raw_data_files[:2]))
+
+    started_at = time.perf_counter()
+    holder = ActivityStatHolder([])
+
+    for day_holder in loader.load(raw_data_files):
+        holder.merge(day_holder)
+
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='DayStatLoader benchmark')
+    parser.add_argument('--days', type=int, default=365, help='number of days in report range')
+    parser.add_argument('--lines-per-day', type=int, default=2000, help='number of activities per day')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1, help='max number of workers')
+    args = parser.parse_args()
+
+    generator = RawDataGenerator(activities_per_day=args.lines_per_day, midnight_crossing=False)
+    matcher = ApplicationInfoMatcher(*generator.get_app_infos())
+    reader = ActivityReader(logging.getLogger('bench_day_stat_loader'), matcher)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        raw_data_files = generator.write(Path(data_dir), date(2021, 1, 1), args.days)
+
+        sequential_seconds = measure_seconds(DayStatLoader(reader, 0, PoolType.PROCESS), raw_data_files)
+        print(f'sequential:            {sequential_seconds:8.2f} s')
+
+        workers = 1
+        while workers <= args.max_workers:
+            for pool_type in PoolType:
+                loader = DayStatLoader(reader, workers, pool_type)
+                seconds = measure_seconds(loader, raw_data_files)
+                loader.shutdown()
+
+                print(f'{pool_type.value:>7} x {workers:<3}         {seconds:8.2f} s '
+                      f'(speedup {sequential_seconds / seconds:.1f}x)')
+
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
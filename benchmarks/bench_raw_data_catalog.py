@@ -0,0 +1,92 @@
+"""
+Benchmark of queries that report server does on every page/report:
+the first date with raw data and files with raw data for a date range.
+Compares scanning of data dir & probing of every day in range with RawDataCatalog.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_raw_data_catalog.py [--years N] [--repeat N]
+"""
+import argparse
+import glob
+import os
+import tempfile
+import timeit
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import parse
+from speaking_eye.compression import Compression
+from speaking_eye.datetime_helper import DatetimeHelper
+from speaking_eye.files_provider import FilesProvider
+from speaking_eye.raw_data_format import RawDataFormat
+
+RAW_DATA_FILE_MASK = '{date}_speaking_eye_raw_data.{suffix}'
+
+
+def get_first_date_by_glob(raw_data_dir: Path) -> date:
+    """The way it was done before RawDataCatalog"""
+    file_dates = []
+
+    for file_path in glob.glob(str(raw_data_dir / '*_speaking_eye_raw_data.*')):
+        parsed = parse.parse(RAW_DATA_FILE_MASK, os.path.basename(file_path))
+        file_dates.append(datetime.strptime(parsed['date'], '%Y-%m-%d').date())
+
+    return min(file_dates)
+
+
+def get_files_by_probing(raw_data_dir: Path, start_date: date, end_date: date) -> int:
+    """The way it was done before RawDataCatalog: every variant of file is checked for every day"""
+    files_count = 0
+
+    for report_date in DatetimeHelper.get_dates_between(start_date, end_date):
+        file_paths = (raw_data_dir / f'{report_date}_speaking_eye_raw_data.{raw_data_format.value}{compression.suffix}'
+                      for raw_data_format in RawDataFormat for compression in Compression)
+
+        if any(file_path.exists() for file_path in file_paths):
+            files_count += 1
+
+    return files_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--years', type=int, default=3, help='number of years with raw data files')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    package_root_dir = Path(__file__).parent.parent / 'src' / 'speaking_eye'
+
+    with tempfile.TemporaryDirectory() as data_home, \
+            patch('speaking_eye.files_provider.xdg_data_home', return_value=Path(data_home)), \
+            patch('speaking_eye.files_provider.xdg_config_home', return_value=Path(data_home)):
+        files_provider = FilesProvider(package_root_dir, 'speaking-eye')
+        raw_data_dir = files_provider.raw_data_dir
+
+        end_date = date(2021, 7, 4)
+        start_date = end_date - timedelta(days=365 * args.years)
+
+        for file_date in DatetimeHelper.get_dates_between(start_date, end_date):
+            # NOTE: no data on weekends
+            if file_date.weekday() <= 4:
+                (raw_data_dir / f'{file_date}_speaking_eye_raw_data.tsv.gz').write_bytes(b'')
+
+        # NOTE: files are created long ago, so catalog can trust mtime of data dir
+        os.utime(str(raw_data_dir), ns=(0, 0))
+
+        catalog = files_provider.raw_data_catalog
+
+        benchmarks = {
+            'glob first date': lambda: get_first_date_by_glob(raw_data_dir),
+            'catalog first date': lambda: catalog.get_first_date(end_date),
+            'probe range': lambda: get_files_by_probing(raw_data_dir, start_date, end_date),
+            'catalog range': lambda: len(catalog.get_dates(start_date, end_date)),
+        }
+
+        for name, benchmark in benchmarks.items():
+            best_seconds = min(timeit.repeat(benchmark, number=10, repeat=args.repeat)) / 10
+            print(f'{name:>18}: {best_seconds * 1000:10.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark of raw data formats: size on disk and read throughput (activities/second) of TSV vs binary log,
+both plain and compressed as files of closed days.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_raw_data_format.py [--lines N] [--repeat N]
+"""
+import argparse
+import tempfile
+import timeit
+from pathlib import Path
+from unittest.mock import Mock
+
+from bench_activity_converter import generate_lines
+from speaking_eye.activity_reader import ActivityReader
+from speaking_eye.compression import Compression
+from speaking_eye.raw_data_compressor import RawDataCompressor
+from speaking_eye.raw_data_converter import RawDataConverter
+from speaking_eye.raw_data_format import RawDataFormat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--lines', type=int, default=100_000, help='number of generated activities')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as raw_data_dir:
+        tsv_file = Path(raw_data_dir) / '2021-07-04_speaking_eye_raw_data.tsv'
+        tsv_file.write_text(''.join(generate_lines(args.lines)))
+
+        bin_file = RawDataConverter(Mock()).convert(tsv_file, RawDataFormat.BINARY, keep_source=True)
+        raw_data_files = []
+
+        for compression in Compression:
+            for source_file in [tsv_file, bin_file]:
+                if compression == Compression.NONE:
+                    raw_data_files.append(source_file)
+                    continue
+
+                compressed_dir = Path(raw_data_dir) / compression.value
+                compressed_dir.mkdir(exist_ok=True)
+                copied_file = compressed_dir / source_file.name
+                copied_file.write_bytes(source_file.read_bytes())
+                raw_data_files.append(RawDataCompressor(Mock(), compression).compress(copied_file))
+
+        for raw_data_file in raw_data_files:
+            def read_all() -> None:
+                for _ in ActivityReader.iter_raw_data_file(raw_data_file):  # noqa: B023
+                    pass
+
+            best_seconds = min(timeit.repeat(read_all, number=1, repeat=args.repeat))
+            size = raw_data_file.stat().st_size
+
+            print(f'{raw_data_file.name.split(".", 1)[1]:>6}: {size:10} bytes ({size / args.lines:6.1f} per activity), '
+                  f'{args.lines / best_seconds:10.0f} activities/s')
+
+
+if __name__ == '__main__':
+    main()
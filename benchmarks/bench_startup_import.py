@@ -0,0 +1,78 @@
+"""
+Benchmark of speaking-eye startup: time of imports (by python -X importtime) that are done before the tray icon appears.
+Fails if heavy modules of the report stack are imported on startup, since they should be imported lazily
+in the report server thread.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_startup_import.py [--module NAME] [--repeat N] [--top N] [--max-ms MS]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# NOTE: report stack that is imported lazily in the report server thread
+LAZY_MODULES = ['dash', 'dash_core_components', 'dash_html_components', 'pandas', 'plotly', 'numpy']
+
+ImportTimesType = Dict[
+    str,  # module name
+    Tuple[
+        int,  # self time in microseconds
+        int,  # cumulative time in microseconds
+    ],
+]
+
+
+def measure_import_times(module: str) -> ImportTimesType:
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            stderr=subprocess.PIPE, universal_newlines=True, env=os.environ.copy())
+
+    if result.returncode != 0:
+        raise RuntimeError(f'Could not import [{module}]: [{result.stderr.splitlines()[-1:]}]')
+
+    import_times: ImportTimesType = {}
+
+    # NOTE: line format is 'import time:  self [us] | cumulative | imported package'
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+
+        self_us, cumulative_us, imported_module = line[len('import time:'):].split('|')
+        import_times[imported_module.strip()] = (int(self_us), int(cumulative_us))
+
+    return import_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--module', default='speaking_eye.__main__', help='module that is imported on startup')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    parser.add_argument('--top', type=int, default=10, help='number of the slowest imports to print')
+    parser.add_argument('--max-ms', type=float, default=0, help='fail if import takes longer (0 - no limit)')
+    args = parser.parse_args()
+
+    runs = [measure_import_times(args.module) for _ in range(args.repeat)]
+    best_run = min(runs, key=lambda import_times: import_times[args.module][1])
+    total_ms = best_run[args.module][1] / 1000
+
+    print(f'import {args.module}: {total_ms:.1f} ms ({len(best_run)} modules)')
+
+    slowest: List[Tuple[int, str]] = sorted(((self_us, name) for name, (self_us, _) in best_run.items()),
+                                            reverse=True)
+    for self_us, name in slowest[:args.top]:
+        print(f'{self_us / 1000:10.1f} ms  {name}')
+
+    errors = [f'[{name}] should be imported lazily' for name in LAZY_MODULES if name in best_run]
+
+    if args.max_ms and total_ms > args.max_ms:
+        errors.append(f'import time [{total_ms:.1f}] ms > [{args.max_ms}] ms')
+
+    for error in errors:
+        print(f'ERROR: {error}', file=sys.stderr)
+
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == '__main__':
+    main()
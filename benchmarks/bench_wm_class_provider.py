@@ -0,0 +1,72 @@
+"""
+Benchmark of WM_CLASS lookup on focus change: xprop subprocess vs Wnck vs WmClassProvider cache.
+Should be run in X session because windows of the current screen are used.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_wm_class_provider.py [--repeats N]
+"""
+import argparse
+import logging
+import time
+from typing import Callable, List
+
+import gi
+
+gi.require_version('Wnck', '3.0')
+gi.require_version('Gtk', '3.0')
+
+from gi.repository import Gtk, Wnck  # noqa: E402
+
+from speaking_eye.wm_class_provider import WmClassProvider  # noqa: E402
+from speaking_eye.x_helpers import get_wm_class  # noqa: E402
+
+
+def measure_ms(lookup: Callable[[Wnck.Window], str], windows: List[Wnck.Window], repeats: int) -> float:
+    started = time.perf_counter()
+
+    for _ in range(repeats):
+        for window in windows:
+            lookup(window)
+
+    return (time.perf_counter() - started) * 1000 / (repeats * len(windows))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+
+    screen = Wnck.Screen.get_default()
+    if screen is None:
+        raise SystemExit('X screen is not available')
+
+    screen.force_update()
+    while Gtk.events_pending():
+        Gtk.main_iteration()
+
+    windows = screen.get_windows()
+    if not windows:
+        raise SystemExit('There are no windows on the screen')
+
+    provider = WmClassProvider(logging.getLogger('bench'))
+
+    for window in windows:
+        xprop_wm_class = get_wm_class(window.get_xid())
+        provider_wm_class = provider.get(window)
+
+        if xprop_wm_class != provider_wm_class:
+            print(f'[{window.get_name()}]: xprop [{xprop_wm_class}] != Wnck [{provider_wm_class}]')
+
+    lookups = {
+        'xprop subprocess': lambda window: get_wm_class(window.get_xid()),
+        'Wnck': lambda window: window.get_class_group_name(),
+        'WmClassProvider': provider.get,
+    }
+
+    print(f'{len(windows)} windows, {args.repeats} repeats')
+    for name, lookup in lookups.items():
+        print(f'{name:>16}: {measure_ms(lookup, windows, args.repeats):8.4f} ms per focus change')
+
+
+if __name__ == '__main__':
+    main()
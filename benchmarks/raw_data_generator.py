@@ -0,0 +1,119 @@
+"""
+Deterministic generator of realistic files with raw data for benchmarks.
+The same seed & parameters always give the same activities, so results can be compared across commits.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/raw_data_generator.py OUTPUT_DIR [--days N] [--activities-per-day N] ...
+"""
+import argparse
+import random
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from bench_activity_writer import TmpFilesProvider
+from speaking_eye.activity import Activity
+from speaking_eye.activity_writer import ActivityWriter
+from speaking_eye.application_info import ApplicationInfo
+from speaking_eye.flush_mode import FlushMode
+
+APP_NAMES = ['Chromium', 'Code', 'Gnome-terminal', 'Slack', 'Telegram', 'Firefox', 'jetbrains-pycharm',
+             'Evince', 'Nautilus', 'Thunderbird', 'zoom', 'Spotify', 'libreoffice-writer', 'Gimp', 'Inkscape']
+
+# NOTE: the first activity of the day starts at the same time to get realistic working days
+WORKING_DAY_START = timedelta(hours=9)
+WORKING_DAY_DURATION = timedelta(hours=9)
+
+
+class RawDataGenerator:
+    """
+    Generate activities of several days like the tracker writes them:
+    windows of wm_classes with titles distributed by Zipf's law (few titles are opened most of the time),
+    ~20% of activities out of work time and the last activity of each day crossing midnight (if enabled),
+    so ActivityWriter splits it between two files with ActivitySplitter
+    """
+
+    def __init__(self,
+                 seed: int = 42,
+                 activities_per_day: int = 1000,
+                 wm_classes_count: int = 15,
+                 titles_per_wm_class: int = 50,
+                 midnight_crossing: bool = True) -> None:
+        self.seed = seed
+        self.activities_per_day = activities_per_day
+        self.wm_classes = [APP_NAMES[i % len(APP_NAMES)] + (f'-{i // len(APP_NAMES)}' if i >= len(APP_NAMES) else '')
+                           for i in range(wm_classes_count)]
+        self.titles_per_wm_class = titles_per_wm_class
+        self.midnight_crossing = midnight_crossing
+
+    def get_app_infos(self) -> Tuple[List[ApplicationInfo], List[ApplicationInfo]]:
+        """Return detailed & distracting app infos like in user config for the generated wm_classes"""
+        detailed_app_infos = [ApplicationInfo(wm_class, wm_class, '', False) for wm_class in self.wm_classes[2:]]
+        # NOTE: tabs of browser are matched by title like 'YouTube' or 'github'
+        detailed_app_infos.insert(0, ApplicationInfo('GitHub', self.wm_classes[0], 'Title [0-9]*1 ', False))
+        distracting_app_infos = [ApplicationInfo('Social', self.wm_classes[0], 'Title [0-9]*[05] |Title 3 ', True)]
+
+        return detailed_app_infos, distracting_app_infos
+
+    def iter_activities(self, start_date: date, days: int) -> Iterator[Activity]:
+        rand = random.Random(self.seed)
+        title_weights = [1 / (i + 1) for i in range(self.titles_per_wm_class)]
+        wm_class_weights = [1 / (i + 1) for i in range(len(self.wm_classes))]
+        mean_duration_us = WORKING_DAY_DURATION / timedelta(microseconds=1) / self.activities_per_day
+
+        for day in range(days):
+            start_time = datetime.combine(start_date + timedelta(days=day), datetime.min.time()) + WORKING_DAY_START
+
+            for i in range(self.activities_per_day):
+                wm_class, = rand.choices(self.wm_classes, wm_class_weights)
+                title_number, = rand.choices(range(self.titles_per_wm_class), title_weights)
+                duration = timedelta(microseconds=int(rand.expovariate(1 / mean_duration_us)))
+                is_last = i == self.activities_per_day - 1
+
+                if is_last and self.midnight_crossing:
+                    # NOTE: e.g. computer is left unlocked for the night
+                    next_midnight = datetime.combine(start_time.date() + timedelta(days=1), datetime.min.time())
+                    duration = max(duration, next_midnight - start_time + timedelta(minutes=rand.randint(1, 60)))
+
+                window_name = f'Title {title_number} - {wm_class}'
+                activity = Activity(wm_class, window_name, start_time, is_work_time=rand.random() < 0.8)
+
+                yield activity.set_end_time(start_time + duration)
+
+                start_time += duration
+
+    def write(self, raw_data_dir: Path, start_date: date, days: int) -> List[Path]:
+        """Write activities with ActivityWriter (so they are split by days) and return written files"""
+        files_provider = TmpFilesProvider(raw_data_dir)
+        writer = ActivityWriter(files_provider, FlushMode.BATCHED, flush_max_activities=1000)
+
+        for activity in self.iter_activities(start_date, days):
+            writer.write(activity)
+
+        writer.close()
+
+        return sorted(raw_data_dir.glob('*_speaking_eye_raw_data.tsv'))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('output_dir', type=Path, help='dir for generated files with raw data')
+    parser.add_argument('--start-date', type=date.fromisoformat, default=date(2020, 1, 1), help='YYYY-MM-DD')
+    parser.add_argument('--days', type=int, default=365 * 2, help='number of days')
+    parser.add_argument('--activities-per-day', type=int, default=1000, help='number of activities per day')
+    parser.add_argument('--wm-classes', type=int, default=15, help='number of distinct wm_classes')
+    parser.add_argument('--titles', type=int, default=50, help='number of distinct titles per wm_class')
+    parser.add_argument('--no-midnight-crossing', action='store_true', help='do not cross midnight by activities')
+    parser.add_argument('--seed', type=int, default=42, help='seed of random generator')
+    args = parser.parse_args()
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    generator = RawDataGenerator(args.seed, args.activities_per_day, args.wm_classes, args.titles,
+                                 not args.no_midnight_crossing)
+    raw_data_files = generator.write(args.output_dir, args.start_date, args.days)
+
+    print(f'{len(raw_data_files)} files are written to [{args.output_dir}]')
+
+
+if __name__ == '__main__':
+    main()
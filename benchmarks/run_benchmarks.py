@@ -0,0 +1,298 @@
+"""
+End-to-end benchmark suite on deterministic multi-year raw data (see raw_data_generator.py).
+Times ActivityWriter.write, ActivityReader parsing & reading, ApplicationInfoMatcher, ActivityStatHolder,
+ActivityStatArrays, DayStatLoader and DashReportServer report DataFrame and emits results as JSON,
+so regressions can be found by comparing results of two commits.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/run_benchmarks.py [--days N] [--output results.json] [--compare old.json]
+"""
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from bench_activity_writer import TmpFilesProvider
+from raw_data_generator import RawDataGenerator
+from speaking_eye.activity_day_cache import ActivityDayCache, DayColumnsBuilder
+from speaking_eye.activity_reader import ActivityReader
+from speaking_eye.activity_stat_holder import ActivityStatHolder
+from speaking_eye.activity_writer import ActivityWriter
+from speaking_eye.application_info_matcher import ApplicationInfoMatcher
+from speaking_eye.day_stat_loader import DayStatLoader
+from speaking_eye.day_stat_store import DayStatStore
+from speaking_eye.flush_mode import FlushMode
+from speaking_eye.pool_type import PoolType
+from speaking_eye.report_aggregation import ReportAggregation
+
+ResultType = Dict[str, Any]
+# NOTE: function runs the benchmark once and returns seconds of the measured part
+BenchmarkType = Callable[[], float]
+
+
+class BenchmarkSuite:
+    """Benchmarks over the same generated raw data files"""
+
+    def __init__(self, generator: RawDataGenerator, raw_data_dir: Path, start_date: date, days: int) -> None:
+        self.generator = generator
+        self.raw_data_dir = raw_data_dir
+        self.start_date = start_date
+        self.days = days
+        self.logger = logging.getLogger('run_benchmarks')
+        self.raw_data_files: List[Path] = []
+
+    def create_matcher(self) -> ApplicationInfoMatcher:
+        """Matcher with empty cache like in the report server just after start"""
+        detailed_app_infos, distracting_app_infos = self.generator.get_app_infos()
+
+        return ApplicationInfoMatcher(detailed_app_infos, distracting_app_infos)
+
+    def write(self) -> float:
+        for raw_data_file in self.raw_data_dir.iterdir():
+            raw_data_file.unlink()
+
+        writer = ActivityWriter(TmpFilesProvider(self.raw_data_dir), FlushMode.BATCHED, flush_max_activities=1000)
+        seconds = 0.0
+
+        # NOTE: activities are generated lazily to not to keep years of them in memory
+        for activity in self.generator.iter_activities(self.start_date, self.days):
+            started_at = time.perf_counter()
+            writer.write(activity)
+            seconds += time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        writer.close()
+        seconds += time.perf_counter() - started_at
+
+        self.raw_data_files = sorted(self.raw_data_dir.glob('*_speaking_eye_raw_data.tsv'))
+
+        return seconds
+
+    def parse(self) -> float:
+        started_at = time.perf_counter()
+
+        for raw_data_file in self.raw_data_files:
+            for _ in ActivityReader.iter_raw_data_file(raw_data_file):
+                pass
+
+        return time.perf_counter() - started_at
+
+    def read(self) -> float:
+        reader = ActivityReader(self.logger, self.create_matcher())
+        started_at = time.perf_counter()
+
+        for raw_data_file in self.raw_data_files:
+            reader.read(raw_data_file)
+
+        return time.perf_counter() - started_at
+
+    def match(self) -> float:
+        matcher = self.create_matcher()
+        seconds = 0.0
+
+        for raw_data_file in self.raw_data_files:
+            activities = list(ActivityReader.iter_raw_data_file(raw_data_file))
+            started_at = time.perf_counter()
+
+            for activity in activities:
+                matcher.set_if_matched(activity)
+
+            seconds += time.perf_counter() - started_at
+
+        return seconds
+
+    def aggregate_with_holder(self) -> float:
+        reader = ActivityReader(self.logger, self.create_matcher())
+        seconds = 0.0
+
+        for raw_data_file in self.raw_data_files:
+            activities = reader.read(raw_data_file)
+            started_at = time.perf_counter()
+            ActivityStatHolder(activities)
+            seconds += time.perf_counter() - started_at
+
+        return seconds
+
+    def aggregate_with_arrays(self) -> float:
+        from speaking_eye.activity_stat_arrays import ActivityStatArrays
+
+        matcher = self.create_matcher()
+        seconds = 0.0
+
+        for raw_data_file in self.raw_data_files:
+            columns_builder = DayColumnsBuilder()
+            for activity in ActivityReader.iter_raw_data_file(raw_data_file):
+                columns_builder.append(activity)
+            columns = columns_builder.build()
+
+            started_at = time.perf_counter()
+            ActivityStatArrays.from_columns(columns, matcher).to_holder()
+            seconds += time.perf_counter() - started_at
+
+        return seconds
+
+    def __load_report(self, aggregation: ReportAggregation) -> ActivityStatHolder:
+        """Load all days like DashReportServer does with caches & stored aggregates of the previous load"""
+        reader = ActivityReader(self.logger, self.create_matcher(), ActivityDayCache(self.logger))
+        loader = DayStatLoader(reader, 0, PoolType.PROCESS, DayStatStore(self.logger), aggregation)
+        holder = ActivityStatHolder([])
+
+        # NOTE: the last day is today that is never stored as aggregate
+        for day_holder in loader.load(self.raw_data_files, self.raw_data_files[-1]):
+            holder.merge(day_holder)
+
+        return holder
+
+    def __remove_derived_files(self) -> None:
+        for derived_file in self.raw_data_dir.glob('.*'):
+            derived_file.unlink()
+
+    def load_report_cold(self, aggregation: ReportAggregation) -> float:
+        self.__remove_derived_files()
+        started_at = time.perf_counter()
+        self.__load_report(aggregation)
+
+        return time.perf_counter() - started_at
+
+    def load_report_warm(self) -> float:
+        self.__load_report(ReportAggregation.VECTORIZED)
+        started_at = time.perf_counter()
+        self.__load_report(ReportAggregation.VECTORIZED)
+
+        return time.perf_counter() - started_at
+
+    def build_report_data_frame(self) -> float:
+        # NOTE: report server stack is optional for benchmarks
+        from speaking_eye.dash_report_server import DashReportServer
+        from speaking_eye.localizator import Localizator
+        from speaking_eye.language import Language
+
+        holder = self.__load_report(ReportAggregation.VECTORIZED)
+        matcher = self.create_matcher()
+        holder.initialize_stats(matcher.detailed_app_infos)
+        holder.initialize_stats(matcher.distracting_app_infos)
+
+        # NOTE: only the part of the server that builds report is needed, so Dash app is not created
+        server = DashReportServer.__new__(DashReportServer)
+        server.localizator = Localizator(Path(__file__).parent.parent / 'src' / 'speaking_eye' / 'i18n',
+                                         Language.ENGLISH)
+        get_report = getattr(server, '_DashReportServer__get_report')
+
+        started_at = time.perf_counter()
+        get_report(holder, len(self.raw_data_files))
+
+        return time.perf_counter() - started_at
+
+
+def run_benchmark(benchmark: BenchmarkType, repeat: int, items: int) -> ResultType:
+    try:
+        best_seconds = min(benchmark() for _ in range(repeat))
+    except ImportError as e:
+        return {'skipped': f'missing dependency: {e}'}
+
+    return {
+        'seconds': round(best_seconds, 6),
+        'items': items,
+        'items_per_second': round(items / best_seconds) if best_seconds else None,
+    }
+
+
+def get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True, check=True,
+                              cwd=str(Path(__file__).parent)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: ResultType, old_results: ResultType) -> None:
+    """Print how much slower (> 1) or faster (< 1) each benchmark became"""
+    for name, result in results['results'].items():
+        old_result = old_results.get('results', {}).get(name, {})
+
+        if 'seconds' not in result or 'seconds' not in old_result:
+            continue
+
+        ratio = result['seconds'] / old_result['seconds']
+        mark = ' <-- regression' if ratio > 1.1 else ''
+        print(f'{name:>40}: {old_result["seconds"]:10.4f} s -> {result["seconds"]:10.4f} s ({ratio:.2f}x){mark}',
+              file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--days', type=int, default=365 * 2, help='number of days with raw data')
+    parser.add_argument('--activities-per-day', type=int, default=1000, help='number of activities per day')
+    parser.add_argument('--wm-classes', type=int, default=15, help='number of distinct wm_classes')
+    parser.add_argument('--titles', type=int, default=50, help='number of distinct titles per wm_class')
+    parser.add_argument('--seed', type=int, default=42, help='seed of random generator')
+    parser.add_argument('--repeat', type=int, default=3, help='best of N runs')
+    parser.add_argument('--output', type=Path, help='write JSON results into file instead of stdout')
+    parser.add_argument('--compare', type=Path, help='JSON results of the previous run to compare with')
+    args = parser.parse_args()
+
+    generator = RawDataGenerator(args.seed, args.activities_per_day, args.wm_classes, args.titles)
+    start_date = date(2020, 1, 1)
+    # NOTE: the last activity crosses midnight, so there is one more file
+    activities = args.days * args.activities_per_day
+
+    with tempfile.TemporaryDirectory() as raw_data_dir:
+        suite = BenchmarkSuite(generator, Path(raw_data_dir), start_date, args.days)
+        files_count = args.days + 1
+        benchmarks: Dict[str, BenchmarkType] = {
+            'activity_writer.write': suite.write,
+            'activity_reader.parse': suite.parse,
+            'activity_reader.read': suite.read,
+            'application_info_matcher.set_if_matched': suite.match,
+            'activity_stat_holder': suite.aggregate_with_holder,
+            'activity_stat_arrays': suite.aggregate_with_arrays,
+            'day_stat_loader.holder.cold': lambda: suite.load_report_cold(ReportAggregation.HOLDER),
+            'day_stat_loader.vectorized.cold': lambda: suite.load_report_cold(ReportAggregation.VECTORIZED),
+            'day_stat_loader.warm': suite.load_report_warm,
+            'dash_report_server.get_report': suite.build_report_data_frame,
+        }
+        results: ResultType = {
+            'meta': {
+                'commit': get_commit(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'days': args.days,
+                'activities_per_day': args.activities_per_day,
+                'wm_classes': args.wm_classes,
+                'titles': args.titles,
+                'seed': args.seed,
+                'repeat': args.repeat,
+            },
+            'results': {},
+        }
+
+        for name, benchmark in benchmarks.items():
+            # NOTE: report builds DataFrame of titles, load & store benchmarks handle files
+            items = {
+                'dash_report_server.get_report': 1,
+                'day_stat_loader.warm': files_count,
+            }.get(name, activities)
+            results['results'][name] = run_benchmark(benchmark, args.repeat, items)
+            print(f'{name}: {results["results"][name]}', file=sys.stderr)
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output + '\n')
+
+    if args.compare is not None:
+        compare(results, json.loads(args.compare.read_text()))
+
+
+if __name__ == '__main__':
+    main()
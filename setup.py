@@ -5,6 +5,7 @@ from setuptools import setup
 requires = (
     'coloredlogs>=14.0',
     'dash>=1.19.0',
+    'numpy>=1.18.3',
     'pandas>=1.0.3',
     'parse>=1.19.0',
     'plotly>=4.14.3',
@@ -45,7 +46,7 @@ setup(
     long_description=get_long_description(),
     long_description_content_type='text/markdown',
     url='https://github.com/alena-bartosh/speaking-eye',
-    python_requires='>=3.6, <4',
+    python_requires='>=3.7, <4',
     install_requires=requires,
     package_dir={'': 'src'},
     packages=['speaking_eye'],
@@ -7,19 +7,21 @@ import tempfile
 import threading
 from pathlib import Path
 from shutil import copy
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 import coloredlogs
 import gi
 import yaml
 
+from .activity_day_cache import ActivityDayCache
 from .activity_reader import ActivityReader
 from .application_info import ApplicationInfo
 from .application_info_matcher import ApplicationInfoMatcher
 from .application_info_reader import ApplicationInfoReader
 from .config_reader import ConfigReader
-from .dash_report_server import DashReportServer
 from .files_provider import FilesProvider
+from .instrumentation import instrumentation
+from .live_day_stat import LiveDayStat
 from .localizator import Localizator
 from .special_application_info_title import SpecialApplicationInfoTitle
 from .special_wm_class import SpecialWmClass
@@ -43,14 +45,27 @@ def dash_report_server_main(logger: logging.Logger,
                             config_reader: ConfigReader,
                             activity_reader: ActivityReader,
                             files_provider: FilesProvider,
-                            localizator: Localizator) -> None:
+                            localizator: Localizator,
+                            live_day_stat: LiveDayStat,
+                            shutdown_handlers: List[Callable[[], None]]) -> None:
     try:
-        server = DashReportServer(logger, config_reader, activity_reader, files_provider, localizator)
+        # NOTE: dash, pandas & plotly are imported in the report server thread
+        #       to not to delay the appearance of the tray icon
+        from .dash_report_server import DashReportServer
+
+        server = DashReportServer(logger, config_reader, activity_reader, files_provider, localizator, live_day_stat)
+        # NOTE: server thread is a daemon that is not stopped, so its workers are stopped after the tracker
+        shutdown_handlers.append(server.shutdown)
         server.run()
     except Exception:
         logger.exception('Could not start Report Server!')
 
 
+def run_shutdown_handlers(shutdown_handlers: List[Callable[[], None]]) -> None:
+    for shutdown_handler in shutdown_handlers:
+        shutdown_handler()
+
+
 def make_autostartable_if_needed(config_reader: ConfigReader,
                                  files_provider: FilesProvider,
                                  logger: logging.Logger) -> None:
@@ -79,6 +94,8 @@ def main() -> None:
     parser.add_argument('--log-level', type=str, choices=['debug', 'info', 'warning', 'error'],
                         default='debug', metavar='', help='debug/info/warning/error')
     parser.add_argument('-c', '--config', type=str, default=default_config_path, metavar='', help='config path')
+    parser.add_argument('--instrumentation', type=str, choices=['off', 'on'], default='off', metavar='',
+                        help='off/on: collect timings of stages (dump with SIGUSR1 or /stats of report server)')
     args = parser.parse_args()
 
     log_level_map = {
@@ -89,6 +106,7 @@ def main() -> None:
     }
 
     coloredlogs.install(log_level_map[args.log_level])
+    instrumentation.enabled = args.instrumentation == 'on'
     logger = logging.getLogger(APP_ID)
 
     # TODO: Support Wayland (new display server protocol)
@@ -135,6 +153,7 @@ def main() -> None:
     config_reader = ConfigReader(application_info_reader, config)
 
     make_autostartable_if_needed(config_reader, files_provider, logger)
+    files_provider.raw_data_format = config_reader.get_raw_data_format()
 
     detailed_app_infos: Optional[List[ApplicationInfo]] = None
     distracting_app_infos: Optional[List[ApplicationInfo]] = None
@@ -157,13 +176,18 @@ def main() -> None:
                                                is_distracting=False)
     detailed_app_infos.append(break_time_activity_info)
 
-    application_info_matcher = ApplicationInfoMatcher(detailed_app_infos, distracting_app_infos)
-    activity_reader = ActivityReader(logger, application_info_matcher)
+    application_info_matcher = ApplicationInfoMatcher(detailed_app_infos, distracting_app_infos,
+                                                      config_reader.get_matcher_cache_size())
+    activity_reader = ActivityReader(logger, application_info_matcher, ActivityDayCache(logger))
 
     language = config_reader.get_language()
     localizator = Localizator(files_provider.i18n_dir, language)
     logger.debug(f'Set user language to [{language.value}]')
 
+    # NOTE: tracker & report server are run in the same process, so today's stats are shared in memory
+    live_day_stat = LiveDayStat()
+    shutdown_handlers: List[Callable[[], None]] = []
+
     dash_server_thread = threading.Thread(target=dash_report_server_main,
                                           kwargs={
                                               'config_reader': config_reader,
@@ -171,6 +195,8 @@ def main() -> None:
                                               'activity_reader': activity_reader,
                                               'files_provider': files_provider,
                                               'localizator': localizator,
+                                              'live_day_stat': live_day_stat,
+                                              'shutdown_handlers': shutdown_handlers,
                                           },
                                           daemon=True)
     dash_server_thread.start()
@@ -181,10 +207,13 @@ def main() -> None:
                          application_info_matcher=application_info_matcher,
                          activity_reader=activity_reader,
                          files_provider=files_provider,
-                         localizator=localizator)
+                         localizator=localizator,
+                         live_day_stat=live_day_stat)
     app.run()
     app.start_main_loop()
 
+    run_shutdown_handlers(shutdown_handlers)
+
 
 if __name__ == '__main__':
     main()
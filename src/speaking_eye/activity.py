@@ -13,8 +13,13 @@ class Activity:
 
     Activity is a more specific concept then ApplicationInfo,
     so two or more activities with different wm_class or window_name
-    can have the same ApplicationInfo
+    can have the same ApplicationInfo.
+
+    Millions of activities can be loaded for reports, so __slots__ are used to not to keep __dict__ per object
     """
+    __slots__ = ('wm_class', 'window_name', 'start_time', 'end_time', 'activity_time', 'is_work_time',
+                 'application_info')
+
     def __init__(self, wm_class: str, window_name: str, start_time: datetime, is_work_time: bool) -> None:
         self.wm_class = wm_class
         self.window_name = window_name
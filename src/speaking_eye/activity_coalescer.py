@@ -0,0 +1,51 @@
+import re
+from datetime import datetime, timedelta
+
+from .activity import Activity
+from .activity_stat_holder import ActivityStatHolder
+
+
+class ActivityCoalescer:
+    """
+    Decide whether bursts of window name changes should be merged instead of becoming separate activities.
+    Only activities with the same wm_class, work state and matched ApplicationInfo title are merged,
+    so total time of each app and of each title in report is kept (ApplicationInfo should be already matched)
+
+    - continuation: window names are equal after removing parts matched by title_normalization_re
+                    (e.g. unread counters or progress percentages), previous activity just goes on
+    - too short:    previous activity lasted less than min_activity_ms, its time is given to the next activity
+    """
+
+    def __init__(self, min_activity_ms: int, title_normalization_re: str) -> None:
+        if min_activity_ms < 0:
+            raise ValueError(f'min_activity_ms [{min_activity_ms}] should not be negative!')
+
+        self.min_activity_time = timedelta(milliseconds=min_activity_ms)
+        self.__title_normalization_re = re.compile(title_normalization_re) if title_normalization_re else None
+
+    def normalize_title(self, window_name: str) -> str:
+        if self.__title_normalization_re is None:
+            return window_name
+
+        return self.__title_normalization_re.sub('', window_name)
+
+    @staticmethod
+    def __is_same_app(previous_activity: Activity, next_activity: Activity) -> bool:
+        return previous_activity.wm_class == next_activity.wm_class \
+            and previous_activity.is_work_time == next_activity.is_work_time \
+            and ActivityStatHolder.get_title(previous_activity) == ActivityStatHolder.get_title(next_activity)
+
+    def is_continuation(self, previous_activity: Activity, next_activity: Activity) -> bool:
+        if not self.__is_same_app(previous_activity, next_activity):
+            return False
+
+        if previous_activity.window_name == next_activity.window_name:
+            return True
+
+        return self.normalize_title(previous_activity.window_name) == self.normalize_title(next_activity.window_name)
+
+    def is_too_short(self, previous_activity: Activity, next_activity: Activity, now: datetime) -> bool:
+        if not self.__is_same_app(previous_activity, next_activity):
+            return False
+
+        return now - previous_activity.start_time < self.min_activity_time
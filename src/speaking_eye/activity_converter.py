@@ -1,3 +1,5 @@
+import sys
+
 from .activity import Activity
 from .bool_parser import BoolParser
 from .datetime_formatter import DatetimeFormatter
@@ -30,10 +32,13 @@ class ActivityConverter:
 
         try:
             start_time_str, end_time_str, activity_time, wm_class, window_name, is_work_time_str = columns
-            start_time = DatetimeFormatter.parse_string_with_optional_milliseconds(start_time_str)
-            end_time = DatetimeFormatter.parse_string_with_optional_milliseconds(end_time_str)
+            start_time = DatetimeFormatter.parse_str_datetime(start_time_str)
+            end_time = DatetimeFormatter.parse_str_datetime(end_time_str)
             is_work_time = BoolParser.parse(is_work_time_str.replace('\n', ''))
         except Exception as e:
             raise ValueError(f'Incorrect string [{value}]! {e}')
 
-        return Activity(wm_class, window_name, start_time, is_work_time).set_end_time(end_time)
+        # NOTE: the same windows appear thousands of times per day,
+        #       so interned strings are shared by all activities read from files
+        return Activity(sys.intern(wm_class), sys.intern(window_name), start_time, is_work_time)\
+            .set_end_time(end_time)
@@ -0,0 +1,220 @@
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+from .activity import Activity
+from .activity_helper import ActivityHelper
+from .datetime_helper import DatetimeHelper
+
+# NOTE: array when columns are built in memory and memoryview when they are loaded from cache file
+ColumnType = Union['array[int]', memoryview]
+
+
+class DayColumns:
+    """
+    Columnar representation of all activities from one file with raw data.
+    Columns loaded from cache are views into the memory-mapped cache file, so they are not copied on loading
+    """
+
+    def __init__(self,
+                 start_times: ColumnType,
+                 end_times: ColumnType,
+                 wm_class_ids: ColumnType,
+                 window_name_ids: ColumnType,
+                 is_work_time_flags: ColumnType,
+                 strings: List[str]) -> None:
+        self.start_times = start_times  # microseconds since epoch
+        self.end_times = end_times  # microseconds since epoch
+        self.wm_class_ids = wm_class_ids  # indexes in strings
+        self.window_name_ids = window_name_ids  # indexes in strings
+        self.is_work_time_flags = is_work_time_flags  # 1 or 0
+        self.strings = strings
+
+    def __len__(self) -> int:
+        return len(self.start_times)
+
+    def iter_activities(self) -> Iterator[Activity]:
+        from_epoch_microseconds = DatetimeHelper.from_epoch_microseconds
+        strings = self.strings
+
+        for start_time, end_time, wm_class_id, window_name_id, is_work_time in zip(
+                self.start_times, self.end_times, self.wm_class_ids, self.window_name_ids, self.is_work_time_flags):
+            yield Activity(strings[wm_class_id],
+                           strings[window_name_id],
+                           from_epoch_microseconds(start_time),
+                           bool(is_work_time)).set_end_time(from_epoch_microseconds(end_time))
+
+    def to_activities(self) -> List[Activity]:
+        return list(self.iter_activities())
+
+
+class DayColumnsBuilder:
+    """Build DayColumns by appending activities one by one (e.g. while they are being read from file)"""
+
+    def __init__(self) -> None:
+        self.__start_times = array('q')
+        self.__end_times = array('q')
+        self.__wm_class_ids = array('I')
+        self.__window_name_ids = array('I')
+        self.__is_work_time_flags = array('B')
+        self.__string_ids: Dict[str, int] = {}
+
+    def __get_string_id(self, value: str) -> int:
+        string_id = self.__string_ids.get(value)
+
+        if string_id is None:
+            string_id = self.__string_ids[value] = len(self.__string_ids)
+
+        return string_id
+
+    def append(self, activity: Activity) -> 'DayColumnsBuilder':
+        self.__start_times.append(DatetimeHelper.to_epoch_microseconds(activity.start_time))
+        self.__end_times.append(DatetimeHelper.to_epoch_microseconds(ActivityHelper.get_end_time(activity)))
+        self.__wm_class_ids.append(self.__get_string_id(activity.wm_class))
+        self.__window_name_ids.append(self.__get_string_id(activity.window_name))
+        self.__is_work_time_flags.append(activity.is_work_time)
+
+        return self
+
+    def build(self) -> DayColumns:
+        return DayColumns(self.__start_times, self.__end_times, self.__wm_class_ids, self.__window_name_ids,
+                          self.__is_work_time_flags, list(self.__string_ids))
+
+
+class ActivityDayCache:
+    """
+    Persistent per-day columnar cache of files with raw data.
+    Cache file is stored next to the raw data file and is invalidated by its mtime & size.
+
+    Cache file layout (native byte order):
+        header
+        start_times        int64[count]
+        end_times          int64[count]
+        wm_class_ids       uint32[count]
+        window_name_ids    uint32[count]
+        string_offsets     uint32[strings_count + 1]
+        is_work_time_flags uint8[count]
+        strings_blob       utf-8 bytes
+    """
+
+    MAGIC = b'SEDC'
+    VERSION = 1
+    # magic, version, byte order mark, source mtime_ns, source size, count, strings_count, strings_blob_size
+    __HEADER = struct.Struct('=4sHHqqQQQ')
+    __BYTE_ORDER_MARK = 0xFEFF
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+
+    @staticmethod
+    def get_cache_file_path(raw_data_file: Path) -> Path:
+        # NOTE: hidden file to not to clutter data dir that user can open from tray menu
+        return raw_data_file.with_name(f'.{raw_data_file.name}.cache')
+
+    def load_columns(self, raw_data_file: Path) -> Optional[DayColumns]:
+        """Return columns from cache if cache exists and it is up to date. Return None otherwise"""
+        cache_file = self.get_cache_file_path(raw_data_file)
+
+        try:
+            source_stat = raw_data_file.stat()
+
+            with open(str(cache_file), 'rb') as file:
+                if os.fstat(file.fileno()).st_size < self.__HEADER.size:
+                    return None
+
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError:
+            return None
+
+        try:
+            return self.__parse(mapped, source_stat)
+        except (ValueError, TypeError, IndexError, struct.error) as e:
+            self.logger.warning(f'Cache [{cache_file}] is broken and will be rebuilt: [{e}]')
+
+            return None
+
+    def __parse(self, mapped: mmap.mmap, source_stat: os.stat_result) -> Optional[DayColumns]:
+        magic, version, byte_order_mark, mtime_ns, size, count, strings_count, strings_blob_size = \
+            self.__HEADER.unpack_from(mapped, 0)
+
+        if magic != self.MAGIC or version != self.VERSION or byte_order_mark != self.__BYTE_ORDER_MARK:
+            return None
+
+        if mtime_ns != source_stat.st_mtime_ns or size != source_stat.st_size:
+            return None
+
+        view = memoryview(mapped)
+        offset = self.__HEADER.size
+
+        def take(item_size: int, items_count: int) -> memoryview:
+            nonlocal offset
+            end = offset + item_size * items_count
+
+            if end > len(view):
+                raise ValueError(f'Unexpected end of cache at [{end}] > [{len(view)}]')
+
+            column = view[offset:end]
+            offset = end
+
+            return column
+
+        start_times = take(8, count).cast('q')
+        end_times = take(8, count).cast('q')
+        wm_class_ids = take(4, count).cast('I')
+        window_name_ids = take(4, count).cast('I')
+        string_offsets = take(4, strings_count + 1).cast('I')
+        is_work_time_flags = take(1, count)
+        strings_blob = bytes(take(1, strings_blob_size))
+
+        strings = [
+            sys.intern(strings_blob[string_offsets[i]:string_offsets[i + 1]].decode('utf-8'))
+            for i in range(strings_count)
+        ]
+
+        return DayColumns(start_times, end_times, wm_class_ids, window_name_ids, is_work_time_flags, strings)
+
+    def load(self, raw_data_file: Path) -> Optional[List[Activity]]:
+        columns = self.load_columns(raw_data_file)
+
+        return None if columns is None else columns.to_activities()
+
+    def dump(self, raw_data_file: Path, columns: DayColumns, source_stat: os.stat_result) -> None:
+        """
+        Write columns that were read from raw_data_file into the cache file.
+        source_stat should be taken before reading to not to mark the cache as up to date
+        if something was appended to raw_data_file during reading
+        """
+        encoded_strings = [value.encode('utf-8') for value in columns.strings]
+        string_offsets = array('I', [0])
+        for encoded_string in encoded_strings:
+            string_offsets.append(string_offsets[-1] + len(encoded_string))
+        strings_blob = b''.join(encoded_strings)
+
+        header = self.__HEADER.pack(self.MAGIC, self.VERSION, self.__BYTE_ORDER_MARK,
+                                    source_stat.st_mtime_ns, source_stat.st_size,
+                                    len(columns), len(encoded_strings), len(strings_blob))
+
+        cache_file = self.get_cache_file_path(raw_data_file)
+        # NOTE: write into temporary file and rename it to not to leave the broken cache
+        #       if report server and tracker try to write the same cache concurrently
+        tmp_cache_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+
+        try:
+            with open(str(tmp_cache_file), 'wb') as file:
+                file.write(header)
+
+                for column in [columns.start_times, columns.end_times, columns.wm_class_ids,
+                               columns.window_name_ids, string_offsets, columns.is_work_time_flags]:
+                    file.write(column.tobytes())
+
+                file.write(strings_blob)
+
+            os.replace(str(tmp_cache_file), str(cache_file))
+        except OSError as e:
+            self.logger.warning(f'Could not write cache [{cache_file}]: [{e}]')
@@ -1,32 +1,121 @@
 import logging
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
 
 from .activity import Activity
 from .activity_converter import ActivityConverter
+from .activity_day_cache import ActivityDayCache, DayColumns, DayColumnsBuilder
 from .application_info_matcher import ApplicationInfoMatcher
+from .binary_activity_log import BinaryActivityDecoder
+from .compression import Compression
+from .instrumentation import instrumentation
+from .raw_data_format import RawDataFormat
 
 
 class ActivityReader:
-    """Read line by line activities from file with raw data"""
+    """
+    Read line by line activities from file with raw data (or record by record for RawDataFormat.BINARY).
+    Compressed files of closed days are read transparently.
+    If day_cache is set, then activities are loaded from the columnar cache
+    while the file with raw data is not changed
+    """
 
-    def __init__(self, logger: logging.Logger, matcher: ApplicationInfoMatcher) -> None:
+    def __init__(self, logger: logging.Logger, matcher: ApplicationInfoMatcher,
+                 day_cache: Optional[ActivityDayCache] = None) -> None:
         self.logger = logger
         self.matcher = matcher
+        self.day_cache = day_cache
 
-    def read(self, raw_data_file: Path) -> List[Activity]:
-        activities: List[Activity] = []
+    @staticmethod
+    def iter_raw_data_file(raw_data_file: Path) -> Iterator[Activity]:
+        """Read activities as they are written in the file (without cache and ApplicationInfo matching)"""
+        compression = Compression.from_path(raw_data_file)
+
+        if RawDataFormat.from_path(raw_data_file) == RawDataFormat.BINARY:
+            with compression.open(raw_data_file, 'rb') as binary_file:
+                data = binary_file.read()
+
+            yield from BinaryActivityDecoder().iter_decode(data)
+
+            return
+
+        with compression.open(raw_data_file, 'rt') as file:
+            for line in file:
+                yield ActivityConverter.from_string(line)
+
+    def __iter_activities(self, raw_data_file: Path) -> Iterator[Activity]:
+        if self.day_cache is None:
+            yield from self.iter_raw_data_file(raw_data_file)
+
+            return
 
+        columns = self.day_cache.load_columns(raw_data_file)
+
+        if columns is not None:
+            instrumentation.count('activity_reader.day_cache_hits')
+            yield from columns.iter_activities()
+
+            return
+
+        instrumentation.count('activity_reader.day_cache_misses')
+        source_stat = raw_data_file.stat()
+        columns_builder = DayColumnsBuilder()
+
+        for activity in self.iter_raw_data_file(raw_data_file):
+            columns_builder.append(activity)
+
+            yield activity
+
+        self.day_cache.dump(raw_data_file, columns_builder.build(), source_stat)
+
+    @instrumentation.timed('activity_reader.read_columns')
+    def read_columns(self, raw_data_file: Path) -> DayColumns:
+        """Read all activities of the file as DayColumns (without ApplicationInfo matching)"""
         if not raw_data_file.exists():
             self.logger.debug(f'File with raw data [{raw_data_file}] does not exist for this day')
 
-            return activities
+            return DayColumnsBuilder().build()
 
-        with open(str(raw_data_file)) as file:
-            for line in file:
-                activity = ActivityConverter.from_string(line)
-                self.matcher.set_if_matched(activity)
+        if self.day_cache is not None:
+            columns = self.day_cache.load_columns(raw_data_file)
 
-                activities.append(activity)
+            if columns is not None:
+                instrumentation.count('activity_reader.day_cache_hits')
 
-        return activities
+                return columns
+
+            instrumentation.count('activity_reader.day_cache_misses')
+
+        source_stat = raw_data_file.stat()
+        columns_builder = DayColumnsBuilder()
+
+        with instrumentation.measure('activity_reader.parse_file'):
+            for activity in self.iter_raw_data_file(raw_data_file):
+                columns_builder.append(activity)
+
+        columns = columns_builder.build()
+
+        if self.day_cache is not None:
+            self.day_cache.dump(raw_data_file, columns, source_stat)
+
+        return columns
+
+    def iter_read(self, raw_data_file: Path) -> Iterator[Activity]:
+        """Lazily read activities one by one to not to keep all of them in memory"""
+        if not raw_data_file.exists():
+            self.logger.debug(f'File with raw data [{raw_data_file}] does not exist for this day')
+
+            return
+
+        activities_count = 0
+
+        for activity in self.__iter_activities(raw_data_file):
+            self.matcher.set_if_matched(activity)
+            activities_count += 1
+
+            yield activity
+
+        instrumentation.count('activity_reader.activities', activities_count)
+
+    def read(self, raw_data_file: Path) -> List[Activity]:
+        return list(self.iter_read(raw_data_file))
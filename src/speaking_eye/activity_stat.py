@@ -6,6 +6,7 @@ from .activity_helper import ActivityHelper
 
 class ActivityStat:
     """Store and update the amount of time spent in a certain activity"""
+    __slots__ = ('work_time', 'off_time')
 
     def __init__(self, work_time: timedelta = timedelta(),
                  off_time: timedelta = timedelta()) -> None:
@@ -41,6 +42,11 @@ class ActivityStat:
         else:
             self.off_time += ActivityHelper.get_activity_time(activity)
 
+    def merge(self, other: 'ActivityStat') -> None:
+        """Add time from other stat (e.g. for the same title from another day)"""
+        self.work_time += other.work_time
+        self.off_time += other.off_time
+
     def __eq__(self, other: object) -> bool:
         """
         Overrides the default implementation
@@ -0,0 +1,97 @@
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .activity_day_cache import DayColumns
+from .activity_stat import ActivityStat
+from .activity_stat_holder import ActivityStatHolder
+from .application_info_matcher import ApplicationInfoMatcher
+from .instrumentation import instrumentation
+from .special_application_info_title import SpecialApplicationInfoTitle
+
+
+class ActivityStatArrays:
+    """
+    Vectorized alternative of ActivityStatHolder.
+    Activities of the day are loaded from DayColumns into typed arrays
+    (int64 durations in microseconds, title codes, bool work flags) and work/off time of each title
+    is summed with group by title code, so there is no Python loop over activities.
+    Titles are matched only once per unique (wm_class, window_name) pair of the day
+    """
+
+    def __init__(self, titles: List[str], work_us: 'np.ndarray', off_us: 'np.ndarray',
+                 has_work_activities: bool) -> None:
+        self.titles = titles  # in order of the first appearance like keys of ActivityStatHolder
+        self.work_us = work_us  # int64[len(titles)]
+        self.off_us = off_us  # int64[len(titles)]
+        self.has_work_activities = has_work_activities
+
+    @staticmethod
+    def __match_title_codes(columns: DayColumns,
+                            matcher: ApplicationInfoMatcher) -> Tuple['np.ndarray', List[str]]:
+        """Return title code of each activity (index in titles) and titles"""
+        strings = columns.strings
+        wm_class_ids = np.asarray(columns.wm_class_ids, dtype=np.int64)
+        window_name_ids = np.asarray(columns.window_name_ids, dtype=np.int64)
+
+        pairs = wm_class_ids * max(len(strings), 1) + window_name_ids
+        unique_pairs, pair_indexes = np.unique(pairs, return_inverse=True)
+
+        title_codes_by_title: Dict[str, int] = {}
+        pair_title_codes = np.empty(len(unique_pairs), dtype=np.int64)
+
+        for i, pair in enumerate(unique_pairs.tolist()):
+            wm_class_id, window_name_id = divmod(pair, max(len(strings), 1))
+            application_info = matcher.find(strings[wm_class_id], strings[window_name_id])
+            title = application_info.title if application_info is not None \
+                else SpecialApplicationInfoTitle.OTHERS.value
+            pair_title_codes[i] = title_codes_by_title.setdefault(title, len(title_codes_by_title))
+
+        return pair_title_codes[pair_indexes.reshape(-1)], list(title_codes_by_title)
+
+    @staticmethod
+    def from_columns(columns: DayColumns, matcher: ApplicationInfoMatcher) -> 'ActivityStatArrays':
+        if len(columns) == 0:
+            return ActivityStatArrays([], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), False)
+
+        durations = np.asarray(columns.end_times, dtype=np.int64) - np.asarray(columns.start_times, dtype=np.int64)
+        is_work_time_flags = np.asarray(columns.is_work_time_flags, dtype=np.uint8).astype(bool)
+        with instrumentation.measure('activity_stat_arrays.match_titles'):
+            title_codes, titles = ActivityStatArrays.__match_title_codes(columns, matcher)
+
+        # NOTE: titles are ordered by the first appearance of their activity like keys of ActivityStatHolder
+        _, first_indexes = np.unique(title_codes, return_index=True)
+        order = np.argsort(first_indexes, kind='stable')
+        codes_by_order = np.empty(len(titles), dtype=np.int64)
+        codes_by_order[order] = np.arange(len(titles))
+        title_codes = codes_by_order[title_codes]
+        titles = [titles[i] for i in order.tolist()]
+
+        # NOTE: sums are exact since bincount accumulates in float64 and day has less than 2 ** 53 microseconds
+        work_us = np.bincount(title_codes[is_work_time_flags], weights=durations[is_work_time_flags],
+                              minlength=len(titles)).astype(np.int64)
+        off_us = np.bincount(title_codes[~is_work_time_flags], weights=durations[~is_work_time_flags],
+                             minlength=len(titles)).astype(np.int64)
+
+        return ActivityStatArrays(titles, work_us, off_us, bool(is_work_time_flags.any()))
+
+    @property
+    def total_work_us(self) -> int:
+        return int(self.work_us.sum())
+
+    @property
+    def total_off_us(self) -> int:
+        return int(self.off_us.sum())
+
+    def to_holder(self) -> ActivityStatHolder:
+        """Return ActivityStatHolder that is equal to the holder built from the same activities one by one"""
+        holder = ActivityStatHolder([])
+        holder.total_work_time = timedelta(microseconds=self.total_work_us)
+        holder.total_off_time = timedelta(microseconds=self.total_off_us)
+        holder.has_work_activities = self.has_work_activities
+
+        for title, work_us, off_us in zip(self.titles, self.work_us.tolist(), self.off_us.tolist()):
+            holder[title] = ActivityStat(timedelta(microseconds=work_us), timedelta(microseconds=off_us))
+
+        return holder
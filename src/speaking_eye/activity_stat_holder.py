@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import List, ItemsView, cast
+from typing import Iterable, List, ItemsView, cast
 
 from .activity import Activity
 from .activity_helper import ActivityHelper
@@ -13,16 +13,20 @@ ActivityStatHolderItemsType = ItemsView[KeyType, ItemType]
 
 
 class ActivityStatHolder(dict):  # type: ignore[type-arg]
-    """Store ActivityStat objects and compute total time spent in all activities"""
+    """
+    Store ActivityStat objects and compute total time spent in all activities.
+    Activities are consumed one by one, so holder can be built from a lazy iterator
+    (e.g. ActivityReader.iter_read()) without keeping all activities in memory
+    """
 
-    def __init__(self, activities: List[Activity]) -> None:
+    def __init__(self, activities: Iterable[Activity]) -> None:
         super().__init__()
 
         self.total_work_time = timedelta()
         self.total_off_time = timedelta()
+        self.has_work_activities = False
 
-        for activity in activities:
-            self.update_stat(activity)
+        self.update_stats(activities)
 
     def initialize_stats(self, application_infos: List[ApplicationInfo]) -> None:
         """
@@ -36,14 +40,24 @@ class ActivityStatHolder(dict):  # type: ignore[type-arg]
 
             self[application_info.title] = ActivityStat()
 
+    def update_stats(self, activities: Iterable[Activity]) -> None:
+        for activity in activities:
+            self.update_stat(activity)
+
+    @staticmethod
+    def get_title(activity: Activity) -> KeyType:
+        """Title of ActivityStat that activity time is added to"""
+        return activity.application_info.title if activity.application_info is not None \
+            else SpecialApplicationInfoTitle.OTHERS.value
+
     def update_stat(self, activity: Activity) -> None:
         if activity.is_work_time:
             self.total_work_time += ActivityHelper.get_activity_time(activity)
+            self.has_work_activities = True
         else:
             self.total_off_time += ActivityHelper.get_activity_time(activity)
 
-        title_from_config = activity.application_info.title if activity.application_info is not None \
-            else SpecialApplicationInfoTitle.OTHERS.value
+        title_from_config = self.get_title(activity)
 
         if title_from_config not in self:
             self[title_from_config] = ActivityStat.from_activity(activity)
@@ -53,6 +67,52 @@ class ActivityStatHolder(dict):  # type: ignore[type-arg]
         activity_stat = self[title_from_config]
         activity_stat.update(activity)
 
+    def copy_with_stat(self, activity: Activity) -> 'ActivityStatHolder':
+        """
+        Return new holder with activity stat added, this holder is not changed.
+        Only the stat of activity title is copied, other stats are shared with this holder
+        (so neither of holders should be changed in place after that)
+        """
+        result = ActivityStatHolder([])
+        result.update(self)
+        result.total_work_time = self.total_work_time
+        result.total_off_time = self.total_off_time
+        result.has_work_activities = self.has_work_activities
+
+        title = self.get_title(activity)
+
+        if title in self:
+            stat = self[title]
+            result[title] = ActivityStat(stat.work_time, stat.off_time)
+
+        result.update_stat(activity)
+
+        return result
+
+    def merge(self, other: 'ActivityStatHolder') -> None:
+        """Add all stats from other holder (e.g. holder for another day)"""
+        self.total_work_time += other.total_work_time
+        self.total_off_time += other.total_off_time
+        self.has_work_activities = self.has_work_activities or other.has_work_activities
+
+        for title, other_stat in other.items():
+            if title not in self:
+                self[title] = ActivityStat()
+
+            self[title].merge(other_stat)
+
+    def __add__(self, other: 'ActivityStatHolder') -> 'ActivityStatHolder':
+        result = ActivityStatHolder([])
+        result.merge(self)
+        result.merge(other)
+
+        return result
+
+    def __iadd__(self, other: 'ActivityStatHolder') -> 'ActivityStatHolder':
+        self.merge(other)
+
+        return self
+
     def get_group_work_time(self, titles: List[str]) -> timedelta:
         """Compute total work time for the specific group of ActivityStat titles"""
         result = timedelta()
@@ -1,5 +1,6 @@
+from datetime import date
 from pathlib import Path
-from typing import cast, Optional, TextIO
+from typing import Any, IO, List, Optional
 
 from pyee import BaseEventEmitter
 
@@ -7,51 +8,134 @@ from .activity import Activity
 from .activity_converter import ActivityConverter
 from .activity_helper import ActivityHelper
 from .activity_splitter import ActivitySplitter
+from .binary_activity_log import BinaryActivityEncoder
+from .compression import Compression
 from .files_provider import FilesProvider
+from .flush_mode import FlushMode
+from .instrumentation import instrumentation
+from .raw_data_compressor import RawDataCompressor
+from .raw_data_format import RawDataFormat
 
 
 class ActivityWriter:
     """
-    Open file that contains date in its name and write activity at string format to this file.
-    If the activity lasted for several days, then it will be written in several files
+    Open file that contains date in its name and write activity at string format to this file
+    (or in BinaryActivityLog format if the file is in RawDataFormat.BINARY).
+    If the activity lasted for several days, then it will be written in several files.
+    NEW_DAY_EVENT is emitted with the path of the closed file when the next day file is opened.
+
+    In FlushMode.BATCHED activities are kept in memory and written with one flush
+    after flush_max_activities activities or when flush() is called (e.g. by timer or on app stop).
+    PENDING_EVENT is emitted when the first activity is kept in memory and FLUSH_EVENT when pending activities
+    are written, so flush timer is started only if there is something to write
     """
 
     FILE_MODE = 'a'
+    BINARY_FILE_MODE = 'ab'
     NEW_DAY_EVENT = 'new-day-event'
+    PENDING_EVENT = 'pending-event'
+    FLUSH_EVENT = 'flush-event'
+
+    def __init__(self, files_provider: FilesProvider,
+                 flush_mode: FlushMode = FlushMode.ALWAYS,
+                 flush_max_activities: int = 1) -> None:
+        if flush_max_activities < 1:
+            raise ValueError(f'flush_max_activities [{flush_max_activities}] should be positive!')
 
-    def __init__(self, files_provider: FilesProvider) -> None:
         self.__files_provider = files_provider
-        self.__current_file: Optional[TextIO] = None
+        self.__current_file: Optional[IO[Any]] = None
         self.__current_file_path: Optional[Path] = None
+        self.__current_day: Optional[date] = None
+        self.__binary_encoder: Optional[BinaryActivityEncoder] = None
+        self.__pending_lines: List[str] = []
+        self.__pending_bytes = bytearray()
+        self.__pending_count = 0
+        self.flush_mode = flush_mode
+        self.flush_max_activities = flush_max_activities if flush_mode == FlushMode.BATCHED else 1
         self.event = BaseEventEmitter()
 
-    def __open_file(self, file: Path) -> None:
+    def __open_file(self, day: date) -> None:
+        file = self.__files_provider.get_raw_data_file_path(day)
+
+        if Compression.from_path(file) != Compression.NONE:
+            # NOTE: file of the closed day is compressed, but it can be continued
+            #       (e.g. if system time was changed), so it is decompressed back
+            file = RawDataCompressor.decompress(file)
+
+        self.__current_day = day
         self.__current_file_path = file
-        # cast open() result to TextIO to fix mypy warnings
-        self.__current_file = cast(TextIO, open(str(file), self.FILE_MODE))
 
-    def __write_and_flush(self, activity: Activity) -> None:
+        if RawDataFormat.from_path(file) == RawDataFormat.BINARY:
+            self.__binary_encoder = BinaryActivityEncoder.for_appending(file)
+            self.__current_file = open(str(file), self.BINARY_FILE_MODE)
+        else:
+            self.__binary_encoder = None
+            self.__current_file = open(str(file), self.FILE_MODE)
+
+        self.__files_provider.raw_data_catalog.add(day, file)
+
+    def __write(self, activity: Activity) -> None:
         if self.__current_file is None:
             raise Exception('current_file should be opened!')
 
-        self.__current_file.write(ActivityConverter.to_string(activity))
+        if self.__binary_encoder is None:
+            self.__pending_lines.append(ActivityConverter.to_string(activity))
+        else:
+            self.__pending_bytes += self.__binary_encoder.encode(activity)
+
+        self.__pending_count += 1
+
+        if self.__pending_count >= self.flush_max_activities:
+            self.flush()
+        elif self.__pending_count == 1:
+            self.event.emit(ActivityWriter.PENDING_EVENT)
+
+    @instrumentation.timed('activity_writer.flush')
+    def flush(self) -> None:
+        """Write all pending activities to the current file"""
+        if self.__current_file is None or self.__pending_count == 0:
+            return
+
+        # NOTE: join lines to write all of them with one syscall
+        if self.__binary_encoder is None:
+            self.__current_file.write(''.join(self.__pending_lines))
+        else:
+            self.__current_file.write(self.__pending_bytes)
+
         self.__current_file.flush()
+        self.__pending_lines.clear()
+        self.__pending_bytes.clear()
+        self.__pending_count = 0
+
+        self.event.emit(ActivityWriter.FLUSH_EVENT)
 
+    def close(self) -> None:
+        """Flush pending activities and close the current file"""
+        if self.__current_file is None:
+            return
+
+        self.flush()
+        self.__current_file.close()
+        self.__current_file = None
+        self.__current_file_path = None
+        self.__current_day = None
+        self.__binary_encoder = None
+
+    @instrumentation.timed('activity_writer.write')
     def write(self, original_activity: Activity) -> None:
         ActivityHelper.raise_if_not_finished(original_activity)
 
         activities_with_days = ActivitySplitter.split_by_day(original_activity)
 
         for (day, activity) in activities_with_days:
-            file = self.__files_provider.get_raw_data_file_path(day)
-
-            if self.__current_file_path == file:
-                self.__write_and_flush(activity)
+            if self.__current_day == day:
+                self.__write(activity)
                 continue
 
             if self.__current_file is not None:  # current day != day of opening
-                self.__current_file.close()
-                self.event.emit(ActivityWriter.NEW_DAY_EVENT)
+                closed_file_path = self.__current_file_path
+                self.close()
+                self.event.emit(ActivityWriter.NEW_DAY_EVENT, closed_file_path)
 
-            self.__open_file(file)
-            self.__write_and_flush(activity)
+            self.__open_file(day)
+            self.__write(activity)
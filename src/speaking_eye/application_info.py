@@ -9,6 +9,7 @@ class ApplicationInfo:
     because it operates with re expressions.
     They can be matched with each other using ApplicationInfoMatcher
     """
+    __slots__ = ('title', 'wm_name_re', 'tab_re', 'is_distracting')
 
     def __init__(self, title: str, wm_name_re: str, tab_re: str, is_distracting: bool) -> None:
         self.title = title
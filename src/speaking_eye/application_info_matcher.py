@@ -1,36 +1,226 @@
-from re import search
-from typing import List, Optional
+import hashlib
+import re
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
 
 from .activity import Activity
 from .application_info import ApplicationInfo
+from .lru_cache import CacheInfo, LruCache
 
+SearchType = Callable[[str], bool]
+PrioritizedAppInfosType = List[Tuple[
+    int,  # priority (the lower the higher)
+    ApplicationInfo,
+]]
 
-class ApplicationInfoMatcher:
+# characters that can have special meaning in a regular expression except '|'
+REGEX_SPECIAL_CHARS = frozenset('.^$*+?{}[]()\\')
+
+
+def compile_search(pattern: str) -> SearchType:
     """
-    Match ApplicationInfo with Activity
-    to distinguish between different types of activities/infos (e.g. 'detailed/distracting')
+    Compile pattern into a function with the same result as bool(re.search(pattern, value)).
+    Literal patterns like 'Chromium|Firefox' are checked as substrings without regex engine
     """
+    if not pattern:
+        # search('', whatever) always return SRE_Match object
+        return lambda value: True
 
-    def __init__(self, detailed_app_infos: List[ApplicationInfo], distracting_app_infos: List[ApplicationInfo]) -> None:
-        self.detailed_app_infos = detailed_app_infos
-        self.distracting_app_infos = distracting_app_infos
+    if not REGEX_SPECIAL_CHARS.intersection(pattern):
+        literals = tuple(pattern.split('|'))
 
-    def __try_find_app_info_in(self, app_infos: List[ApplicationInfo], activity: Activity) -> Optional[ApplicationInfo]:
-        """Using Activity wm_class and window_name try to find corresponding ApplicationInfo"""
+        if '' in literals:
+            return lambda value: True
+
+        if len(literals) == 1:
+            literal, = literals
+
+            return lambda value: literal in value
+
+        return lambda value: any(literal in value for literal in literals)
+
+    compiled = re.compile(pattern)
+
+    return lambda value: compiled.search(value) is not None
+
+
+def compile_first_match_pattern(patterns: List[str]) -> Optional[Pattern[str]]:
+    """
+    Combine patterns into one alternation of lookaheads where i-th alternative is marked by group 'p{i}'.
+    Alternatives are tried in order at the start of the string, so the marked group of a match
+    is the first pattern in the list that can be found anywhere in the string.
+    Return None if patterns cannot be combined safely (e.g. they have own groups or inline flags)
+    """
+    default_flags = re.compile('').flags
+
+    try:
+        for pattern in patterns:
+            compiled = re.compile(pattern)
+
+            # NOTE: own groups shift numbers of back references in combined pattern
+            #       and global inline flags like (?i) would be applied to all patterns
+            if compiled.groups > 0 or compiled.flags != default_flags:
+                return None
+
+        alternatives = [f'(?=(?s:.*?)(?:{pattern}))(?P<p{i}>)' for i, pattern in enumerate(patterns)]
+
+        return re.compile('|'.join(alternatives))
+    except re.error:
+        return None
+
+
+class TabMatcher:
+    """Find the first ApplicationInfo (in the given order) whose tab_re can be found in window_name"""
+
+    def __init__(self, app_infos: List[ApplicationInfo], tab_searches: Dict[str, SearchType]) -> None:
+        self.app_infos: List[ApplicationInfo] = []
 
         for app_info in app_infos:
-            # tab can be empty str, it means that we are considering all tabs
-            # search('', whatever) always return SRE_Match object
-            if search(app_info.wm_name_re, activity.wm_class) and search(app_info.tab_re, activity.window_name):
+            self.app_infos.append(app_info)
+
+            if not app_info.tab_re:
+                # NOTE: empty tab matches any window_name, so next infos will be never reached
+                break
+
+        self.__searches = [tab_searches[app_info.tab_re] for app_info in self.app_infos]
+        self.__combined = compile_first_match_pattern([app_info.tab_re for app_info in self.app_infos]) \
+            if len(self.app_infos) > 1 else None
+
+    def find(self, window_name: str) -> Optional[ApplicationInfo]:
+        if self.__combined is not None:
+            match = self.__combined.match(window_name)
+
+            if match is None or match.lastgroup is None:
+                return None
+
+            return self.app_infos[int(match.lastgroup[1:])]
+
+        for search, app_info in zip(self.__searches, self.app_infos):
+            if search(window_name):
                 return app_info
 
         return None
 
+
+class ApplicationInfoMatcher:
+    """
+    Match ApplicationInfo with Activity
+    to distinguish between different types of activities/infos (e.g. 'detailed/distracting').
+
+    All patterns are compiled once. ApplicationInfos are grouped by wm_name_re
+    and the list of infos that can match each wm_class is computed only once per wm_class,
+    so for each activity only tab patterns of these infos are checked (with a single combined regex).
+
+    Results (including "not matched") are cached by (wm_class, window_name)
+    because the same windows appear thousands of times per day
+    """
+
+    DEFAULT_CACHE_SIZE = 10000
+    # NOTE: the number of distinct wm_class values is small, limit is just a guard
+    WM_CLASS_CACHE_MAX_SIZE = 1024
+
+    def __init__(self,
+                 detailed_app_infos: List[ApplicationInfo],
+                 distracting_app_infos: List[ApplicationInfo],
+                 cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self.__detailed_app_infos = detailed_app_infos
+        self.__distracting_app_infos = distracting_app_infos
+        self.__cache: LruCache[Tuple[str, str], Optional[ApplicationInfo]] = LruCache(cache_size)
+
+        self.__compile()
+
+    def __compile(self) -> None:
+        # NOTE: distracting infos have priority over detailed ones
+        app_infos = self.__distracting_app_infos + self.__detailed_app_infos
+
+        self.__wm_name_groups = self.__group_by_wm_name(app_infos)
+        self.__tab_searches = {app_info.tab_re: compile_search(app_info.tab_re) for app_info in app_infos}
+        self.__tab_matchers: Dict[str, TabMatcher] = {}
+        self.__fingerprint = self.__get_fingerprint(app_infos)
+
+        self.__cache.clear()
+
+    @staticmethod
+    def __get_fingerprint(app_infos: List[ApplicationInfo]) -> str:
+        fields = [(app_info.title, app_info.wm_name_re, app_info.tab_re, app_info.is_distracting)
+                  for app_info in app_infos]
+
+        return hashlib.sha1(repr(fields).encode('utf-8')).hexdigest()
+
+    @property
+    def fingerprint(self) -> str:
+        """Changes when detailed/distracting lists change, so it can be used to invalidate persistent results"""
+        return self.__fingerprint
+
+    @property
+    def detailed_app_infos(self) -> List[ApplicationInfo]:
+        return self.__detailed_app_infos
+
+    @detailed_app_infos.setter
+    def detailed_app_infos(self, value: List[ApplicationInfo]) -> None:
+        self.__detailed_app_infos = value
+        self.__compile()
+
+    @property
+    def distracting_app_infos(self) -> List[ApplicationInfo]:
+        return self.__distracting_app_infos
+
+    @distracting_app_infos.setter
+    def distracting_app_infos(self, value: List[ApplicationInfo]) -> None:
+        self.__distracting_app_infos = value
+        self.__compile()
+
+    def cache_info(self) -> CacheInfo:
+        """Hits/misses of (wm_class, window_name) cache to choose its size"""
+        return self.__cache.info()
+
+    @staticmethod
+    def __group_by_wm_name(app_infos: List[ApplicationInfo]) -> List[Tuple[SearchType, PrioritizedAppInfosType]]:
+        """Group infos with the same wm_name_re (and keep their priority) to check each wm_name_re only once"""
+        groups: Dict[str, PrioritizedAppInfosType] = {}
+
+        for priority, app_info in enumerate(app_infos):
+            groups.setdefault(app_info.wm_name_re, []).append((priority, app_info))
+
+        return [(compile_search(wm_name_re), group) for wm_name_re, group in groups.items()]
+
+    def __get_tab_matcher(self, wm_class: str) -> TabMatcher:
+        tab_matcher = self.__tab_matchers.get(wm_class)
+
+        if tab_matcher is not None:
+            return tab_matcher
+
+        candidates = [
+            priority_with_app_info
+            for search, group in self.__wm_name_groups if search(wm_class)
+            for priority_with_app_info in group
+        ]
+        candidates.sort(key=lambda priority_with_app_info: priority_with_app_info[0])
+
+        tab_matcher = TabMatcher([app_info for _, app_info in candidates], self.__tab_searches)
+
+        if len(self.__tab_matchers) >= self.WM_CLASS_CACHE_MAX_SIZE:
+            self.__tab_matchers.clear()
+
+        self.__tab_matchers[wm_class] = tab_matcher
+
+        return tab_matcher
+
+    def find(self, wm_class: str, window_name: str) -> Optional[ApplicationInfo]:
+        """Using Activity wm_class and window_name try to find corresponding ApplicationInfo"""
+        key = (wm_class, window_name)
+        is_cached, application_info = self.__cache.lookup(key)
+
+        if is_cached:
+            return application_info
+
+        application_info = self.__get_tab_matcher(wm_class).find(window_name)
+        self.__cache.put(key, application_info)
+
+        return application_info
+
     def set_if_matched(self, activity: Activity) -> None:
         """Set ApplicationInfo to Activity if matched"""
-
-        application_info = self.__try_find_app_info_in(
-            self.distracting_app_infos, activity) or self.__try_find_app_info_in(self.detailed_app_infos, activity)
+        application_info = self.find(activity.wm_class, activity.window_name)
 
         if application_info is None:
             return
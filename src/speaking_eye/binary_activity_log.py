@@ -0,0 +1,239 @@
+import os
+import sys
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .activity import Activity
+from .activity_helper import ActivityHelper
+from .datetime_helper import DatetimeHelper
+
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    """Write non-negative int with 7 bits per byte, the high bit means that more bytes follow"""
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    buffer.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Return value and offset after it. Raise IndexError if data ends before the value"""
+    byte = data[offset]
+
+    if byte < 0x80:
+        # NOTE: fast path for the most of ids and time deltas
+        return byte, offset + 1
+
+    result = 0
+    shift = 0
+
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+
+        if byte < 0x80:
+            return result, offset
+
+        shift += 7
+
+
+def zigzag_encode(value: int) -> int:
+    """Map signed int to non-negative one to keep small negative values short: 0, -1, 1, -2 -> 0, 1, 2, 3"""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def zigzag_decode(value: int) -> int:
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+class BinaryActivityLog:
+    """
+    Compact append-only format of files with raw data. It is lossless comparing with TSV format.
+
+    File layout:
+        header: MAGIC, VERSION (1 byte)
+        records one by one, the first byte of record is its tag:
+            STRING_TAG, length (varint), utf-8 bytes
+                - add wm_class or window_name to the file dictionary, its id is the number of previous strings
+            ACTIVITY_TAG | is_work_time bit,
+            wm_class id (varint), window_name id (varint),
+            start_time (zigzag varint) - microseconds since end_time of the previous activity (or since EPOCH),
+            activity_time (varint) - microseconds
+
+    Records are only appended, so a file with a not fully written last record can be read
+    (the last record is skipped) and continued from the end of the last complete record
+    """
+
+    MAGIC = b'SEAL'
+    VERSION = 1
+    HEADER = MAGIC + bytes([VERSION])
+
+    STRING_TAG = 0x01
+    ACTIVITY_TAG = 0x02
+    IS_WORK_TIME_BIT = 0x01
+
+
+class BinaryActivityDecoder:
+    """Decode activities from the content of the file in BinaryActivityLog format"""
+
+    def __init__(self) -> None:
+        self.strings: List[str] = []
+        self.last_end_time_us = 0
+        self.offset = 0  # end of the last complete record
+
+    @staticmethod
+    def __get_first_record_offset(data: bytes) -> Optional[int]:
+        """Check header at the start of the file and return offset after it or None if header is not written yet"""
+        header = BinaryActivityLog.HEADER
+
+        if len(data) < len(header):
+            if not header.startswith(data):
+                raise ValueError(f'Unexpected header [{data!r}]')
+
+            return None
+
+        if not data.startswith(header):
+            raise ValueError(f'Unexpected header [{data[:len(header)]!r}] != [{header!r}]')
+
+        return len(header)
+
+    def iter_decode(self, data: bytes, data_offset: int = 0) -> Iterator[Activity]:
+        """
+        Decode records from data that is the content of the file starting at data_offset.
+        Decoding can be continued with data that was appended after self.offset (e.g. while the file is written)
+        """
+        if data_offset != self.offset:
+            raise ValueError(f'data_offset [{data_offset}] should be equal to offset [{self.offset}]!')
+
+        offset = self.__get_first_record_offset(data) if data_offset == 0 else 0
+
+        if offset is None:
+            return
+
+        # NOTE: the loop is hot, so everything is in local variables
+        string_tag = BinaryActivityLog.STRING_TAG
+        activity_tag = BinaryActivityLog.ACTIVITY_TAG
+        is_work_time_bit = BinaryActivityLog.IS_WORK_TIME_BIT
+        strings = self.strings
+        last_end_time_us = self.last_end_time_us
+        last_end_time = DatetimeHelper.from_epoch_microseconds(last_end_time_us)
+        data_size = len(data)
+
+        while offset < data_size:
+            tag = data[offset]
+
+            try:
+                if tag == string_tag:
+                    string_size, string_offset = read_varint(data, offset + 1)
+                    next_offset = string_offset + string_size
+
+                    if next_offset > data_size:
+                        break
+
+                    strings.append(sys.intern(data[string_offset:next_offset].decode('utf-8')))
+                    offset = next_offset
+
+                    continue
+
+                if tag & ~is_work_time_bit != activity_tag:
+                    raise ValueError(f'Unknown tag [{tag}] at [{offset}]')
+
+                wm_class_id, next_offset = read_varint(data, offset + 1)
+                window_name_id, next_offset = read_varint(data, next_offset)
+                start_time_delta, next_offset = read_varint(data, next_offset)
+                activity_time_us, next_offset = read_varint(data, next_offset)
+            except IndexError:
+                # NOTE: the last record has not been written fully
+                break
+
+            if start_time_delta == 0:
+                # NOTE: activities usually follow each other without gaps
+                start_time = last_end_time
+            else:
+                start_time = last_end_time + timedelta(microseconds=zigzag_decode(start_time_delta))
+
+            activity_time = timedelta(microseconds=activity_time_us)
+            last_end_time = start_time + activity_time
+            last_end_time_us += zigzag_decode(start_time_delta) + activity_time_us
+
+            activity = Activity(strings[wm_class_id], strings[window_name_id], start_time, bool(tag & is_work_time_bit))
+            # NOTE: activity_time is unsigned, so checks of set_end_time() are not needed
+            activity.end_time = last_end_time
+            activity.activity_time = activity_time
+
+            yield activity
+
+            self.last_end_time_us = last_end_time_us
+            offset = next_offset
+            self.offset = data_offset + offset
+
+        self.offset = data_offset + offset
+
+
+class BinaryActivityEncoder:
+    """Encode activities to BinaryActivityLog format, the state is continued from the existing file content"""
+
+    def __init__(self, decoder: Optional[BinaryActivityDecoder] = None) -> None:
+        self.__string_ids: Dict[str, int] = {}
+        self.__last_end_time_us = 0
+        self.__has_header = False
+
+        if decoder is not None:
+            self.__string_ids = {value: string_id for string_id, value in enumerate(decoder.strings)}
+            self.__last_end_time_us = decoder.last_end_time_us
+            self.__has_header = decoder.offset > 0
+
+    @staticmethod
+    def for_appending(raw_data_file: Path) -> 'BinaryActivityEncoder':
+        """Read the state of existing file and cut its not fully written last record to append new records"""
+        if not raw_data_file.exists():
+            return BinaryActivityEncoder()
+
+        data = raw_data_file.read_bytes()
+        decoder = BinaryActivityDecoder()
+
+        for _ in decoder.iter_decode(data):
+            pass
+
+        if decoder.offset < len(data):
+            os.truncate(str(raw_data_file), decoder.offset)
+
+        return BinaryActivityEncoder(decoder)
+
+    def __write_string_id(self, buffer: bytearray, value: str) -> None:
+        string_id = self.__string_ids.get(value)
+
+        if string_id is None:
+            string_id = self.__string_ids[value] = len(self.__string_ids)
+            encoded = value.encode('utf-8')
+
+            buffer.append(BinaryActivityLog.STRING_TAG)
+            write_varint(buffer, len(encoded))
+            buffer += encoded
+
+    def encode(self, activity: Activity) -> bytes:
+        buffer = bytearray()
+
+        if not self.__has_header:
+            buffer += BinaryActivityLog.HEADER
+            self.__has_header = True
+
+        # NOTE: strings records should be written before the activity record that uses them
+        self.__write_string_id(buffer, activity.wm_class)
+        self.__write_string_id(buffer, activity.window_name)
+
+        start_time_us = DatetimeHelper.to_epoch_microseconds(activity.start_time)
+        end_time_us = DatetimeHelper.to_epoch_microseconds(ActivityHelper.get_end_time(activity))
+
+        buffer.append(BinaryActivityLog.ACTIVITY_TAG | (BinaryActivityLog.IS_WORK_TIME_BIT * activity.is_work_time))
+        write_varint(buffer, self.__string_ids[activity.wm_class])
+        write_varint(buffer, self.__string_ids[activity.window_name])
+        write_varint(buffer, zigzag_encode(start_time_us - self.__last_end_time_us))
+        write_varint(buffer, end_time_us - start_time_us)
+
+        self.__last_end_time_us = end_time_us
+
+        return bytes(buffer)
@@ -0,0 +1,35 @@
+import gzip
+import lzma
+from pathlib import Path
+from typing import Any, cast, IO
+
+from .extended_enum import ExtendedEnum
+
+
+class Compression(ExtendedEnum):
+    """Compression of closed files with raw data, value is the file suffix"""
+    NONE = 'none'
+    GZIP = 'gz'
+    XZ = 'xz'
+
+    @staticmethod
+    def from_path(path: Path) -> 'Compression':
+        return Compression.parse(path.suffix[1:], Compression.NONE)
+
+    @staticmethod
+    def strip(path: Path) -> Path:
+        """Path without compression suffix"""
+        return path if Compression.from_path(path) == Compression.NONE else path.with_suffix('')
+
+    @property
+    def suffix(self) -> str:
+        return '' if self == Compression.NONE else f'.{self.value}'
+
+    def open(self, path: Path, mode: str) -> IO[Any]:
+        if self == Compression.GZIP:
+            return cast(IO[Any], gzip.open(str(path), mode))
+
+        if self == Compression.XZ:
+            return cast(IO[Any], lzma.open(str(path), mode))
+
+        return open(str(path), mode)
@@ -5,7 +5,12 @@ from pydash import get
 
 from .application_info import ApplicationInfo
 from .application_info_reader import ApplicationInfoReader
+from .compression import Compression
 from .language import Language
+from .flush_mode import FlushMode
+from .pool_type import PoolType
+from .raw_data_format import RawDataFormat
+from .report_aggregation import ReportAggregation
 from .theme import Theme
 from .typed_value import TypedValue
 
@@ -53,6 +58,30 @@ class ConfigReader:
     def get_distracting_apps_mins(self) -> int:
         return TypedValue.get(self.config, 'time_limits.distracting_apps_mins', int, 15)
 
+    def get_matcher_cache_size(self) -> int:
+        return TypedValue.get(self.config, 'matcher.cache_size', int, 10000)
+
+    def get_raw_data_format(self) -> RawDataFormat:
+        return RawDataFormat.parse(get(self.config, 'raw_data.format'), RawDataFormat.TSV)
+
+    def get_raw_data_compression(self) -> Compression:
+        return Compression.parse(get(self.config, 'raw_data.compression'), Compression.GZIP)
+
+    def get_raw_data_flush_mode(self) -> FlushMode:
+        return FlushMode.parse(get(self.config, 'raw_data.flush_mode'), FlushMode.BATCHED)
+
+    def get_raw_data_flush_max_activities(self) -> int:
+        return TypedValue.get(self.config, 'raw_data.flush_max_activities', int, 100)
+
+    def get_raw_data_flush_interval_ms(self) -> int:
+        return TypedValue.get(self.config, 'raw_data.flush_interval_ms', int, 30 * 1000)
+
+    def get_raw_data_min_activity_ms(self) -> int:
+        return TypedValue.get(self.config, 'raw_data.min_activity_ms', int, 1000)
+
+    def get_raw_data_title_normalization_re(self) -> str:
+        return TypedValue.get(self.config, 'raw_data.title_normalization_re', str, '')
+
     def get_report_server_host(self) -> str:
         return TypedValue.get(self.config, 'report_server.host', str, 'localhost')
 
@@ -65,6 +94,24 @@ class ConfigReader:
     def get_report_server_ignore_weekends(self) -> bool:
         return TypedValue.get(self.config, 'report_server.ignore_weekends', bool, True)
 
+    def get_report_server_workers(self) -> int:
+        return TypedValue.get(self.config, 'report_server.workers', int, 0)
+
+    def get_report_server_pool_type(self) -> PoolType:
+        return PoolType.parse(get(self.config, 'report_server.pool_type'), PoolType.PROCESS)
+
+    def get_report_server_aggregation(self) -> ReportAggregation:
+        return ReportAggregation.parse(get(self.config, 'report_server.aggregation'), ReportAggregation.VECTORIZED)
+
+    def get_report_server_cache_size(self) -> int:
+        return TypedValue.get(self.config, 'report_server.cache_size', int, 32)
+
+    def get_report_server_cache_ttl_ms(self) -> int:
+        return TypedValue.get(self.config, 'report_server.cache_ttl_ms', int, 30000)
+
+    def get_report_server_live_interval_ms(self) -> int:
+        return TypedValue.get(self.config, 'report_server.live_interval_ms', int, 10000)
+
     def get_language(self) -> Language:
         return Language.parse(get(self.config, 'language'), Language.ENGLISH)
 
@@ -2,24 +2,29 @@ import logging
 import re
 from datetime import date, datetime, timedelta
 from enum import Enum
+from itertools import chain
 from random import choice
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 import dash_core_components as dcc
 import dash_html_components as html
 import pandas as pd
 import plotly.express as px
-from dash import Dash
-from dash.dependencies import Input, Output
-from pydash import some
+from dash import Dash, no_update
+from dash.dependencies import Input, Output, State
 
 from .activity_reader import ActivityReader
 from .activity_stat_holder import ActivityStatHolder
 from .config_reader import ConfigReader
 from .datetime_formatter import DatetimeFormatter
-from .datetime_helper import DatetimeHelper
+from .day_stat_loader import DayStatLoader
+from .day_stat_store import DayStatStore
+from .day_stat_tail_reader import DayStatTailReader
 from .files_provider import FilesProvider
+from .instrumentation import instrumentation
+from .live_day_stat import LiveDayStat
 from .localizator import Localizator
+from .lru_cache import CacheInfo, LruCache
 from .special_application_info_title import SpecialApplicationInfoTitle
 
 COLORS_SEQUENTIALS = [
@@ -33,6 +38,8 @@ COLORS_SEQUENTIALS = [
 class ElementId(Enum):
     DATE_PICKER = 'date-picker'
     REPORT_OUTPUT = 'report-output'
+    LIVE_INTERVAL = 'live-interval'
+    REPORT_VERSION = 'report-version'
 
 
 GetActivityStatHolderResultType = Tuple[
@@ -40,6 +47,14 @@ GetActivityStatHolderResultType = Tuple[
     int,  # active_days_count
 ]
 
+ReportCacheKeyType = Tuple[
+    date,  # start_date
+    date,  # end_date
+    bool,  # ignore_weekends
+    str,  # config fingerprint
+    str,  # version of data: today's stats or signature of all files for past days
+]
+
 
 class DashReportServer:
 
@@ -54,7 +69,8 @@ class DashReportServer:
                  app_config_reader: ConfigReader,
                  activity_reader: ActivityReader,
                  files_provider: FilesProvider,
-                 localizator: Localizator) -> None:
+                 localizator: Localizator,
+                 live_day_stat: Optional[LiveDayStat] = None) -> None:
         self.app = Dash(__name__, assets_folder='./assets')
 
         logging.getLogger('werkzeug').setLevel(logging.WARNING)
@@ -74,38 +90,58 @@ class DashReportServer:
 
         self.activity_reader = activity_reader
         self.files_provider = files_provider
+        self.day_stat_loader = DayStatLoader(activity_reader,
+                                             app_config_reader.get_report_server_workers(),
+                                             app_config_reader.get_report_server_pool_type(),
+                                             DayStatStore(logger),
+                                             app_config_reader.get_report_server_aggregation())
+        # NOTE: today's file is only appended by the tracker, so only new activities are parsed on refresh
+        self.today_stat_reader = DayStatTailReader(activity_reader)
+        # NOTE: stats that the tracker keeps in memory (if it is run in the same process) are used instead of the file
+        self.live_day_stat = live_day_stat
+        self.live_interval_ms = app_config_reader.get_report_server_live_interval_ms()
+
+        # NOTE: rendered reports are cached since users switch between the same ranges (today/week/month)
+        self.report_cache: LruCache[ReportCacheKeyType, html.Div] = \
+            LruCache(app_config_reader.get_report_server_cache_size())
+        self.report_cache_ttl = app_config_reader.get_report_server_cache_ttl_ms() / 1000
 
         self.colors = choice(COLORS_SEQUENTIALS)
 
         self.app.layout = self.__get_layout()
 
-    def __get_activity_stat_holder(self, report_dates: List[date]) -> GetActivityStatHolderResultType:
-        """Get ActivityStatHolder with all collected activities for specific dates"""
-        active_days_count = 0
-        all_activities = []
-        for report_date in report_dates:
-            is_weekend = report_date.weekday() > 4
+    def __get_activity_stat_holder(self, start_date: date, end_date: date) -> GetActivityStatHolderResultType:
+        """
+        Get ActivityStatHolder with all collected activities between start_date and end_date (inclusive).
+        Only per-day holders are kept in memory (they can be loaded in parallel by DayStatLoader),
+        so memory usage does not depend on the length of the date range
+        """
+        raw_data_catalog = self.files_provider.raw_data_catalog
+        # NOTE: days without files with raw data are skipped without touching the file system
+        report_dates = raw_data_catalog.get_dates(start_date, end_date)
 
-            if self.ignore_weekends and is_weekend:
-                continue
+        if self.ignore_weekends:
+            report_dates = [report_date for report_date in report_dates if report_date.weekday() <= 4]
 
-            file_path = self.files_provider.get_raw_data_file_path(report_date)
-            activities = self.activity_reader.read(file_path)
+        today = date.today()
+        # NOTE: past days are summed from small stored aggregates, today's file is followed by DayStatTailReader
+        raw_data_files = [self.files_provider.get_raw_data_file_path(report_date)
+                          for report_date in report_dates if report_date != today]
+        day_holders: Iterable[ActivityStatHolder] = self.day_stat_loader.load(raw_data_files)
 
-            no_activities_for_date = len(activities) == 0
+        if today in report_dates:
+            day_holders = chain(day_holders, [self.__get_today_stat_holder(today)])
 
-            if no_activities_for_date:
-                continue
-
-            no_work_activities_for_date = not some(activities, lambda activity: activity.is_work_time)
+        active_days_count = 0
+        holder = ActivityStatHolder([])
 
-            if no_work_activities_for_date:
+        for day_holder in day_holders:
+            if not day_holder.has_work_activities:
                 continue
 
             active_days_count += 1
-            all_activities.extend(activities)
+            holder.merge(day_holder)
 
-        holder = ActivityStatHolder(all_activities)
         matcher = self.activity_reader.matcher
 
         holder.initialize_stats(matcher.detailed_app_infos)
@@ -113,6 +149,76 @@ class DashReportServer:
 
         return holder, active_days_count
 
+    def __get_today_stat_holder(self, today: date) -> ActivityStatHolder:
+        live_snapshot = None if self.live_day_stat is None else self.live_day_stat.get(today)
+
+        if live_snapshot is not None:
+            # NOTE: snapshot is shared with the tracker thread, it is only merged into holder of the report
+            _, holder = live_snapshot
+
+            return holder
+
+        return self.today_stat_reader.read(self.files_provider.get_raw_data_file_path(today))
+
+    def __get_today_version(self, today: date) -> str:
+        """Cheap version of today's stats that is changed when new activities are collected"""
+        live_version = None if self.live_day_stat is None else self.live_day_stat.get_version(today)
+
+        if live_version is not None:
+            return f'live:{live_version}'
+
+        # NOTE: today's file is only appended, so its size is changed with each written activity
+        raw_data_file = self.files_provider.get_raw_data_file_path(today)
+
+        try:
+            return f'size:{raw_data_file.stat().st_size}'
+        except FileNotFoundError:
+            return 'size:0'
+
+    def __get_past_days_version(self, start_date: date, end_date: date) -> str:
+        """
+        Signature of all files of the range. Past days can still be changed: yesterday's file is written after midnight
+        (the part of activity before midnight is written on the first window switch) and then compressed,
+        files can also be converted or edited by user
+        """
+        return self.files_provider.raw_data_catalog.get_version(start_date, end_date)
+
+    def __get_report_cache_key(self, start_date: date, end_date: date) -> ReportCacheKeyType:
+        # NOTE: report depends on app groups from config and on work time limit in the table
+        config_fingerprint = f'{self.activity_reader.matcher.fingerprint}:{self.work_time_limit}'
+        today = date.today()
+        data_version = self.__get_today_version(today) if start_date <= today <= end_date \
+            else self.__get_past_days_version(start_date, end_date)
+
+        return start_date, end_date, self.ignore_weekends, config_fingerprint, data_version
+
+    def __get_report_cache_ttl(self, end_date: date) -> Optional[float]:
+        """
+        Reports of past days are changed only with their files (their signature is a part of cache key),
+        but report that includes today is changed all the time
+        """
+        return None if end_date < date.today() else self.report_cache_ttl
+
+    def __get_cached_report_html(self, cache_key: ReportCacheKeyType) -> html.Div:
+        start_date, end_date, *_ = cache_key
+        is_cached, report_html = self.report_cache.lookup(cache_key)
+
+        if is_cached and report_html is not None:
+            return report_html
+
+        with instrumentation.measure('dash_report_server.load_days'):
+            activity_stat_holder, active_days_count = self.__get_activity_stat_holder(start_date, end_date)
+
+        with instrumentation.measure('dash_report_server.build_data_frame'):
+            report = self.__get_report(activity_stat_holder, active_days_count)
+
+        with instrumentation.measure('dash_report_server.render'):
+            report_html = self.__get_report_html(activity_stat_holder, report, active_days_count)
+
+        self.report_cache.put(cache_key, report_html, self.__get_report_cache_ttl(end_date))
+
+        return report_html
+
     def __get_layout(self) -> html.Div:
         """Get layout with calendar (DatePickerRange) & loading spinner & report output"""
         today = date.today()
@@ -133,6 +239,13 @@ class DashReportServer:
                     end_date=today,
                     updatemode='bothdates',
                 ),
+                # NOTE: report of range with today is refreshed only if today's stats are changed (see REPORT_VERSION)
+                dcc.Interval(
+                    id=ElementId.LIVE_INTERVAL.value,
+                    interval=max(self.live_interval_ms, 1),
+                    disabled=self.live_interval_ms <= 0,
+                ),
+                dcc.Store(id=ElementId.REPORT_VERSION.value),
                 dcc.Loading(
                     [html.Div(id=ElementId.REPORT_OUTPUT.value)],
                     type='graph',
@@ -239,29 +352,74 @@ class DashReportServer:
             dcc.Graph(figure=figure)
         ])
 
+    def report_cache_info(self) -> CacheInfo:
+        """Hits/misses of rendered reports cache to choose its size & ttl"""
+        return self.report_cache.info()
+
+    def get_stats(self) -> str:
+        """Return instrumentation stats of the process (tracker & report server) and caches info as text"""
+        return '\n'.join([
+            instrumentation.format(),
+            f'report_cache: {self.report_cache_info()}',
+            f'application_info_matcher_cache: {self.activity_reader.matcher.cache_info()}',
+        ])
+
+    def shutdown(self) -> None:
+        """Stop workers of DayStatLoader (they are started on the first report and are kept for next reports)"""
+        self.day_stat_loader.shutdown()
+
     def run(self) -> None:
+        def handle_stats() -> Tuple[str, int, Dict[str, str]]:
+            """Plain text stats, e.g. curl http://localhost:3838/stats"""
+            return self.get_stats(), 200, {'Content-Type': 'text/plain; charset=utf-8'}
+
+        # NOTE: route of the underlying Flask server, it is not a part of Dash layout
+        self.app.server.add_url_rule('/stats', 'stats', handle_stats)
+
         @self.app.callback(  # type: ignore[misc]
-            Output(ElementId.REPORT_OUTPUT.value, 'children'),
+            [
+                Output(ElementId.REPORT_OUTPUT.value, 'children'),
+                Output(ElementId.REPORT_VERSION.value, 'data'),
+            ],
             [
                 Input(ElementId.DATE_PICKER.value, 'start_date'),
                 Input(ElementId.DATE_PICKER.value, 'end_date'),
-            ]
+                Input(ElementId.LIVE_INTERVAL.value, 'n_intervals'),
+            ],
+            [State(ElementId.REPORT_VERSION.value, 'data')]
         )
         def handle_date_picker_change(start_date_value: str,
-                                      end_date_value: str) -> Optional[html.Div]:
-            """Update report output when date range on calendar (DatePickerRange) is changed"""
+                                      end_date_value: str,
+                                      n_intervals: Optional[int],
+                                      report_version: Optional[str]) -> Tuple[Any, Any]:
+            """
+            Update report output when date range on calendar (DatePickerRange) is changed
+            or when stats of today are changed (it is checked by LIVE_INTERVAL)
+            """
             try:
                 start_date = datetime.strptime(start_date_value, '%Y-%m-%d').date()
                 end_date = datetime.strptime(end_date_value, '%Y-%m-%d').date()
-                report_dates = DatetimeHelper.get_dates_between(start_date, end_date)
 
-                activity_stat_holder, active_days_count = self.__get_activity_stat_holder(report_dates)
-                report = self.__get_report(activity_stat_holder, active_days_count)
+                cache_key = self.__get_report_cache_key(start_date, end_date)
+                # NOTE: the key contains dates, config & version of data, so it is the version of report
+                next_report_version = repr(cache_key)
+
+                if next_report_version == report_version:
+                    instrumentation.count('dash_report_server.live_not_changed')
+
+                    return no_update, no_update
+
+                report_html = self.__get_cached_report_html(cache_key)
+                self.app.logger.debug(f'Report cache: [{self.report_cache_info()}], '
+                                      f'ApplicationInfoMatcher cache: [{self.activity_reader.matcher.cache_info()}]')
 
-                return self.__get_report_html(activity_stat_holder, report, active_days_count)
+                return report_html, next_report_version
 
             except Exception as err:
                 return html.Div(self.localizator.get('report_server.error', err=str(err)),
-                                style={'textAlign': 'center'})
+                                style={'textAlign': 'center'}), None
 
-        self.app.run_server(self.host, self.port)
+        try:
+            self.app.run_server(self.host, self.port)
+        finally:
+            self.shutdown()
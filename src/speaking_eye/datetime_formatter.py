@@ -4,6 +4,8 @@ from datetime import datetime, timedelta
 class DatetimeFormatter:
     """Format date/time objects as a strings or vice versa"""
     __TIME_SEPARATOR = ':'
+    __STR_DATETIME_LENGTH = len('YYYY-MM-DD HH:MM:SS')
+    __STR_DATETIME_WITH_MICROSECONDS_LENGTH = len('YYYY-MM-DD HH:MM:SS.ffffff')
 
     @staticmethod
     def __timedelta_to_datetime(value: timedelta) -> datetime:
@@ -29,3 +31,26 @@ class DatetimeFormatter:
             # NOTE: Datetime object such as datetime.now() that is saved as string
             #       when a new second just started, does not contain zero milliseconds after point
             return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+
+    @staticmethod
+    def parse_str_datetime(value: str) -> datetime:
+        """
+        Fast path for parsing datetime saved with str(datetime): 'YYYY-MM-DD HH:MM:SS[.ffffff]'.
+        Fall back to strptime for any other layout to keep the same behaviour on malformed strings
+        """
+        length = len(value)
+        is_expected_layout = value[10:11] == ' ' and (
+            length == DatetimeFormatter.__STR_DATETIME_LENGTH or
+            length == DatetimeFormatter.__STR_DATETIME_WITH_MICROSECONDS_LENGTH and value[19] == '.'
+        )
+
+        if is_expected_layout:
+            try:
+                result = datetime.fromisoformat(value)
+
+                if result.tzinfo is None:
+                    return result
+            except ValueError:
+                pass
+
+        return DatetimeFormatter.parse_string_with_optional_milliseconds(value)
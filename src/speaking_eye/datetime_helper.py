@@ -7,6 +7,9 @@ DateRange = Tuple[
     datetime,  # end
 ]
 
+EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
 
 class DatetimeHelper:
     """Extra methods for working with date/time objects"""
@@ -30,3 +33,17 @@ class DatetimeHelper:
         end = start + timedelta(days=1) - timedelta(microseconds=1)
 
         return start, end
+
+    @staticmethod
+    def to_microseconds(value: timedelta) -> int:
+        return value // ONE_MICROSECOND
+
+    @staticmethod
+    def to_epoch_microseconds(value: datetime) -> int:
+        """Convert naive datetime to the number of microseconds since EPOCH (without any timezone conversion)"""
+        return (value - EPOCH) // ONE_MICROSECOND
+
+    @staticmethod
+    def from_epoch_microseconds(value: int) -> datetime:
+        """Inverse of to_epoch_microseconds()"""
+        return EPOCH + timedelta(microseconds=value)
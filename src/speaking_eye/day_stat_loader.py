@@ -0,0 +1,207 @@
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from .activity_day_cache import ActivityDayCache
+from .activity_reader import ActivityReader
+from .activity_stat_holder import ActivityStatHolder
+from .application_info import ApplicationInfo
+from .application_info_matcher import ApplicationInfoMatcher
+from .day_stat_store import DayStatStore
+from .instrumentation import instrumentation
+from .pool_type import PoolType
+from .raw_data_compressor import RawDataCompressor
+from .report_aggregation import ReportAggregation
+
+DayTaskType = Tuple[
+    Path,  # raw_data_file
+    bool,  # is_closed - can aggregate be stored for this file
+]
+
+
+@instrumentation.timed('day_stat_loader.read_day_stat')
+def read_day_stat(activity_reader: ActivityReader,
+                  raw_data_file: Path,
+                  aggregation: ReportAggregation = ReportAggregation.HOLDER) -> ActivityStatHolder:
+    """Parse file with raw data and aggregate its activities into holder"""
+    if aggregation == ReportAggregation.VECTORIZED:
+        # NOTE: numpy is imported only when it is needed since the tracker itself does not use it
+        from .activity_stat_arrays import ActivityStatArrays
+
+        columns = activity_reader.read_columns(raw_data_file)
+
+        return ActivityStatArrays.from_columns(columns, activity_reader.matcher).to_holder()
+
+    return ActivityStatHolder(activity_reader.iter_read(raw_data_file))
+
+
+def _load_day_stat(activity_reader: ActivityReader,
+                   day_stat_store: Optional[DayStatStore],
+                   raw_data_file: Path,
+                   is_closed: bool,
+                   aggregation: ReportAggregation) -> ActivityStatHolder:
+    if day_stat_store is None or not is_closed:
+        return read_day_stat(activity_reader, raw_data_file, aggregation)
+
+    fingerprint = activity_reader.matcher.fingerprint
+    holder = day_stat_store.read(raw_data_file, fingerprint)
+
+    if holder is not None:
+        instrumentation.count('day_stat_store.hits')
+
+        return holder
+
+    instrumentation.count('day_stat_store.misses')
+
+    if not raw_data_file.exists():
+        return ActivityStatHolder([])
+
+    source_stat = raw_data_file.stat()
+    holder = read_day_stat(activity_reader, raw_data_file, aggregation)
+    day_stat_store.write(raw_data_file, holder, source_stat, fingerprint)
+
+    return holder
+
+
+def load_day_stat(activity_reader: ActivityReader,
+                  day_stat_store: Optional[DayStatStore],
+                  raw_data_file: Path,
+                  is_closed: bool,
+                  aggregation: ReportAggregation = ReportAggregation.HOLDER) -> ActivityStatHolder:
+    """
+    Get holder for one file with raw data.
+    Aggregate for closed file is taken from DayStatStore if it is up to date,
+    otherwise raw data is parsed and aggregate is stored for the next time
+    """
+    raw_data_file = RawDataCompressor.resolve(raw_data_file)
+
+    try:
+        holder: Optional[ActivityStatHolder] = \
+            _load_day_stat(activity_reader, day_stat_store, raw_data_file, is_closed, aggregation)
+    except FileNotFoundError:
+        holder = None
+
+    # NOTE: plain file can be compressed (removed) while it is read, then the day is loaded from compressed file
+    #       instead of reporting it as the day without activities
+    if holder is None or not raw_data_file.exists():
+        compressed_file = RawDataCompressor.resolve(raw_data_file)
+
+        if compressed_file != raw_data_file:
+            instrumentation.count('day_stat_loader.compressed_while_loading')
+
+            return _load_day_stat(activity_reader, day_stat_store, compressed_file, is_closed, aggregation)
+
+    if holder is None:
+        raise FileNotFoundError(f'File with raw data [{raw_data_file}] was removed while it was loaded')
+
+    return holder
+
+
+# NOTE: reader & store of the worker process, they are created once by _init_worker()
+_worker_activity_reader: Optional[ActivityReader] = None
+_worker_day_stat_store: Optional[DayStatStore] = None
+_worker_aggregation = ReportAggregation.HOLDER
+
+
+def _init_worker(logger_name: str,
+                 detailed_app_infos: List[ApplicationInfo],
+                 distracting_app_infos: List[ApplicationInfo],
+                 matcher_cache_size: int,
+                 use_day_cache: bool,
+                 use_day_stat_store: bool,
+                 aggregation: ReportAggregation) -> None:
+    global _worker_activity_reader, _worker_day_stat_store, _worker_aggregation
+
+    logger = logging.getLogger(logger_name)
+    matcher = ApplicationInfoMatcher(detailed_app_infos, distracting_app_infos, matcher_cache_size)
+    day_cache = ActivityDayCache(logger) if use_day_cache else None
+
+    _worker_activity_reader = ActivityReader(logger, matcher, day_cache)
+    _worker_day_stat_store = DayStatStore(logger) if use_day_stat_store else None
+    _worker_aggregation = aggregation
+
+
+def _load_day_stat_in_worker(day_task: DayTaskType) -> ActivityStatHolder:
+    if _worker_activity_reader is None:
+        raise RuntimeError('Worker should be initialized!')
+
+    raw_data_file, is_closed = day_task
+
+    return load_day_stat(_worker_activity_reader, _worker_day_stat_store, raw_data_file, is_closed,
+                         _worker_aggregation)
+
+
+class DayStatLoader:
+    """
+    Load ActivityStatHolder for each file with raw data.
+    Days are independent, so they can be loaded in parallel by a pool of workers
+    and only small per-day holders are sent back to be merged
+    """
+
+    def __init__(self, activity_reader: ActivityReader, workers: int, pool_type: PoolType,
+                 day_stat_store: Optional[DayStatStore] = None,
+                 aggregation: ReportAggregation = ReportAggregation.HOLDER) -> None:
+        if workers < 0:
+            raise ValueError(f'workers [{workers}] should not be negative!')
+
+        self.activity_reader = activity_reader
+        self.workers = workers
+        self.pool_type = pool_type
+        self.day_stat_store = day_stat_store
+        self.aggregation = aggregation
+        self.__executor: Optional[Executor] = None
+
+    def __load_day_stat(self, day_task: DayTaskType) -> ActivityStatHolder:
+        raw_data_file, is_closed = day_task
+
+        return load_day_stat(self.activity_reader, self.day_stat_store, raw_data_file, is_closed, self.aggregation)
+
+    def __create_executor(self) -> Executor:
+        if self.pool_type == PoolType.THREAD:
+            return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='day_stat_loader')
+
+        matcher = self.activity_reader.matcher
+
+        # NOTE: 'spawn' is used since fork of process with GTK main loop & threads is not safe
+        return ProcessPoolExecutor(max_workers=self.workers,
+                                   mp_context=multiprocessing.get_context('spawn'),
+                                   initializer=_init_worker,
+                                   initargs=(self.activity_reader.logger.name,
+                                             matcher.detailed_app_infos,
+                                             matcher.distracting_app_infos,
+                                             matcher.cache_info().max_size,
+                                             self.activity_reader.day_cache is not None,
+                                             self.day_stat_store is not None,
+                                             self.aggregation))
+
+    def __get_executor(self) -> Executor:
+        # NOTE: executor is created once and reused since starting processes is expensive
+        if self.__executor is None:
+            self.__executor = self.__create_executor()
+
+        return self.__executor
+
+    def load(self, raw_data_files: List[Path],
+             open_raw_data_file: Optional[Path] = None) -> Iterator[ActivityStatHolder]:
+        """
+        Yield holders in the same order as raw_data_files.
+        open_raw_data_file (today's file that is still written) is always parsed and never stored as aggregate
+        """
+        day_tasks = [(raw_data_file, raw_data_file != open_raw_data_file) for raw_data_file in raw_data_files]
+
+        if self.workers == 0 or len(day_tasks) <= 1:
+            return map(self.__load_day_stat, day_tasks)
+
+        if self.pool_type == PoolType.THREAD:
+            return self.__get_executor().map(self.__load_day_stat, day_tasks)
+
+        return self.__get_executor().map(_load_day_stat_in_worker, day_tasks)
+
+    def shutdown(self) -> None:
+        if self.__executor is None:
+            return
+
+        self.__executor.shutdown()
+        self.__executor = None
@@ -0,0 +1,110 @@
+import json
+import logging
+import os
+import threading
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .activity_stat import ActivityStat
+from .activity_stat_holder import ActivityStatHolder
+
+
+class DayStatStore:
+    """
+    Persistent per-day aggregates of files with raw data: ActivityStat per title, totals and "active day" flag.
+    Aggregate file is stored next to the raw data file and is invalidated
+    by mtime & size of the raw data file and by fingerprint of apps config
+    (since titles depend on detailed/distracting lists)
+    """
+
+    VERSION = 1
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+
+    @staticmethod
+    def get_stat_file_path(raw_data_file: Path) -> Path:
+        # NOTE: hidden file to not to clutter data dir that user can open from tray menu
+        return raw_data_file.with_name(f'.{raw_data_file.name}.stat.json')
+
+    @staticmethod
+    def __to_microseconds(value: timedelta) -> int:
+        return value // timedelta(microseconds=1)
+
+    @staticmethod
+    def __from_microseconds(value: int) -> timedelta:
+        return timedelta(microseconds=value)
+
+    def __to_dict(self, holder: ActivityStatHolder, source_stat: os.stat_result, fingerprint: str) -> Dict[str, Any]:
+        return {
+            'version': self.VERSION,
+            'source_mtime_ns': source_stat.st_mtime_ns,
+            'source_size': source_stat.st_size,
+            'fingerprint': fingerprint,
+            'total_work_time': self.__to_microseconds(holder.total_work_time),
+            'total_off_time': self.__to_microseconds(holder.total_off_time),
+            'has_work_activities': holder.has_work_activities,
+            'stats': {
+                title: [self.__to_microseconds(stat.work_time), self.__to_microseconds(stat.off_time)]
+                for title, stat in holder.items()
+            },
+        }
+
+    def __from_dict(self, data: Dict[str, Any]) -> ActivityStatHolder:
+        holder = ActivityStatHolder([])
+
+        holder.total_work_time = self.__from_microseconds(data['total_work_time'])
+        holder.total_off_time = self.__from_microseconds(data['total_off_time'])
+        holder.has_work_activities = bool(data['has_work_activities'])
+
+        for title, (work_time, off_time) in data['stats'].items():
+            holder[title] = ActivityStat(self.__from_microseconds(work_time), self.__from_microseconds(off_time))
+
+        return holder
+
+    def read(self, raw_data_file: Path, fingerprint: str) -> Optional[ActivityStatHolder]:
+        """Return holder from aggregate file if it exists and it is up to date. Return None otherwise"""
+        stat_file = self.get_stat_file_path(raw_data_file)
+
+        try:
+            source_stat = raw_data_file.stat()
+
+            with open(str(stat_file)) as file:
+                data = json.load(file)
+        except OSError:
+            return None
+        except ValueError as e:
+            self.logger.warning(f'Aggregate [{stat_file}] is broken and will be rebuilt: [{e}]')
+
+            return None
+
+        try:
+            is_up_to_date = data['version'] == self.VERSION \
+                and data['source_mtime_ns'] == source_stat.st_mtime_ns \
+                and data['source_size'] == source_stat.st_size \
+                and data['fingerprint'] == fingerprint
+
+            return self.__from_dict(data) if is_up_to_date else None
+        except (KeyError, TypeError, ValueError) as e:
+            self.logger.warning(f'Aggregate [{stat_file}] is broken and will be rebuilt: [{e}]')
+
+            return None
+
+    def write(self, raw_data_file: Path, holder: ActivityStatHolder,
+              source_stat: os.stat_result, fingerprint: str) -> None:
+        """
+        Write holder that was built from raw_data_file into the aggregate file.
+        source_stat should be taken before reading raw_data_file
+        """
+        stat_file = self.get_stat_file_path(raw_data_file)
+        # NOTE: write into temporary file and rename it to not to leave the broken aggregate
+        tmp_stat_file = stat_file.with_name(f'{stat_file.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+
+        try:
+            with open(str(tmp_stat_file), 'w') as file:
+                json.dump(self.__to_dict(holder, source_stat, fingerprint), file, ensure_ascii=False)
+
+            os.replace(str(tmp_stat_file), str(stat_file))
+        except OSError as e:
+            self.logger.warning(f'Could not write aggregate [{stat_file}]: [{e}]')
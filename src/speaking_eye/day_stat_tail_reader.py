@@ -0,0 +1,106 @@
+import threading
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from .activity import Activity
+from .activity_converter import ActivityConverter
+from .activity_reader import ActivityReader
+from .activity_stat_holder import ActivityStatHolder
+from .binary_activity_log import BinaryActivityDecoder
+from .compression import Compression
+from .instrumentation import instrumentation
+from .raw_data_format import RawDataFormat
+
+FileIdType = Tuple[
+    Path,  # raw_data_file
+    int,  # st_dev
+    int,  # st_ino
+    str,  # matcher fingerprint
+]
+
+
+class DayStatTailReader:
+    """
+    Follow the file with raw data of the open day (ActivityWriter only appends to it)
+    and keep ActivityStatHolder of activities that have been read.
+    Each read parses only complete lines (or records for RawDataFormat.BINARY) appended since the previous read,
+    so refreshing of today's report costs time proportional to the new activity, not to the whole day.
+    Reading is started from scratch if another file is read or the file is replaced (inode is changed) or shrunk
+    """
+
+    def __init__(self, activity_reader: ActivityReader) -> None:
+        self.activity_reader = activity_reader
+        self.__lock = threading.Lock()
+        self.__reset(None)
+
+    def __reset(self, file_id: Optional[FileIdType]) -> None:
+        self.__file_id = file_id
+        self.__offset = 0  # end of the last complete line/record
+        self.__holder = ActivityStatHolder([])
+        self.__binary_decoder: Optional[BinaryActivityDecoder] = None
+
+    def __iter_appended(self, raw_data_file: Path, data: bytes) -> Iterator[Activity]:
+        if RawDataFormat.from_path(raw_data_file) == RawDataFormat.BINARY:
+            if self.__binary_decoder is None:
+                self.__binary_decoder = BinaryActivityDecoder()
+
+            yield from self.__binary_decoder.iter_decode(data, self.__offset)
+            self.__offset = self.__binary_decoder.offset
+
+            return
+
+        # NOTE: the last line can be written partially, it is read on the next read when it is finished
+        complete_size = data.rfind(b'\n') + 1
+
+        for line in data[:complete_size].decode('utf-8').splitlines(keepends=True):
+            yield ActivityConverter.from_string(line)
+
+        self.__offset += complete_size
+
+    def __update(self, raw_data_file: Path) -> None:
+        try:
+            source_stat = raw_data_file.stat()
+        except FileNotFoundError:
+            self.__reset(None)
+
+            return
+
+        file_id = (raw_data_file, source_stat.st_dev, source_stat.st_ino, self.activity_reader.matcher.fingerprint)
+
+        if file_id != self.__file_id or source_stat.st_size < self.__offset:
+            self.__reset(file_id)
+
+        if source_stat.st_size == self.__offset:
+            return
+
+        with open(str(raw_data_file), 'rb') as file:
+            file.seek(self.__offset)
+            data = file.read()
+
+        instrumentation.count('day_stat_tail_reader.read_bytes', len(data))
+        matcher = self.activity_reader.matcher
+        # NOTE: appended activities are added only if all of them are parsed, so offset & holder are changed together
+        appended_holder = ActivityStatHolder([])
+
+        try:
+            for activity in self.__iter_appended(raw_data_file, data):
+                matcher.set_if_matched(activity)
+                appended_holder.update_stat(activity)
+        except Exception:
+            # NOTE: state of binary decoder is unknown after the error, so the file is read from scratch next time
+            self.__reset(None)
+            raise
+
+        self.__holder.merge(appended_holder)
+
+    @instrumentation.timed('day_stat_tail_reader.read')
+    def read(self, raw_data_file: Path) -> ActivityStatHolder:
+        """Return holder with all activities of the file (a copy that can be changed by caller)"""
+        if Compression.from_path(raw_data_file) != Compression.NONE:
+            # NOTE: compressed file is closed and it is not appended anymore
+            return ActivityStatHolder(self.activity_reader.iter_read(raw_data_file))
+
+        with self.__lock:
+            self.__update(raw_data_file)
+
+            return ActivityStatHolder([]) + self.__holder
@@ -0,0 +1,63 @@
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from gi.repository import GLib, GObject
+
+
+class DeadlineTimer:
+    """
+    One-shot timer that wakes up at the given deadline instead of polling with a fixed interval.
+    Scheduling again replaces the previous deadline, None means that nothing is due (timer is stopped).
+    GLib source is owned by the timer, so handler can schedule the next deadline
+
+    Interval is limited by max_interval because GLib timers use monotonic time that does not go on
+    while the laptop is suspended, so a far deadline could fire too late after resume
+    """
+
+    # NOTE: to not to spin in a loop if due condition was not met exactly at the deadline
+    MIN_INTERVAL_MS = 100
+
+    def __init__(self, name: str,
+                 handler: Callable[[], None],
+                 max_interval: timedelta,
+                 logger: logging.Logger) -> None:
+        self.name = name
+        self.max_interval = max_interval
+        self.deadline: Optional[datetime] = None
+        self.logger = logger
+
+        self.__handler = handler
+        self.__source_id: Optional[int] = None
+
+    @property
+    def is_started(self) -> bool:
+        return self.__source_id is not None
+
+    def schedule(self, deadline: Optional[datetime], now: datetime) -> None:
+        if self.__source_id is not None:
+            GObject.source_remove(self.__source_id)
+            self.__source_id = None
+
+        self.deadline = deadline
+
+        if deadline is None:
+            return
+
+        interval = min(deadline - now, self.max_interval)
+        interval_ms = math.ceil(interval / timedelta(milliseconds=1))
+
+        self.__source_id = GLib.timeout_add(max(interval_ms, self.MIN_INTERVAL_MS), self.__on_timeout)
+
+    def stop(self) -> None:
+        self.schedule(None, datetime.now())
+
+    def __on_timeout(self) -> bool:
+        # NOTE: the source is removed by GLib after returning False,
+        #       so it is forgotten before the handler schedules the next deadline
+        self.__source_id = None
+        self.deadline = None
+        self.__handler()
+
+        return False
@@ -1,14 +1,15 @@
-import glob
-import os
 from datetime import date, datetime
 from pathlib import Path
 from shutil import copy
-from typing import cast, Optional, Union
+from typing import cast, Iterator, List, Optional, Tuple, Union
 
 import parse
 from xdg import xdg_config_home, xdg_data_home
 
+from .compression import Compression
 from .icon_state import IconState
+from .raw_data_catalog import RawDataCatalog
+from .raw_data_format import RawDataFormat
 from .theme import Theme
 from .value import Value
 
@@ -19,8 +20,8 @@ class FilesProvider:
     Help to search among files with raw data
     """
     __DATE_FORMAT_LABEL = 'date'
-    __RAW_DATA_FILE_MASK = f'{{{__DATE_FORMAT_LABEL}}}_speaking_eye_raw_data.tsv'
-    __FS_RAW_DATA_FILE_MASK = __RAW_DATA_FILE_MASK.format_map({__DATE_FORMAT_LABEL: '*'})
+    __SUFFIX_LABEL = 'suffix'
+    __RAW_DATA_FILE_MASK = f'{{{__DATE_FORMAT_LABEL}}}_speaking_eye_raw_data.{{{__SUFFIX_LABEL}}}'
 
     def __init__(self, package_root_dir: Path, app_id: str) -> None:
         self.__package_root_dir = package_root_dir
@@ -45,6 +46,10 @@ class FilesProvider:
 
         self.__config_path: Optional[Path] = None
 
+        # NOTE: format of new files with raw data, existing files are read in their own format
+        self.__raw_data_format = RawDataFormat.TSV
+        self.__raw_data_catalog = RawDataCatalog(self.__raw_data_dir, self.__parse_raw_data_file_name)
+
     def __check_dirs(self) -> None:
         dir_paths = [
             self.__package_root_dir,
@@ -103,26 +108,67 @@ class FilesProvider:
     def raw_data_dir(self) -> Path:
         return self.__raw_data_dir
 
+    @property
+    def raw_data_format(self) -> RawDataFormat:
+        return self.__raw_data_format
+
+    @raw_data_format.setter
+    def raw_data_format(self, value: RawDataFormat) -> None:
+        self.__raw_data_format = value
+        # NOTE: priorities of files for the same date depend on the format
+        self.__raw_data_catalog.invalidate()
+
+    @property
+    def raw_data_catalog(self) -> RawDataCatalog:
+        return self.__raw_data_catalog
+
     def get_icon_file_path(self, theme: Theme, icon_state: IconState) -> Path:
         return self.__icon_dir / cast(str, theme.value) / f'{icon_state.value}.png'
 
-    def get_raw_data_file_path(self, file_date: date) -> Path:
-        return self.__raw_data_dir / self.__RAW_DATA_FILE_MASK.format_map({self.__DATE_FORMAT_LABEL: file_date})
+    def __get_raw_data_suffixes(self) -> List[str]:
+        """Return suffixes of files with raw data in all formats (plain or compressed), the preferred one is first"""
+        other_raw_data_formats = [raw_data_format for raw_data_format in RawDataFormat
+                                  if raw_data_format != self.raw_data_format]
 
-    def get_date_of_first_raw_data_file(self, default_date: date = date.today()) -> date:
-        """Return min date from raw data file names or default_date if no files"""
-        file_paths = glob.glob(str(self.__raw_data_dir / self.__FS_RAW_DATA_FILE_MASK))
+        return [f'{raw_data_format.value}{compression.suffix}'
+                for raw_data_format in [self.raw_data_format] + other_raw_data_formats
+                for compression in Compression]
+
+    def __parse_raw_data_file_name(self, file_name: str) -> Optional[Tuple[date, int]]:
+        """Return date & priority of file with raw data or None if it is not a file with raw data"""
+        parsed = parse.parse(self.__RAW_DATA_FILE_MASK, file_name)
+
+        if parsed is None:
+            return None
+
+        try:
+            priority = self.__get_raw_data_suffixes().index(parsed[self.__SUFFIX_LABEL])
+            file_date = datetime.strptime(parsed[self.__DATE_FORMAT_LABEL], '%Y-%m-%d').date()
+        except ValueError:
+            return None
 
-        if len(file_paths) == 0:
-            return default_date
+        return file_date, priority
 
-        file_names = [os.path.basename(file_path) for file_path in file_paths]
+    def get_raw_data_file_path(self, file_date: date) -> Path:
+        """
+        Return path to existing file with raw data for the date in any format (plain or compressed)
+        or path in raw_data_format if there is no file yet.
+        So activities of one day are always written to and read from one file even if format was changed
+        """
+        file_path = self.__raw_data_catalog.get_file_path(file_date)
+
+        if file_path is not None:
+            return file_path
 
-        dates = []
-        for file_name in file_names:
-            date_str = parse.parse(self.__RAW_DATA_FILE_MASK, file_name)[self.__DATE_FORMAT_LABEL]
-            file_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+        return self.__raw_data_dir / self.__RAW_DATA_FILE_MASK.format_map({
+            self.__DATE_FORMAT_LABEL: file_date,
+            self.__SUFFIX_LABEL: self.raw_data_format.value,
+        })
 
-            dates.append(file_date)
+    def iter_raw_data_files(self) -> Iterator[Tuple[date, Path]]:
+        """Yield dates and paths of all files with raw data in any format (plain or compressed) sorted by date"""
+        return self.__raw_data_catalog.items()
 
-        return min(dates)
+    def get_date_of_first_raw_data_file(self, default_date: date = date.today()) -> date:
+        """Return min date from raw data file names or default_date if no files"""
+        return self.__raw_data_catalog.get_first_date(default_date)
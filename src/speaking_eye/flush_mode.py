@@ -0,0 +1,7 @@
+from .extended_enum import ExtendedEnum
+
+
+class FlushMode(ExtendedEnum):
+    """Durability modes of ActivityWriter"""
+    ALWAYS = 'always'  # flush after every activity
+    BATCHED = 'batched'  # group commit: flush after N activities or by timer
@@ -0,0 +1,137 @@
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, TypeVar, cast
+
+# declare type variables
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class StageStat:
+    """Count, total/max time and latency histogram of one named stage"""
+    __slots__ = ('count', 'total_ns', 'max_ns', 'buckets')
+
+    # upper bounds of histogram buckets (the last bucket is for slower calls)
+    BUCKET_BOUNDS_NS = [10 ** power for power in range(4, 11)]  # 10us .. 10s
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * (len(self.BUCKET_BOUNDS_NS) + 1)
+
+    def add(self, elapsed_ns: int) -> None:
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        self.buckets[bisect_left(self.BUCKET_BOUNDS_NS, elapsed_ns)] += 1
+
+    @staticmethod
+    def __format_ns(value_ns: float) -> str:
+        if value_ns < 10 ** 6:
+            return f'{value_ns / 10 ** 3:.1f}us'
+
+        if value_ns < 10 ** 9:
+            return f'{value_ns / 10 ** 6:.1f}ms'
+
+        return f'{value_ns / 10 ** 9:.1f}s'
+
+    def format(self) -> str:
+        mean_ns = self.total_ns / self.count if self.count else 0
+        bucket_labels = [f'<{self.__format_ns(bound_ns)}' for bound_ns in self.BUCKET_BOUNDS_NS] + ['slower']
+        histogram = ' '.join(f'{label}:{count}' for label, count in zip(bucket_labels, self.buckets) if count)
+
+        return f'count={self.count} total={self.__format_ns(self.total_ns)} mean={self.__format_ns(mean_ns)} ' \
+               f'max={self.__format_ns(self.max_ns)} [{histogram}]'
+
+
+class Instrumentation:
+    """
+    Latency histograms and counters per named stage (e.g. 'activity_reader.read_columns')
+    to find out where the time of slow reports or lags of the tracker goes.
+    It is disabled by default and then measure()/timed() cost only one attribute check.
+    Stats of the process can be dumped as text (e.g. on SIGUSR1 or by the report server)
+    """
+
+    # NOTE: nullcontext has no state, so one instance is reused when instrumentation is disabled
+    __NULL_CONTEXT: ContextManager[None] = nullcontext()
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.__lock = threading.Lock()
+        self.__stages: Dict[str, StageStat] = {}
+        self.__counters: Dict[str, int] = {}
+
+    def record(self, stage: str, elapsed_ns: int) -> None:
+        with self.__lock:
+            stage_stat = self.__stages.get(stage)
+
+            if stage_stat is None:
+                stage_stat = self.__stages[stage] = StageStat()
+
+            stage_stat.add(elapsed_ns)
+
+    def count(self, counter: str, value: int = 1) -> None:
+        if not self.enabled:
+            return
+
+        with self.__lock:
+            self.__counters[counter] = self.__counters.get(counter, 0) + value
+
+    @contextmanager
+    def __measure(self, stage: str) -> Iterator[None]:
+        start_ns = time.perf_counter_ns()
+
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter_ns() - start_ns)
+
+    def measure(self, stage: str) -> ContextManager[None]:
+        """Context manager that records the time of its block"""
+        if not self.enabled:
+            return self.__NULL_CONTEXT
+
+        return self.__measure(stage)
+
+    def timed(self, stage: str) -> Callable[[F], F]:
+        """Decorator that records the time of each call"""
+        def decorator(function: F) -> F:
+            @functools.wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return function(*args, **kwargs)
+
+                start_ns = time.perf_counter_ns()
+
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(stage, time.perf_counter_ns() - start_ns)
+
+            return cast(F, wrapper)
+
+        return decorator
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__stages.clear()
+            self.__counters.clear()
+
+    def format(self) -> str:
+        """Return stats of all stages and counters as text sorted by name"""
+        with self.__lock:
+            lines: List[str] = [f'{stage}: {stage_stat.format()}'
+                                for stage, stage_stat in sorted(self.__stages.items())]
+            lines += [f'{counter}: {value}' for counter, value in sorted(self.__counters.items())]
+
+        if not self.enabled:
+            lines.insert(0, 'instrumentation is disabled')
+
+        return '\n'.join(lines)
+
+
+# NOTE: one instance per process, so modules do not need to pass it to each other
+instrumentation = Instrumentation()
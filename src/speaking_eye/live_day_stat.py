@@ -0,0 +1,69 @@
+import threading
+from datetime import date
+from typing import Optional, Tuple
+
+from .activity import Activity
+from .activity_stat_holder import ActivityStatHolder
+
+LiveDayStatSnapshotType = Tuple[
+    int,  # version
+    ActivityStatHolder,
+]
+
+DaySnapshotType = Tuple[
+    Optional[date],  # day of stats (None before the first reset)
+    int,  # version
+    ActivityStatHolder,
+]
+
+
+class LiveDayStat:
+    """
+    Stats of the open day that are collected by the tracker (SpeakingEyeApp) in memory
+    and shared with the report server thread, so the report does not parse today's file.
+    Stats are copy-on-write: each change publishes a new versioned snapshot that is never changed after that,
+    so readers take the last snapshot without lock (assignment of one reference is atomic).
+    Version is increased on each change, so report is rendered again only when it is changed
+    """
+
+    def __init__(self) -> None:
+        # NOTE: only writers take the lock to not to lose concurrent changes, readers never wait
+        self.__write_lock = threading.Lock()
+        self.__snapshot: DaySnapshotType = (None, 0, ActivityStatHolder([]))
+
+    @property
+    def day(self) -> Optional[date]:
+        day, _, _ = self.__snapshot
+
+        return day
+
+    @property
+    def holder(self) -> ActivityStatHolder:
+        """The last snapshot of stats, it is shared, so it should not be changed (merge it into another holder)"""
+        _, _, holder = self.__snapshot
+
+        return holder
+
+    def reset(self, day: date, holder: ActivityStatHolder) -> None:
+        """Start stats of the day with activities that were collected before (e.g. read from today's file)"""
+        with self.__write_lock:
+            _, version, _ = self.__snapshot
+            self.__snapshot = (day, version + 1, ActivityStatHolder([]) + holder)
+
+    def update_stat(self, activity: Activity) -> None:
+        """Add finished activity of the current day, only stat of its title is copied"""
+        with self.__write_lock:
+            day, version, holder = self.__snapshot
+            self.__snapshot = (day, version + 1, holder.copy_with_stat(activity))
+
+    def get_version(self, day: date) -> Optional[int]:
+        """Return version of stats if they are collected for the day"""
+        snapshot_day, version, _ = self.__snapshot
+
+        return version if snapshot_day == day else None
+
+    def get(self, day: date) -> Optional[LiveDayStatSnapshotType]:
+        """Return version & snapshot of stats (it should not be changed) if they are collected for the day"""
+        snapshot_day, version, holder = self.__snapshot
+
+        return (version, holder) if snapshot_day == day else None
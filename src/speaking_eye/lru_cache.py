@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, Optional, Tuple, TypeVar
+
+# declare type variables
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int
+    current_size: int
+
+
+class LruCache(Generic[K, V]):
+    """
+    Bounded mapping that evicts the least recently used item when it is full.
+    Counts hits/misses to help choosing max_size.
+    Item can be put with ttl (in seconds of clock), then it is treated as missing after expiration.
+    Can be shared between threads (e.g. tracker and report server)
+    """
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.monotonic) -> None:
+        if max_size < 0:
+            raise ValueError(f'max_size [{max_size}] should not be negative!')
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__clock = clock
+        # NOTE: value & expiration time (None if item never expires)
+        self.__items: 'OrderedDict[K, Tuple[V, Optional[float]]]' = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def lookup(self, key: K) -> Tuple[bool, Optional[V]]:
+        """
+        Return (True, value) if key is cached and (False, None) otherwise.
+        Value itself can be None, e.g. to cache negative results
+        """
+        with self.__lock:
+            try:
+                value, expires_at = self.__items[key]
+            except KeyError:
+                self.misses += 1
+
+                return False, None
+
+            if expires_at is not None and expires_at <= self.__clock():
+                del self.__items[key]
+                self.misses += 1
+
+                return False, None
+
+            self.__items.move_to_end(key)
+            self.hits += 1
+
+            return True, value
+
+    def put(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        if self.max_size == 0:
+            return
+
+        expires_at = None if ttl is None else self.__clock() + ttl
+
+        with self.__lock:
+            self.__items[key] = (value, expires_at)
+            self.__items.move_to_end(key)
+
+            if len(self.__items) > self.max_size:
+                self.__items.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all items but keep hits/misses counters"""
+        with self.__lock:
+            self.__items.clear()
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.max_size, len(self.__items))
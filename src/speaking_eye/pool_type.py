@@ -0,0 +1,7 @@
+from .extended_enum import ExtendedEnum
+
+
+class PoolType(ExtendedEnum):
+    """Pools of workers that can be used for loading reports data"""
+    PROCESS = 'process'  # for CPU-bound parsing & matching
+    THREAD = 'thread'  # for I/O-bound cases (e.g. slow disks)
@@ -0,0 +1,185 @@
+import hashlib
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+RawDataFileNameParserType = Callable[
+    [str],  # file name
+    Optional[Tuple[
+        date,  # file_date
+        int,  # priority (the lower the higher) of the file among files for the same date
+    ]],
+]
+
+RawDataFileInfoType = Tuple[
+    Path,  # raw_data_file
+    int,  # size in bytes at the moment of the last scan
+]
+
+RawDataIndexType = Tuple[
+    List[date],  # sorted dates
+    Dict[date, RawDataFileInfoType],
+]
+
+
+class RawDataCatalog:
+    """
+    Sorted index of dates that have files with raw data (with paths and sizes of these files).
+    Dir with raw data is scanned again only when its mtime is changed (file is created / removed / renamed),
+    so queries like "first date" or "dates with data in range" do not touch the file system per day
+    """
+
+    # NOTE: dir mtime has coarse granularity, so the change of dir right after the scan can keep the same mtime.
+    #       Index of the dir that was changed recently is not trusted and the dir is scanned again on the next query
+    RACY_INTERVAL_NS = 2 * 10 ** 9
+
+    def __init__(self, raw_data_dir: Path, parse_file_name: RawDataFileNameParserType) -> None:
+        self.__raw_data_dir = raw_data_dir
+        self.__parse_file_name = parse_file_name
+        self.__lock = threading.Lock()
+        self.__dir_mtime_ns: Optional[int] = None
+        # NOTE: sorted dates & files are replaced together, so readers can use them without lock
+        self.__index: RawDataIndexType = ([], {})
+
+    def invalidate(self) -> None:
+        """Force scan of dir with raw data on the next query"""
+        with self.__lock:
+            self.__dir_mtime_ns = None
+
+    def __scan(self) -> Dict[date, RawDataFileInfoType]:
+        files: Dict[date, RawDataFileInfoType] = {}
+        priorities: Dict[date, int] = {}
+
+        with os.scandir(str(self.__raw_data_dir)) as entries:
+            for entry in entries:
+                # NOTE: hidden files are caches/aggregates/temporary files
+                if entry.name.startswith('.'):
+                    continue
+
+                parsed = self.__parse_file_name(entry.name)
+
+                if parsed is None:
+                    continue
+
+                file_date, priority = parsed
+
+                if file_date in priorities and priorities[file_date] <= priority:
+                    continue
+
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    # NOTE: file was removed during the scan (e.g. it was compressed)
+                    continue
+
+                priorities[file_date] = priority
+                files[file_date] = (Path(entry.path), size)
+
+        return files
+
+    def __refresh(self) -> None:
+        with self.__lock:
+            try:
+                dir_mtime_ns: Optional[int] = os.stat(str(self.__raw_data_dir)).st_mtime_ns
+            except OSError:
+                dir_mtime_ns = None
+
+            if dir_mtime_ns is not None and dir_mtime_ns == self.__dir_mtime_ns:
+                return
+
+            try:
+                files = self.__scan() if dir_mtime_ns is not None else {}
+            except OSError:
+                files = {}
+                dir_mtime_ns = None
+
+            if dir_mtime_ns is not None and time.time_ns() - dir_mtime_ns < self.RACY_INTERVAL_NS:
+                dir_mtime_ns = None
+
+            self.__dir_mtime_ns = dir_mtime_ns
+            self.__index = (sorted(files), files)
+
+    def add(self, file_date: date, raw_data_file: Path) -> None:
+        """
+        Add file that is created by the app (e.g. by ActivityWriter),
+        so its date is known even before the next scan
+        """
+        self.__refresh()
+
+        with self.__lock:
+            dates, files = self.__index
+
+            if file_date not in files:
+                dates = sorted(dates + [file_date])
+
+            self.__index = (dates, {**files, file_date: (raw_data_file, 0)})
+
+    def __get_index(self) -> RawDataIndexType:
+        self.__refresh()
+
+        return self.__index
+
+    def __len__(self) -> int:
+        dates, _ = self.__get_index()
+
+        return len(dates)
+
+    def items(self) -> Iterator[Tuple[date, Path]]:
+        """Yield dates and paths of files with raw data sorted by date"""
+        dates, files = self.__get_index()
+
+        for file_date in dates:
+            yield file_date, files[file_date][0]
+
+    def get_first_date(self, default_date: date) -> date:
+        dates, _ = self.__get_index()
+
+        return dates[0] if dates else default_date
+
+    def get_last_date(self, default_date: date) -> date:
+        dates, _ = self.__get_index()
+
+        return dates[-1] if dates else default_date
+
+    def get_dates(self, start_date: date, end_date: date) -> List[date]:
+        """Return sorted dates with raw data between start_date and end_date (inclusive)"""
+        dates, _ = self.__get_index()
+
+        return dates[bisect_left(dates, start_date):bisect_right(dates, end_date)]
+
+    def get_file_path(self, file_date: date) -> Optional[Path]:
+        _, files = self.__get_index()
+        file_info = files.get(file_date)
+
+        return None if file_info is None else file_info[0]
+
+    def get_version(self, start_date: date, end_date: date) -> str:
+        """
+        Return signature of files with raw data between start_date and end_date (inclusive).
+        It is changed when any of these files is created, removed, renamed (e.g. compressed) or written.
+        Files are checked on each call since writing into file does not change mtime of dir
+        """
+        dates, files = self.__get_index()
+        signatures = []
+
+        for file_date in dates[bisect_left(dates, start_date):bisect_right(dates, end_date)]:
+            raw_data_file, _ = files[file_date]
+
+            try:
+                file_stat = raw_data_file.stat()
+                signatures.append(f'{raw_data_file.name}:{file_stat.st_size}:{file_stat.st_mtime_ns}')
+            except FileNotFoundError:
+                signatures.append(f'{raw_data_file.name}:removed')
+
+        return hashlib.sha1('\n'.join(signatures).encode('utf-8')).hexdigest()
+
+    def get_file_size(self, file_date: date) -> int:
+        """Return size of file with raw data at the moment of the last scan or 0 if there is no file"""
+        _, files = self.__get_index()
+        file_info = files.get(file_date)
+
+        return 0 if file_info is None else file_info[1]
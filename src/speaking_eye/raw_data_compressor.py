@@ -0,0 +1,97 @@
+import logging
+import os
+import shutil
+from pathlib import Path
+
+from .activity_day_cache import ActivityDayCache
+from .compression import Compression
+from .day_stat_store import DayStatStore
+
+
+class RawDataCompressor:
+    """
+    Compress files with raw data of closed days (they are never written again).
+    Compressed file replaces the plain one atomically, so readers see either of them
+    """
+
+    def __init__(self, logger: logging.Logger, compression: Compression) -> None:
+        self.logger = logger
+        self.compression = compression
+
+    @staticmethod
+    def remove_derived_files(raw_data_file: Path) -> None:
+        """Cache and aggregate are bound to the file name, so they are useless after renaming"""
+        for derived_file in [ActivityDayCache.get_cache_file_path(raw_data_file),
+                             DayStatStore.get_stat_file_path(raw_data_file)]:
+            if derived_file.exists():
+                derived_file.unlink()
+
+    @staticmethod
+    def __copy(source_file: Path, source_compression: Compression,
+               target_file: Path, target_compression: Compression) -> None:
+        # NOTE: write into hidden temporary file and rename it to not to leave the broken file
+        tmp_target_file = target_file.with_name(f'.{target_file.name}.{os.getpid()}.tmp')
+
+        try:
+            with source_compression.open(source_file, 'rb') as source, \
+                    target_compression.open(tmp_target_file, 'wb') as target:
+                shutil.copyfileobj(source, target)
+
+            os.replace(str(tmp_target_file), str(target_file))
+        finally:
+            if tmp_target_file.exists():
+                tmp_target_file.unlink()
+
+    def should_compress(self, raw_data_file: Path) -> bool:
+        return self.compression != Compression.NONE and Compression.from_path(raw_data_file) == Compression.NONE
+
+    @staticmethod
+    def resolve(raw_data_file: Path) -> Path:
+        """
+        Return path of compressed file if plain raw_data_file was compressed after its path had been taken
+        (e.g. from RawDataCatalog by report server while closed days are compressed in background)
+        """
+        if Compression.from_path(raw_data_file) != Compression.NONE or raw_data_file.exists():
+            return raw_data_file
+
+        for compression in Compression:
+            compressed_file = raw_data_file.with_name(f'{raw_data_file.name}{compression.suffix}')
+
+            if compression != Compression.NONE and compressed_file.exists():
+                return compressed_file
+
+        return raw_data_file
+
+    def compress(self, raw_data_file: Path) -> Path:
+        """Return path of compressed file (or raw_data_file if it should not be compressed)"""
+        if not self.should_compress(raw_data_file):
+            return raw_data_file
+
+        compressed_file = raw_data_file.with_name(f'{raw_data_file.name}{self.compression.suffix}')
+
+        self.__copy(raw_data_file, Compression.NONE, compressed_file, self.compression)
+
+        self.logger.debug(f'[{raw_data_file}] is compressed: '
+                          f'[{raw_data_file.stat().st_size}] -> [{compressed_file.stat().st_size}] bytes')
+
+        raw_data_file.unlink()
+        self.remove_derived_files(raw_data_file)
+
+        return compressed_file
+
+    @staticmethod
+    def decompress(raw_data_file: Path) -> Path:
+        """Return path of plain file (e.g. to continue writing into it)"""
+        compression = Compression.from_path(raw_data_file)
+
+        if compression == Compression.NONE:
+            return raw_data_file
+
+        plain_file = Compression.strip(raw_data_file)
+
+        RawDataCompressor.__copy(raw_data_file, compression, plain_file, Compression.NONE)
+
+        raw_data_file.unlink()
+        RawDataCompressor.remove_derived_files(raw_data_file)
+
+        return plain_file
@@ -0,0 +1,99 @@
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, List
+
+import coloredlogs
+
+from .activity import Activity
+from .activity_converter import ActivityConverter
+from .activity_reader import ActivityReader
+from .binary_activity_log import BinaryActivityEncoder
+from .compression import Compression
+from .raw_data_compressor import RawDataCompressor
+from .raw_data_format import RawDataFormat
+
+
+class RawDataConverter:
+    """
+    Lossless conversion of files with raw data between formats (see RawDataFormat).
+    Converted file is written next to the source one with the same compression (e.g. *.tsv.gz -> *.bin.gz,
+    so it is still found by RawDataCatalog) and checked by reading it back
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+
+    @staticmethod
+    def __encode(activities: Iterable[Activity], raw_data_format: RawDataFormat) -> bytes:
+        if raw_data_format == RawDataFormat.BINARY:
+            encoder = BinaryActivityEncoder()
+
+            return b''.join(encoder.encode(activity) for activity in activities)
+
+        return ''.join(ActivityConverter.to_string(activity) for activity in activities).encode('utf-8')
+
+    def convert(self, raw_data_file: Path, raw_data_format: RawDataFormat, keep_source: bool = False) -> Path:
+        """Return path of converted file"""
+        compression = Compression.from_path(raw_data_file)
+        plain_target_file = Compression.strip(raw_data_file).with_suffix(f'.{raw_data_format.value}')
+        target_file = plain_target_file.with_name(f'{plain_target_file.name}{compression.suffix}')
+
+        if target_file == raw_data_file:
+            self.logger.debug(f'[{raw_data_file}] is already in [{raw_data_format.value}] format')
+
+            return raw_data_file
+
+        # NOTE: only one file of the day in the target format should exist whatever its compression is
+        for existing_file in [plain_target_file.with_name(f'{plain_target_file.name}{other_compression.suffix}')
+                              for other_compression in Compression]:
+            if existing_file.exists():
+                raise ValueError(f'Target file [{existing_file}] already exists!')
+
+        activities = list(ActivityReader.iter_raw_data_file(raw_data_file))
+        # NOTE: temporary file keeps the suffixes to be read back in the target format & compression
+        tmp_target_file = target_file.with_name(
+            f'.{plain_target_file.stem}.{os.getpid()}.tmp{plain_target_file.suffix}{compression.suffix}')
+
+        try:
+            with compression.open(tmp_target_file, 'wb') as tmp_target:
+                tmp_target.write(self.__encode(activities, raw_data_format))
+
+            if list(ActivityReader.iter_raw_data_file(tmp_target_file)) != activities:
+                raise ValueError(f'Activities read from converted [{raw_data_file}] are not the same!')
+
+            os.replace(str(tmp_target_file), str(target_file))
+        finally:
+            if tmp_target_file.exists():
+                tmp_target_file.unlink()
+
+        self.logger.info(f'[{raw_data_file}] -> [{target_file}]: '
+                         f'[{raw_data_file.stat().st_size}] -> [{target_file.stat().st_size}] bytes')
+
+        if not keep_source:
+            raw_data_file.unlink()
+            RawDataCompressor.remove_derived_files(raw_data_file)
+
+        return target_file
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description='Convert files with raw data of speaking-eye to another format')
+    parser.add_argument('files', type=Path, nargs='+', help='files with raw data')
+    parser.add_argument('--to', type=str, choices=[item.value for item in RawDataFormat], required=True,
+                        help='target format')
+    parser.add_argument('--keep-source', action='store_true', help='do not remove source files')
+    args = parser.parse_args(argv)
+
+    coloredlogs.install(logging.INFO)
+    converter = RawDataConverter(logging.getLogger('raw-data-converter'))
+    raw_data_format = RawDataFormat.parse(args.to, RawDataFormat.TSV)
+
+    for raw_data_file in args.files:
+        converter.convert(raw_data_file, raw_data_format, args.keep_source)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
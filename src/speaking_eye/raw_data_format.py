@@ -0,0 +1,15 @@
+from pathlib import Path
+
+from .compression import Compression
+from .extended_enum import ExtendedEnum
+
+
+class RawDataFormat(ExtendedEnum):
+    """Formats of files with raw data, value is the file suffix"""
+    TSV = 'tsv'  # text, one activity per line (see ActivityConverter)
+    BINARY = 'bin'  # compact append-only log (see BinaryActivityLog)
+
+    @staticmethod
+    def from_path(raw_data_file: Path) -> 'RawDataFormat':
+        """Format of the file with raw data even if it is compressed"""
+        return RawDataFormat.parse(Compression.strip(raw_data_file).suffix[1:], RawDataFormat.TSV)
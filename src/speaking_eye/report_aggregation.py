@@ -0,0 +1,7 @@
+from .extended_enum import ExtendedEnum
+
+
+class ReportAggregation(ExtendedEnum):
+    """Ways to aggregate activities of the day into ActivityStatHolder for reports"""
+    HOLDER = 'holder'  # activities are added to holder one by one
+    VECTORIZED = 'vectorized'  # with ActivityStatArrays (numpy) from columns of the day
@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import Dict, Optional
+
+from .activity import Activity
+from .activity_stat_holder import ActivityStatHolder
+from .datetime_helper import DatetimeHelper
+
+
+class SessionAccumulator:
+    """
+    Running work time totals of the tracker as integer microseconds.
+    Updated once per activity transition, so threshold checks (overtime, distracting apps)
+    are constant-time comparisons that do not touch ActivityStatHolder.
+
+    Time of the current (not finished) activity is counted from its start time
+    """
+
+    def __init__(self) -> None:
+        self.total_work_us = 0
+        self.__title_work_us: Dict[str, int] = {}
+
+        self.__current_start_us: Optional[int] = None  # None if there is no current work activity
+        self.__current_title_work_us = 0  # work time of current activity title before it was started
+
+    @staticmethod
+    def from_holder(holder: ActivityStatHolder) -> 'SessionAccumulator':
+        accumulator = SessionAccumulator()
+        accumulator.total_work_us = DatetimeHelper.to_microseconds(holder.total_work_time)
+
+        for title, stat in holder.items():
+            accumulator.__title_work_us[title] = DatetimeHelper.to_microseconds(stat.work_time)
+
+        return accumulator
+
+    @staticmethod
+    def get_title(activity: Activity) -> str:
+        """The same title as in ActivityStatHolder"""
+        return ActivityStatHolder.get_title(activity)
+
+    def get_title_work_us(self, title: str) -> int:
+        return self.__title_work_us.get(title, 0)
+
+    def finish(self, activity: Activity, end_time: datetime) -> None:
+        """Add time of activity that is finished at end_time"""
+        self.__current_start_us = None
+
+        if not activity.is_work_time:
+            return
+
+        activity_us = DatetimeHelper.to_epoch_microseconds(end_time) \
+            - DatetimeHelper.to_epoch_microseconds(activity.start_time)
+        title = self.get_title(activity)
+
+        self.total_work_us += activity_us
+        self.__title_work_us[title] = self.__title_work_us.get(title, 0) + activity_us
+
+    def start(self, activity: Activity) -> None:
+        """Remember current activity (its application_info should be already matched)"""
+        if not activity.is_work_time:
+            self.__current_start_us = None
+            return
+
+        self.__current_start_us = DatetimeHelper.to_epoch_microseconds(activity.start_time)
+        self.__current_title_work_us = self.get_title_work_us(self.get_title(activity))
+
+    def get_work_us(self, now_us: int) -> int:
+        """Total work time including current activity"""
+        if self.__current_start_us is None:
+            return self.total_work_us
+
+        return self.total_work_us + now_us - self.__current_start_us
+
+    def get_current_title_work_us(self, now_us: int) -> int:
+        """Work time of current activity title including current activity"""
+        if self.__current_start_us is None:
+            return 0
+
+        return self.__current_title_work_us + now_us - self.__current_start_us
+
+    def get_work_limit_time_us(self, limit_us: int) -> Optional[int]:
+        """Time when total work time reaches limit_us if current activity goes on"""
+        if self.__current_start_us is None:
+            return None
+
+        return self.__current_start_us + limit_us - self.total_work_us
+
+    def get_current_title_limit_time_us(self, limit_us: int) -> Optional[int]:
+        """Time when work time of current activity title reaches limit_us if current activity goes on"""
+        if self.__current_start_us is None:
+            return None
+
+        return self.__current_start_us + limit_us - self.__current_title_work_us
@@ -2,34 +2,48 @@ import logging
 import re
 import signal
 import subprocess
+import threading
 import webbrowser
 from datetime import date, datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from random import choice
 from types import FrameType
-from typing import Any, cast, List, Optional
+from typing import Any, Callable, List, Optional
 
 from gi.repository import Gio, GLib, GObject, Gtk, Notify, Wnck
 from pyee import BaseEventEmitter
 
 from .activity import Activity
+from .activity_coalescer import ActivityCoalescer
 from .activity_reader import ActivityReader
+from .activity_splitter import ActivitySplitter
 from .activity_stat_holder import ActivityStatHolder
 from .activity_writer import ActivityWriter
 from .application_info_matcher import ApplicationInfoMatcher
 from .config_reader import ConfigReader
+from .datetime_helper import DatetimeHelper
+from .deadline_timer import DeadlineTimer
+from .day_stat_loader import load_day_stat
+from .day_stat_store import DayStatStore
 from .files_provider import FilesProvider
 from .gtk_extras import get_window_name
 from .icon_state import IconState
+from .instrumentation import instrumentation
+from .live_day_stat import LiveDayStat
 from .localizator import Localizator
 from .notification import Notification, NotificationEvent
 from .notification_emojis import BREAK_TIME_EMOJIS, DISTRACTING_NOTIFICATION_EMOJIS
+from .raw_data_compressor import RawDataCompressor
+from .session_accumulator import SessionAccumulator
 from .special_wm_class import SpecialWmClass
-from .timer import Timer
 from .tray_icon import TrayIcon
 from .value import Value
-from .x_helpers import get_wm_class
+from .wm_class_provider import WmClassProvider
+
+
+# NOTE: "remind later" interval of overtime and break notifications
+REMIND_LATER_INTERVAL = timedelta(minutes=15)
 
 
 class ApplicationEvent(Enum):
@@ -38,6 +52,9 @@ class ApplicationEvent(Enum):
 
 class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
 
+    # NOTE: bounded, because -1 means default D-Bus timeout of 25 seconds
+    DBUS_CALL_TIMEOUT_MS = 5 * 1000
+
     def __init__(self,
                  app_id: str,
                  config_reader: ConfigReader,
@@ -45,13 +62,16 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
                  application_info_matcher: ApplicationInfoMatcher,
                  activity_reader: ActivityReader,
                  files_provider: FilesProvider,
-                 localizator: Localizator) -> None:
+                 localizator: Localizator,
+                 live_day_stat: LiveDayStat) -> None:
         super().__init__()
         self.logger = logger
         self.config_reader = config_reader
 
         self.connection = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-        self.screen_saver_bus_names = self.__dbus_get_screen_saver_bus_names()
+        self.dbus_cancellable = Gio.Cancellable()
+        # NOTE: filled in asynchronously after startup
+        self.screen_saver_bus_names: List[str] = []
 
         self.files_provider = files_provider
         self.localizator = localizator
@@ -64,21 +84,17 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
         self.tray_icon = TrayIcon(app_id, self.disabled_icon, self.create_tray_menu(self.work_state_checkbox_item))
 
         self.screen: Optional[Wnck.Screen] = None
+        self.wm_class_provider = WmClassProvider(self.logger)
         self.main_loop: Optional[GObject.MainLoop] = None
         self.name_changed_handler_id = None
 
         self.previous_active_window_name: Optional[str] = None
         self.previous_wm_class: Optional[str] = None
 
-        self.overtime_timer = \
-            Timer('overtime_timer', handler=self.overtime_timer_handler,
-                  interval_ms=1 * 60 * 1000, repeat=True, logger=self.logger)
-        self.break_timer = \
-            Timer('break_timer', handler=self.break_timer_handler,
-                  interval_ms=1 * 60 * 1000, repeat=True, logger=self.logger)
-        self.distracting_app_timer = \
-            Timer('distracting_app_timer', handler=self.distracting_app_timer_handler,
-                  interval_ms=1 * 60 * 1000, repeat=True, logger=self.logger)
+        # NOTE: wakes up only when the next notification can become due
+        self.notification_timer = \
+            DeadlineTimer('notification_timer', handler=self.__on_notification_timer,
+                          max_interval=REMIND_LATER_INTERVAL, logger=self.logger)
 
         self.event = BaseEventEmitter()
 
@@ -98,16 +114,34 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
         self.user_work_time_hour_limit = config_reader.get_work_time_limit()
         self.user_breaks_interval_hours = config_reader.get_breaks_interval_hours()
         self.user_distracting_apps_mins = config_reader.get_distracting_apps_mins()
-
-        self.writer = ActivityWriter(self.files_provider)
-
+        self.user_work_time_limit_us = self.user_work_time_hour_limit * 60 * 60 * 10 ** 6
+        self.user_distracting_apps_limit_us = self.user_distracting_apps_mins * 60 * 10 ** 6
+
+        self.writer = ActivityWriter(self.files_provider,
+                                     config_reader.get_raw_data_flush_mode(),
+                                     config_reader.get_raw_data_flush_max_activities())
+        # NOTE: one-shot timer is started only when activities are pending to not to wake up when nothing is written
+        self.writer_flush_interval = timedelta(milliseconds=config_reader.get_raw_data_flush_interval_ms())
+        self.writer_flush_timer = \
+            DeadlineTimer('writer_flush_timer', handler=self.writer.flush,
+                          max_interval=self.writer_flush_interval, logger=self.logger)
+        self.writer.event.on(ActivityWriter.PENDING_EVENT, self.__on_writer_pending)
+        self.writer.event.on(ActivityWriter.FLUSH_EVENT, self.writer_flush_timer.stop)
+
+        self.coalescer = ActivityCoalescer(config_reader.get_raw_data_min_activity_ms(),
+                                           config_reader.get_raw_data_title_normalization_re())
         self.app_info_matcher = application_info_matcher
+        self.activity_reader = activity_reader
+        self.day_stat_store = DayStatStore(self.logger)
+        self.raw_data_compressor = RawDataCompressor(self.logger, config_reader.get_raw_data_compression())
 
-        today_raw_data_file_path = self.files_provider.get_raw_data_file_path(date.today())
-        self.holder = ActivityStatHolder(activity_reader.read(today_raw_data_file_path))
+        # NOTE: stats of today are shared with the report server thread as copy-on-write snapshots
+        self.live_day_stat = live_day_stat
+        self.session = SessionAccumulator()
 
-        self.holder.initialize_stats(self.app_info_matcher.detailed_app_infos)
-        self.holder.initialize_stats(self.app_info_matcher.distracting_app_infos)
+        today = date.today()
+        today_raw_data_file_path = self.files_provider.get_raw_data_file_path(today)
+        self.__start_day_stat(today, ActivityStatHolder(activity_reader.iter_read(today_raw_data_file_path)))
 
         self.current_activity: Optional[Activity] = None
 
@@ -123,36 +157,54 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
         self.logger.debug(start_msg)
         self.new_notification(msg=start_msg).show()
 
-    def __dbus_method_call(self, bus_name: str, object_path: str, interface_name: str, method_name: str) -> Any:
+    def __dbus_method_call(self, bus_name: str, object_path: str, interface_name: str, method_name: str,
+                           on_result: Optional[Callable[[Any], None]] = None,
+                           on_error: Optional[Callable[[GLib.Error], None]] = None) -> None:
         """
         D-Bus is a middleware mechanism that allows communication between
-        multiple processes running concurrently on the same machine
+        multiple processes running concurrently on the same machine.
+
+        The call is asynchronous with bounded timeout to not to block the main loop by a slow service,
+        on_result is called with the result in the main loop. Calls are cancelled when the app is stopped
         """
         if not self.connection:
             raise Exception('self.connection should be set!')
 
         no_parameters = None
         default_reply_type = None
-        default_call_timeout = -1
-        not_cancellable = None
 
-        raw_result = self.connection.call_sync(bus_name, object_path, interface_name,
-                                               method_name, no_parameters, default_reply_type,
-                                               Gio.DBusCallFlags.NONE, default_call_timeout, not_cancellable)
+        def on_call_finished(connection: Gio.DBusConnection, async_result: Gio.AsyncResult, user_data: Any) -> None:
+            try:
+                raw_result = connection.call_finish(async_result)
+            except GLib.Error as e:
+                if e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                    return
+
+                if on_error is not None:
+                    on_error(e)
+                else:
+                    self.logger.warning(f'D-Bus call [{bus_name}.{method_name}] error: [{e}]')
 
-        if raw_result:
-            result, = raw_result
+                return
 
-            return result
+            if on_result is None:
+                return
 
-        return None
+            result = None
 
-    def __dbus_get_all_bus_names(self) -> List[str]:
-        return cast(
-            List[str],
-            self.__dbus_method_call('org.freedesktop.DBus', '/org/freedesktop/DBus',
-                                    'org.freedesktop.DBus', 'ListNames')
-        )
+            if raw_result:
+                result, = raw_result
+
+            on_result(result)
+
+        self.connection.call(bus_name, object_path, interface_name,
+                             method_name, no_parameters, default_reply_type,
+                             Gio.DBusCallFlags.NONE, self.DBUS_CALL_TIMEOUT_MS, self.dbus_cancellable,
+                             on_call_finished, None)
+
+    def __dbus_request_all_bus_names(self, on_result: Callable[[List[str]], None]) -> None:
+        self.__dbus_method_call('org.freedesktop.DBus', '/org/freedesktop/DBus',
+                                'org.freedesktop.DBus', 'ListNames', on_result)
 
     def __dbus_lock_screen(self) -> None:
         """Try to lock screen with a dbus call"""
@@ -163,10 +215,10 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
 
             interface_name = f'/{bus.replace(".", "/")}'
 
-            try:
-                self.__dbus_method_call(bus, interface_name, bus, 'Lock')
-            except Exception as e:
-                self.logger.warning(f'Please ignore it if lock screen works well. Lock screen error: [{e}]')
+            self.__dbus_method_call(bus, interface_name, bus, 'Lock', on_error=self.__on_dbus_lock_screen_error)
+
+    def __on_dbus_lock_screen_error(self, error: GLib.Error) -> None:
+        self.logger.warning(f'Please ignore it if lock screen works well. Lock screen error: [{error}]')
 
     def __on_screen_saver_active_changed(self, connection: Gio.DBusConnection, sender_name: str, object_path: str,
                                          interface_name: str, signal_name: str, parameters: GLib.Variant) -> None:
@@ -193,15 +245,17 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
 
         self.__on_open_window(wm_class, window_name, now)
 
-    def __dbus_get_screen_saver_bus_names(self) -> List[str]:
-        bus_names = self.__dbus_get_all_bus_names()
-        screen_saver_re = re.compile(r'^org\..*\.ScreenSaver$')
+    def __dbus_subscribe_to_screen_saver_signals(self) -> None:
+        """Find screen saver services without blocking startup and subscribe to their signals"""
+        self.__dbus_request_all_bus_names(self.__on_dbus_bus_names_received)
 
-        return list(filter(screen_saver_re.match, bus_names))
+    def __on_dbus_bus_names_received(self, bus_names: List[str]) -> None:
+        screen_saver_re = re.compile(r'^org\..*\.ScreenSaver$')
+        self.screen_saver_bus_names = list(filter(screen_saver_re.match, bus_names))
 
-    def __dbus_subscribe_to_screen_saver_signals(self) -> None:
         if not self.screen_saver_bus_names:
-            raise Exception('self.screen_saver_bus_names should be set!')
+            self.logger.error('Screen saver D-Bus services are not found, lock screen will not be tracked!')
+            return
 
         for bus_name in self.screen_saver_bus_names:
             self.connection.signal_subscribe(None, bus_name, 'ActiveChanged', None, None,
@@ -210,12 +264,18 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
     def do_activate(self) -> None:
         """Gtk.Application must call this method to get the application up and running"""
         signal.signal(signal.SIGTERM, self.handle_sigterm)
+        signal.signal(signal.SIGUSR1, self.handle_sigusr1)
         self.screen = Wnck.Screen.get_default()
         self.screen.connect('active-window-changed', self.__on_active_window_changed)
+        self.screen.connect('window-closed', self.__on_window_closed)
         self.main_loop = GObject.MainLoop()
-        self.overtime_timer.start()
-        self.break_timer.start()
-        self.distracting_app_timer.start()
+
+        # NOTE: days that were closed while speaking-eye was not running
+        closed_raw_data_files = [
+            raw_data_file for file_date, raw_data_file in self.files_provider.iter_raw_data_files()
+            if file_date < date.today() and self.raw_data_compressor.should_compress(raw_data_file)
+        ]
+        self.__close_days_in_background(sorted(closed_raw_data_files))
 
     def __on_active_window_changed(self, screen: Wnck.Screen, previously_active_window: Gtk.Window) -> None:
         now = datetime.now()
@@ -228,7 +288,7 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
 
         if active_window:
             self.name_changed_handler_id = active_window.connect('name-changed', self.__on_name_changed)
-            wm_class = get_wm_class(active_window.get_xid())
+            wm_class = self.wm_class_provider.get(active_window)
             window_name = get_window_name(active_window)
         else:
             wm_class = SpecialWmClass.DESKTOP.value
@@ -236,6 +296,9 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
 
         self.__on_open_window(wm_class, window_name, now)
 
+    def __on_window_closed(self, screen: Wnck.Screen, window: Wnck.Window) -> None:
+        self.wm_class_provider.forget(window)
+
     def __on_open_window(self, wm_class: str, window_name: str, now: datetime) -> None:
         new_activity = Activity(wm_class, window_name, now, self.is_work_time)
 
@@ -251,13 +314,24 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
 
         self.__on_activity_changed(current_activity, new_activity)
 
+    @instrumentation.timed('speaking_eye_app.on_activity_changed')
     def __on_activity_changed(self, previous_activity: Optional[Activity], next_activity: Activity) -> None:
         now = datetime.now()
+        # NOTE: coalescer compares matched titles to not to move time between titles of report
+        self.app_info_matcher.set_if_matched(next_activity)
 
         if previous_activity is not None:
-            previous_activity.set_end_time(now)
-            self.writer.write(previous_activity)
-            self.holder.update_stat(previous_activity)
+            if self.coalescer.is_continuation(previous_activity, next_activity):
+                return
+
+            if self.coalescer.is_too_short(previous_activity, next_activity, now):
+                # NOTE: time of too short activity is given to the next activity of the same app
+                #       instead of writing it, so total time of the app does not change
+                next_activity.start_time = previous_activity.start_time
+            else:
+                previous_activity.set_end_time(now)
+                self.writer.write(previous_activity)
+                self.__update_day_stat(previous_activity, now)
 
         # NOTE: previous_activity is None when it is the first activity after starting
         previous_activity_app_name = \
@@ -265,12 +339,49 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
         self.logger.debug(f'{now}: {previous_activity_app_name} -> '
                           f'{next_activity.wm_class}|{next_activity.window_name}')
 
-        self.app_info_matcher.set_if_matched(next_activity)
+        self.session.start(next_activity)
 
         self.current_activity = next_activity
         # NOTE: for reshowing notification when open distracting app once more time
         self.has_distracting_app_overtime_notification_shown = False
 
+        self.__schedule_notifications()
+
+    def __on_writer_pending(self) -> None:
+        now = datetime.now()
+        self.writer_flush_timer.schedule(now + self.writer_flush_interval, now)
+
+    def __start_day_stat(self, day: date, holder: ActivityStatHolder) -> None:
+        holder.initialize_stats(self.app_info_matcher.detailed_app_infos)
+        holder.initialize_stats(self.app_info_matcher.distracting_app_infos)
+
+        self.live_day_stat.reset(day, holder)
+        # NOTE: running totals for notifications to not to compute them from holder
+        self.session = SessionAccumulator.from_holder(holder)
+
+    def __update_day_stat(self, activity: Activity, end_time: datetime) -> None:
+        """Add finished activity to stats of its day (its part after midnight starts stats of the next day)"""
+        day_activities = ActivitySplitter.split_by_day(activity)
+
+        for day, day_activity in day_activities:
+            current_day = self.live_day_stat.day
+
+            # NOTE: stats of the closed days are already written to their files
+            if current_day is not None and day < current_day:
+                continue
+
+            if day != current_day:
+                self.__start_day_stat(day, ActivityStatHolder([]))
+
+            if len(day_activities) > 1:
+                # NOTE: parts of activity are new Activity objects without ApplicationInfo
+                self.app_info_matcher.set_if_matched(day_activity)
+
+            self.live_day_stat.update_stat(day_activity)
+
+        _, last_day_activity = day_activities[-1]
+        self.session.finish(last_day_activity, end_time)
+
     def start_main_loop(self) -> None:
         try:
             self.main_loop.run()  # type: ignore[union-attr]
@@ -289,11 +400,17 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
         work_time_msg = self.localizator.get('notification.work_time', work_time=work_time)
 
         self.logger.debug(f'{finish_msg}\n{work_time_msg}')
+        self.logger.debug(f'ApplicationInfoMatcher cache: [{self.app_info_matcher.cache_info()}]')
+
+        self.notification_timer.stop()
+        self.writer_flush_timer.stop()
+        self.writer.close()
+        self.dbus_cancellable.cancel()
 
         self.logger.info('              title |          work_time |            off_time')
         self.logger.info('--------------------------------------------------------------')
 
-        for holder_item in self.holder.items():
+        for holder_item in self.live_day_stat.holder.items():
             title, stat = holder_item
 
             padded_title = title.rjust(19, ' ')
@@ -357,6 +474,9 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
             self.last_break_notification = None
             self.last_overtime_notification = None
 
+        # NOTE: notifications are scheduled after their state is reset to not to use times of the previous work
+        self.__schedule_notifications()
+
     def on_work_state_checkbox_item_click(self, menu_item: Gtk.CheckMenuItem) -> None:
         """Reverse work time state"""
         self.set_work_time_state(not self.is_work_time)
@@ -398,6 +518,7 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
 
     def __on_overtime_notification_closed(self) -> None:
         self.is_overtime_notification_allowed_to_show = True
+        self.__schedule_notifications()
 
     def __on_finish_work_action_clicked(self) -> None:
         self.set_work_time_state(False)
@@ -442,6 +563,7 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
 
     def __on_break_notification_closed(self) -> None:
         self.is_break_notification_allowed_to_show = True
+        self.__schedule_notifications()
 
     def show_break_notification(self) -> None:
         emoji = choice(BREAK_TIME_EMOJIS)
@@ -462,8 +584,27 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
         self.last_break_notification = notification
         self.is_break_notification_allowed_to_show = False
 
-    def __on_new_day_started(self) -> None:
-        """Reset work time state"""
+    @instrumentation.timed('speaking_eye_app.close_day')
+    def __close_day(self, raw_data_file: Path) -> None:
+        """Compress file of the closed day & store its aggregate to not to parse it for reports"""
+        try:
+            raw_data_file = self.raw_data_compressor.compress(raw_data_file)
+            load_day_stat(self.activity_reader, self.day_stat_store, raw_data_file, is_closed=True)
+        except Exception:
+            self.logger.exception(f'Could not close day [{raw_data_file}]')
+
+    def __close_days(self, raw_data_files: List[Path]) -> None:
+        for raw_data_file in raw_data_files:
+            self.__close_day(raw_data_file)
+
+    def __close_days_in_background(self, raw_data_files: List[Path]) -> None:
+        # NOTE: compression of the whole day takes time, so it is done not in the main loop
+        threading.Thread(target=self.__close_days, args=(raw_data_files,), name='close_days', daemon=True).start()
+
+    def __on_new_day_started(self, closed_raw_data_file: Path) -> None:
+        """Reset work time state & close the previous day"""
+        self.__close_days_in_background([closed_raw_data_file])
+
         open_new_file_msg = self.localizator.get('notification.new_day')
 
         self.logger.debug(open_new_file_msg)
@@ -474,6 +615,10 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
     def handle_sigterm(self, signal_number: int, frame: FrameType) -> None:
         self.stop()
 
+    def handle_sigusr1(self, signal_number: int, frame: Optional[FrameType]) -> None:
+        """Dump instrumentation stats (e.g. kill -USR1 $(pgrep -f speaking_eye))"""
+        self.logger.info(f'Instrumentation stats:\n{instrumentation.format()}')
+
     def __need_to_show_overtime_notification(self) -> bool:
         if not self.is_work_time:
             return False
@@ -482,10 +627,8 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
             return False
 
         now = datetime.now()
-        current_activity = Value.get_or_raise(self.current_activity, 'current_activity')
-        seconds_in_current_activity = (now - current_activity.start_time).total_seconds()
-        total_work_time_seconds = seconds_in_current_activity + self.holder.total_work_time.total_seconds()
-        is_overtime_started = total_work_time_seconds >= self.user_work_time_hour_limit * 60 * 60
+        now_us = DatetimeHelper.to_epoch_microseconds(now)
+        is_overtime_started = self.session.get_work_us(now_us) >= self.user_work_time_limit_us
 
         if not is_overtime_started:
             return False
@@ -499,12 +642,29 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
         if not self.is_overtime_notification_allowed_to_show:
             return False
 
-        seconds_from_last_notification = (now - self.last_overtime_notification.last_shown).total_seconds()
-        interval_seconds = 15 * 60
+        return now - self.last_overtime_notification.last_shown >= REMIND_LATER_INTERVAL
 
-        return seconds_from_last_notification >= interval_seconds
+    def __get_overtime_notification_time(self) -> Optional[datetime]:
+        """The first time when __need_to_show_overtime_notification() can become True"""
+        if not self.is_work_time or self.is_lock_screen_activated:
+            return None
 
-    def overtime_timer_handler(self) -> None:
+        overtime_start_time_us = self.session.get_work_limit_time_us(self.user_work_time_limit_us)
+
+        if overtime_start_time_us is None:
+            return None
+
+        overtime_start_time = DatetimeHelper.from_epoch_microseconds(overtime_start_time_us)
+
+        if self.last_overtime_notification is None or self.last_overtime_notification.last_shown is None:
+            return overtime_start_time
+
+        if not self.is_overtime_notification_allowed_to_show:
+            return None
+
+        return max(overtime_start_time, self.last_overtime_notification.last_shown + REMIND_LATER_INTERVAL)
+
+    def check_overtime_notification(self) -> None:
         if not self.__need_to_show_overtime_notification():
             return
 
@@ -532,19 +692,33 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
             start_work_time
         )
 
-        if (now - last_break_reminder_time).total_seconds() < 15 * 60:
+        if now - last_break_reminder_time < REMIND_LATER_INTERVAL:
             return False
 
         return True
 
-    def break_timer_handler(self) -> None:
+    def __get_break_notification_time(self) -> Optional[datetime]:
+        """The first time when __need_to_show_break_notification() can become True"""
+        if not self.is_work_time or self.is_lock_screen_activated or not self.is_break_notification_allowed_to_show:
+            return None
+
+        start_work_time = self.is_work_time_update_time
+        last_break_time = self.last_lock_screen_time if self.last_lock_screen_time else start_work_time
+        last_break_reminder_time = Value.get_by_getter_or_default(
+            lambda: self.last_break_notification.last_shown,  # type: ignore[union-attr]
+            start_work_time
+        )
+
+        return max(last_break_time + timedelta(hours=self.user_breaks_interval_hours),
+                   last_break_reminder_time + REMIND_LATER_INTERVAL)
+
+    def check_break_notification(self) -> None:
         if not self.__need_to_show_break_notification():
             return
 
         self.show_break_notification()
 
-    def distracting_app_timer_handler(self) -> None:
-        # TODO: ⚡️ run this timer only if work started
+    def check_distracting_app_notification(self) -> None:
         if not self.is_work_time:
             return
 
@@ -562,17 +736,55 @@ class SpeakingEyeApp(Gtk.Application):  # type: ignore[misc]
         if not application_info.is_distracting:
             return
 
-        now = datetime.now()
-        current_stats = self.holder[application_info.title]
-        total_distracting_time = now - current_activity.start_time + current_stats.work_time
+        now_us = DatetimeHelper.to_epoch_microseconds(datetime.now())
+        total_distracting_us = self.session.get_current_title_work_us(now_us)
 
-        if total_distracting_time.total_seconds() < self.user_distracting_apps_mins * 60:
+        if total_distracting_us < self.user_distracting_apps_limit_us:
             return
 
-        self.event.emit(ApplicationEvent.DISTRACTING_APP_OVERTIME.value, application_info.title, total_distracting_time)
+        self.event.emit(ApplicationEvent.DISTRACTING_APP_OVERTIME.value, application_info.title,
+                        timedelta(microseconds=total_distracting_us))
 
         self.has_distracting_app_overtime_notification_shown = True
 
+    def __get_distracting_app_notification_time(self) -> Optional[datetime]:
+        """The first time when check_distracting_app_notification() can emit DISTRACTING_APP_OVERTIME"""
+        if not self.is_work_time or self.has_distracting_app_overtime_notification_shown:
+            return None
+
+        if self.current_activity is None:
+            return None
+
+        application_info = self.current_activity.application_info
+
+        if application_info is None or not application_info.is_distracting:
+            return None
+
+        distracting_limit_time_us = self.session.get_current_title_limit_time_us(self.user_distracting_apps_limit_us)
+
+        return None if distracting_limit_time_us is None \
+            else DatetimeHelper.from_epoch_microseconds(distracting_limit_time_us)
+
+    def __schedule_notifications(self) -> None:
+        """Sleep until the nearest time when any notification can be shown"""
+        notification_times = [
+            self.__get_overtime_notification_time(),
+            self.__get_break_notification_time(),
+            self.__get_distracting_app_notification_time(),
+        ]
+
+        self.notification_timer.schedule(min((notification_time for notification_time in notification_times
+                                              if notification_time is not None), default=None),
+                                         datetime.now())
+
+    @instrumentation.timed('speaking_eye_app.on_notification_timer')
+    def __on_notification_timer(self) -> None:
+        self.check_overtime_notification()
+        self.check_break_notification()
+        self.check_distracting_app_notification()
+
+        self.__schedule_notifications()
+
     def get_icon(self, icon_state: IconState) -> Path:
         if not self.theme:
             raise Exception('self.theme should be set!')
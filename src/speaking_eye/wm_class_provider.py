@@ -0,0 +1,50 @@
+import logging
+from typing import Dict, Optional, cast
+
+from gi.repository import Wnck
+
+from .instrumentation import instrumentation
+from .x_helpers import get_wm_class
+
+
+class WmClassProvider:
+    """
+    Get WM_CLASS of windows in process using Wnck (the same value as the class part of xprop WM_CLASS output).
+    xprop is used only if Wnck has no class for the window.
+    Results are cached per XID and should be forgotten when the window is closed
+    because X server can reuse XIDs of closed windows
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+        self.__wm_classes: Dict[int, str] = {}
+
+    @staticmethod
+    def __get_from_wnck(window: Wnck.Window) -> Optional[str]:
+        class_group_name = cast(Optional[str], window.get_class_group_name())
+
+        return class_group_name if class_group_name else None
+
+    def get(self, window: Wnck.Window) -> str:
+        xid = cast(int, window.get_xid())
+        wm_class = self.__wm_classes.get(xid)
+
+        if wm_class is not None:
+            instrumentation.count('wm_class_provider.cache_hits')
+
+            return wm_class
+
+        wm_class = self.__get_from_wnck(window)
+
+        if wm_class is None:
+            self.logger.debug(f'Wnck has no WM_CLASS for window [{xid}], xprop will be used')
+
+            with instrumentation.measure('wm_class_provider.xprop'):
+                wm_class = get_wm_class(xid)
+
+        self.__wm_classes[xid] = wm_class
+
+        return wm_class
+
+    def forget(self, window: Wnck.Window) -> None:
+        self.__wm_classes.pop(cast(int, window.get_xid()), None)
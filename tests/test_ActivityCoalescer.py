@@ -0,0 +1,58 @@
+import unittest
+from datetime import datetime, timedelta
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_coalescer import ActivityCoalescer
+from speaking_eye.application_info import ApplicationInfo
+
+
+class ActivityCoalescerTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.start_time = datetime(2021, 7, 4, 9)
+        self.coalescer = ActivityCoalescer(min_activity_ms=1000, title_normalization_re=r'^\(\d+\) |\d+%')
+
+    def test_wrong_min_activity_ms(self) -> None:
+        with self.assertRaisesRegex(ValueError, expected_regex='min_activity_ms \\[-1\\] should not be negative!'):
+            ActivityCoalescer(min_activity_ms=-1, title_normalization_re='')
+
+    def test_normalize_title(self) -> None:
+        self.assertEqual('Slack | general', self.coalescer.normalize_title('(12) Slack | general'))
+        self.assertEqual('Downloading  - Firefox', self.coalescer.normalize_title('Downloading 42% - Firefox'))
+        self.assertEqual('(12) Slack', ActivityCoalescer(0, '').normalize_title('(12) Slack'))
+
+    def test_is_continuation(self) -> None:
+        previous_activity = Activity('Slack', '(1) Slack | general', self.start_time, True)
+
+        self.assertTrue(self.coalescer.is_continuation(
+            previous_activity, Activity('Slack', '(2) Slack | general', self.start_time, True)))
+        self.assertFalse(self.coalescer.is_continuation(
+            previous_activity, Activity('Slack', '(2) Slack | random', self.start_time, True)))
+        self.assertFalse(self.coalescer.is_continuation(
+            previous_activity, Activity('Slack', '(1) Slack | general', self.start_time, False)))
+        self.assertFalse(self.coalescer.is_continuation(
+            previous_activity, Activity('Telegram', '(1) Slack | general', self.start_time, True)))
+
+    def test_is_too_short(self) -> None:
+        previous_activity = Activity('Chromium', 'Tab 1', self.start_time, True)
+        next_activity = Activity('Chromium', 'Tab 2', self.start_time, True)
+
+        self.assertTrue(self.coalescer.is_too_short(
+            previous_activity, next_activity, self.start_time + timedelta(milliseconds=999)))
+        self.assertFalse(self.coalescer.is_too_short(
+            previous_activity, next_activity, self.start_time + timedelta(milliseconds=1000)))
+        self.assertFalse(self.coalescer.is_too_short(
+            previous_activity, Activity('Firefox', 'Tab 2', self.start_time, True), self.start_time))
+        self.assertFalse(ActivityCoalescer(0, '').is_too_short(previous_activity, next_activity, self.start_time))
+
+    def test_is_too_short_with_another_title(self) -> None:
+        previous_activity = Activity('Chromium', 'YouTube', self.start_time, True)
+        previous_activity.set_application_info(ApplicationInfo('YouTube', 'Chromium', 'YouTube', True))
+        next_activity = Activity('Chromium', 'GitHub', self.start_time, True)
+        next_activity.set_application_info(ApplicationInfo('GitHub', 'Chromium', 'GitHub', False))
+
+        self.assertFalse(self.coalescer.is_too_short(previous_activity, next_activity, self.start_time))
+        self.assertFalse(self.coalescer.is_continuation(previous_activity, next_activity))
+
+        next_activity.set_application_info(ApplicationInfo('YouTube', 'Chromium', 'YouTube', True))
+        self.assertTrue(self.coalescer.is_too_short(previous_activity, next_activity, self.start_time))
@@ -0,0 +1,90 @@
+import logging
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_converter import ActivityConverter
+from speaking_eye.activity_day_cache import ActivityDayCache, DayColumnsBuilder
+
+
+class ActivityDayCacheTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.raw_data_file = Path(self.tmp_dir.name) / '2021-07-04_speaking_eye_raw_data.tsv'
+        self.activities = [
+            Activity('wm_name1', 'tab1', datetime(2021, 7, 4, 20, 30, 0, 1), True)
+            .set_end_time(datetime(2021, 7, 4, 21, 30, 0, 2)),
+            Activity('wm_name2', 'вкладка 2', datetime(2021, 7, 4, 21, 30, 0, 3), False)
+            .set_end_time(datetime(2021, 7, 4, 21, 35)),
+            Activity('wm_name1', 'tab1', datetime(2021, 7, 4, 21, 35), True)
+            .set_end_time(datetime(2021, 7, 4, 21, 35)),
+        ]
+
+        with open(str(self.raw_data_file), 'w') as file:
+            file.writelines(ActivityConverter.to_string(activity) for activity in self.activities)
+
+        self.cache = ActivityDayCache(logging.Logger('ActivityDayCacheTestCase'))
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_when_cache_does_not_exist(self) -> None:
+        self.assertIsNone(self.cache.load(self.raw_data_file))
+
+    def dump(self, activities) -> None:
+        columns_builder = DayColumnsBuilder()
+
+        for activity in activities:
+            columns_builder.append(activity)
+
+        self.cache.dump(self.raw_data_file, columns_builder.build(), self.raw_data_file.stat())
+
+    def test_when_dump_and_load(self) -> None:
+        self.dump(self.activities)
+
+        cache_file = ActivityDayCache.get_cache_file_path(self.raw_data_file)
+        self.assertEqual(cache_file.name, '.2021-07-04_speaking_eye_raw_data.tsv.cache')
+        self.assertTrue(cache_file.exists())
+
+        columns = self.cache.load_columns(self.raw_data_file)
+        self.assertIsNotNone(columns)
+        self.assertEqual(len(columns), 3)
+        self.assertListEqual(columns.strings, ['wm_name1', 'tab1', 'wm_name2', 'вкладка 2'])
+        self.assertListEqual(list(columns.wm_class_ids), [0, 2, 0])
+        self.assertListEqual(list(columns.window_name_ids), [1, 3, 1])
+        self.assertListEqual(list(columns.is_work_time_flags), [1, 0, 1])
+
+        self.assertListEqual(self.cache.load(self.raw_data_file), self.activities)
+
+    def test_when_dump_and_load_empty_day(self) -> None:
+        self.dump([])
+        self.assertListEqual(self.cache.load(self.raw_data_file), [])
+
+    def test_when_raw_data_file_changed(self) -> None:
+        self.dump(self.activities)
+
+        with open(str(self.raw_data_file), 'a') as file:
+            file.write(ActivityConverter.to_string(self.activities[0]))
+
+        self.assertIsNone(self.cache.load(self.raw_data_file))
+
+    def test_when_raw_data_file_touched(self) -> None:
+        self.dump(self.activities)
+
+        stat = self.raw_data_file.stat()
+        os.utime(str(self.raw_data_file), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        self.assertIsNone(self.cache.load(self.raw_data_file))
+
+    def test_when_cache_is_broken(self) -> None:
+        self.dump(self.activities)
+
+        cache_file = ActivityDayCache.get_cache_file_path(self.raw_data_file)
+        with open(str(cache_file), 'r+b') as file:
+            file.truncate(cache_file.stat().st_size - 10)
+
+        self.assertIsNone(self.cache.load(self.raw_data_file))
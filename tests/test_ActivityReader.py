@@ -1,10 +1,12 @@
 import logging
+import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
 from speaking_eye.activity import Activity
+from speaking_eye.activity_day_cache import ActivityDayCache
 from speaking_eye.activity_reader import ActivityReader
 from speaking_eye.application_info import ApplicationInfo
 from speaking_eye.application_info_matcher import ApplicationInfoMatcher
@@ -34,7 +36,7 @@ class ActivityReaderTestCase(unittest.TestCase):
         result_activities = self.reader.read(raw_data_file)
 
         self.assertEqual(mock_exists_res.call_count, 1)
-        mock_open_res.assert_called_once_with(str(raw_data_file))
+        mock_open_res.assert_called_once_with(str(raw_data_file), 'rt')
 
         expected_activities = [
             Activity('wm_name1', 'tab1', datetime(2021, 7, 4, 20, 30, 0, 1), True)
@@ -51,3 +53,20 @@ class ActivityReaderTestCase(unittest.TestCase):
         raw_data_file = Path('/non_existent_output_dir/non_existent_file.tsv')
         result_activities = self.reader.read(raw_data_file)
         self.assertListEqual(result_activities, [])
+
+    def test_when_read_with_day_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            raw_data_file = Path(tmp_dir) / '2021-07-04_speaking_eye_raw_data.tsv'
+
+            with open(str(raw_data_file), 'w') as file:
+                file.writelines(self.read_data)
+
+            day_cache = ActivityDayCache(logging.Logger('ActivityReaderTestCase'))
+            reader = ActivityReader(self.reader.logger, self.reader.matcher, day_cache)
+
+            activities_from_file = reader.read(raw_data_file)
+            self.assertIsNotNone(day_cache.load_columns(raw_data_file))
+
+            activities_from_cache = list(reader.iter_read(raw_data_file))
+            self.assertListEqual(activities_from_cache, activities_from_file)
+            self.assertEqual(activities_from_cache[1].application_info, self.reader.matcher.detailed_app_infos[0])
@@ -58,3 +58,9 @@ class ActivityStatTestCase(unittest.TestCase):
 
                 self.assertEqual(activity_stat.work_time, work_time)
                 self.assertEqual(activity_stat.off_time, off_time)
+
+    def test_when_merge(self) -> None:
+        activity_stat = ActivityStat(timedelta(hours=1), timedelta(minutes=5))
+        activity_stat.merge(ActivityStat(timedelta(minutes=30), timedelta(minutes=10)))
+
+        self.assertEqual(activity_stat, ActivityStat(timedelta(hours=1, minutes=30), timedelta(minutes=15)))
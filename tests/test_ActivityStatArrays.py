@@ -0,0 +1,84 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_day_cache import DayColumnsBuilder
+from speaking_eye.activity_stat_arrays import ActivityStatArrays
+from speaking_eye.activity_stat_holder import ActivityStatHolder
+from speaking_eye.application_info import ApplicationInfo
+from speaking_eye.application_info_matcher import ApplicationInfoMatcher
+from speaking_eye.special_application_info_title import SpecialApplicationInfoTitle
+
+
+class ActivityStatArraysTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.matcher = ApplicationInfoMatcher(
+            [
+                ApplicationInfo('Development', 'Code|Terminal', '', False),
+                ApplicationInfo(SpecialApplicationInfoTitle.BREAK_TIME.value, 'Lock', '', False),
+            ],
+            [ApplicationInfo('Social', 'Chromium', 'Twitter|Facebook', True)],
+        )
+
+    def get_holder(self, activities) -> ActivityStatHolder:
+        for activity in activities:
+            self.matcher.set_if_matched(activity)
+
+        return ActivityStatHolder(activities)
+
+    def get_arrays(self, activities) -> ActivityStatArrays:
+        columns_builder = DayColumnsBuilder()
+
+        for activity in activities:
+            columns_builder.append(activity)
+
+        return ActivityStatArrays.from_columns(columns_builder.build(), self.matcher)
+
+    def assert_equal_to_holder(self, activities) -> None:
+        arrays = self.get_arrays(activities)
+        holder = self.get_holder(activities)
+        arrays_holder = arrays.to_holder()
+
+        self.assertEqual(list(holder.items()), list(arrays_holder.items()))
+        self.assertEqual(holder.total_work_time, arrays_holder.total_work_time)
+        self.assertEqual(holder.total_off_time, arrays_holder.total_off_time)
+        self.assertEqual(holder.has_work_activities, arrays_holder.has_work_activities)
+
+    def test_when_no_activities(self) -> None:
+        arrays = self.get_arrays([])
+
+        self.assertEqual([], arrays.titles)
+        self.assertEqual(0, arrays.total_work_us)
+        self.assertFalse(arrays.has_work_activities)
+        self.assert_equal_to_holder([])
+
+    def test_when_only_off_time(self) -> None:
+        start_time = datetime(2021, 7, 4, 9)
+        activities = [Activity('Code', 'main.py', start_time, is_work_time=False)
+                      .set_end_time(start_time + timedelta(minutes=5))]
+
+        arrays = self.get_arrays(activities)
+
+        self.assertEqual(['Development'], arrays.titles)
+        self.assertEqual(0, arrays.total_work_us)
+        self.assertEqual(5 * 60 * 10 ** 6, arrays.total_off_us)
+        self.assertFalse(arrays.has_work_activities)
+        self.assert_equal_to_holder(activities)
+
+    def test_equal_to_holder(self) -> None:
+        random.seed(42)
+        windows = [('Chromium', 'Twitter - Chromium'), ('Chromium', 'Docs - Chromium'), ('Code', 'main.py'),
+                   ('Terminal', 'bash'), ('Lock', ''), ('Slack', 'general'), ('Chromium', 'Facebook')]
+        start_time = datetime(2021, 7, 4, 9)
+        activities = []
+
+        for _ in range(5000):
+            wm_class, window_name = random.choice(windows)
+            end_time = start_time + timedelta(microseconds=random.randint(0, 10 ** 8))
+            activities.append(Activity(wm_class, window_name, start_time, random.random() < 0.8)
+                              .set_end_time(end_time))
+            start_time = end_time
+
+        self.assert_equal_to_holder(activities)
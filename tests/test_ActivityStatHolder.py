@@ -92,3 +92,64 @@ class ActivityStatHolderTestCase(unittest.TestCase):
 
         holder.update_stat(next_ordinary_activity)
         self.assertEqual(holder['title1'], ActivityStat(timedelta(hours=1, minutes=20), timedelta()))
+
+    def test_when_create_holder_from_iterator(self) -> None:
+        holder = ActivityStatHolder(activity for activity in self.activities.values())
+        self.assertEqual(holder.total_work_time, timedelta(hours=1, minutes=5))
+        self.assertEqual(holder.total_off_time, timedelta(hours=2))
+        self.assertTrue(holder.has_work_activities)
+
+    def test_when_has_no_work_activities(self) -> None:
+        self.assertFalse(ActivityStatHolder([]).has_work_activities)
+        self.assertFalse(ActivityStatHolder([self.activities['not_working_activity']]).has_work_activities)
+
+    def test_when_merge(self) -> None:
+        holder = ActivityStatHolder([self.activities['ordinary_activity']])
+        holder.merge(ActivityStatHolder([self.activities['not_working_activity']]))
+        holder.merge(ActivityStatHolder([self.activities['ordinary_activity'],
+                                         self.activities['distracting_activity']]))
+
+        self.assertEqual(holder.total_work_time, timedelta(hours=2, minutes=5))
+        self.assertEqual(holder.total_off_time, timedelta(hours=2))
+        self.assertTrue(holder.has_work_activities)
+
+        self.assertEqual(len(holder), 3)
+        self.assertEqual(holder['title1'], ActivityStat(timedelta(hours=2), timedelta()))
+        self.assertEqual(holder['title2'], ActivityStat(timedelta(minutes=5), timedelta()))
+        self.assertEqual(holder[SpecialApplicationInfoTitle.OTHERS.value],
+                         ActivityStat(timedelta(), timedelta(hours=2)))
+
+    def test_when_add(self) -> None:
+        first_holder = ActivityStatHolder([self.activities['ordinary_activity']])
+        second_holder = ActivityStatHolder([self.activities['not_working_activity']])
+
+        holder = first_holder + second_holder
+        self.assertEqual(holder.total_work_time, timedelta(hours=1))
+        self.assertEqual(holder.total_off_time, timedelta(hours=2))
+        self.assertEqual(len(holder), 2)
+
+        # NOTE: operands are not changed
+        self.assertEqual(first_holder.total_off_time, timedelta())
+        self.assertEqual(len(first_holder), 1)
+
+        holder += first_holder
+        self.assertEqual(holder.total_work_time, timedelta(hours=2))
+        self.assertEqual(holder['title1'], ActivityStat(timedelta(hours=2), timedelta()))
+        self.assertEqual(first_holder['title1'], ActivityStat(timedelta(hours=1), timedelta()))
+
+    def test_when_copy_with_stat(self) -> None:
+        holder = ActivityStatHolder([self.activities['ordinary_activity'], self.activities['distracting_activity']])
+
+        next_holder = holder.copy_with_stat(self.activities['ordinary_activity'])
+        self.assertEqual(next_holder.total_work_time, timedelta(hours=2, minutes=5))
+        self.assertEqual(next_holder['title1'], ActivityStat(timedelta(hours=2), timedelta()))
+        self.assertIs(next_holder['title2'], holder['title2'])
+
+        next_holder = next_holder.copy_with_stat(self.activities['not_working_activity'])
+        self.assertEqual(next_holder.total_off_time, timedelta(hours=2))
+        self.assertEqual(len(next_holder), 3)
+
+        # NOTE: the original holder is not changed
+        self.assertEqual(holder.total_work_time, timedelta(hours=1, minutes=5))
+        self.assertEqual(holder['title1'], ActivityStat(timedelta(hours=1), timedelta()))
+        self.assertEqual(len(holder), 2)
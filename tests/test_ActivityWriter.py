@@ -1,11 +1,14 @@
+import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import call, patch, Mock, mock_open
 
 from speaking_eye.activity import Activity
+from speaking_eye.activity_reader import ActivityReader
 from speaking_eye.activity_writer import ActivityWriter
 from speaking_eye.files_provider import FilesProvider
+from speaking_eye.flush_mode import FlushMode
 
 
 class ActivityWriterTestCase(unittest.TestCase):
@@ -156,7 +159,7 @@ class ActivityWriterTestCase(unittest.TestCase):
         writer.write(second_activity)
 
         self.assertEqual(4, mock_is_dir_res.call_count)
-        handle_new_day_event.assert_called_once()
+        handle_new_day_event.assert_called_once_with(Path('/root_dir/speaky/data/2020-07-21_speaking_eye_raw_data.tsv'))
         mock_file.close.assert_called_once()
 
         self.assertEqual(
@@ -208,3 +211,140 @@ class ActivityWriterTestCase(unittest.TestCase):
         ])
 
         self.assertEqual(2, handle_new_day_event.call_count)
+
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('pathlib.Path.is_dir', return_value=True)
+    @patch('pathlib.Path.mkdir')
+    def test_batched_write(self, mock_mkdir_res, mock_is_dir_res, mock_open_res) -> None:
+        files_provider = FilesProvider(Path('/root_dir/'), self.app_id)
+        writer = ActivityWriter(files_provider, FlushMode.BATCHED, flush_max_activities=2)
+
+        second_activity = Activity('wm_class2',
+                                   'window_name2',
+                                   datetime(2020, 7, 21, 22, 30, 0, 2),
+                                   is_work_time=True).set_end_time(datetime(2020, 7, 21, 22, 30, 0, 8))
+
+        writer.write(self.activity)
+
+        mock_file = mock_open_res.return_value
+
+        mock_file.write.assert_not_called()
+        mock_file.flush.assert_not_called()
+
+        writer.write(second_activity)
+
+        mock_file.write.assert_called_once_with(
+            '2020-07-21 20:30:00.000001\t2020-07-21 21:30:00.000002\t1:00:00.000001\twm_class1\twindow_name1\tTrue\n'
+            '2020-07-21 22:30:00.000002\t2020-07-21 22:30:00.000008\t0:00:00.000006\twm_class2\twindow_name2\tTrue\n')
+        mock_file.flush.assert_called_once()
+
+        writer.write(self.activity)
+        writer.flush()
+        writer.flush()  # nothing to write
+
+        self.assertEqual(2, mock_file.write.call_count)
+        self.assertEqual(2, mock_file.flush.call_count)
+        mock_file.close.assert_not_called()
+
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('pathlib.Path.is_dir', return_value=True)
+    @patch('pathlib.Path.mkdir')
+    def test_batched_write_events(self, mock_mkdir_res, mock_is_dir_res, mock_open_res) -> None:
+        files_provider = FilesProvider(Path('/root_dir/'), self.app_id)
+        writer = ActivityWriter(files_provider, FlushMode.BATCHED, flush_max_activities=3)
+
+        handle_pending_event = Mock()
+        handle_flush_event = Mock()
+
+        writer.event.on(ActivityWriter.PENDING_EVENT, handle_pending_event)
+        writer.event.on(ActivityWriter.FLUSH_EVENT, handle_flush_event)
+
+        writer.flush()  # nothing to write
+        handle_flush_event.assert_not_called()
+
+        writer.write(self.activity)
+        writer.write(self.activity)
+
+        # NOTE: only the first pending activity starts flush timer
+        handle_pending_event.assert_called_once_with()
+        handle_flush_event.assert_not_called()
+
+        writer.write(self.activity)
+
+        handle_flush_event.assert_called_once_with()
+
+        writer.write(self.activity)
+        writer.flush()
+
+        self.assertEqual(2, handle_pending_event.call_count)
+        self.assertEqual(2, handle_flush_event.call_count)
+
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('pathlib.Path.is_dir', return_value=True)
+    @patch('pathlib.Path.mkdir')
+    def test_batched_write_when_new_day_started_and_closed(self, mock_mkdir_res, mock_is_dir_res,
+                                                           mock_open_res) -> None:
+        files_provider = FilesProvider(Path('/root_dir/'), self.app_id)
+        writer = ActivityWriter(files_provider, FlushMode.BATCHED, flush_max_activities=100)
+
+        handle_new_day_event = Mock()
+
+        writer.event.on(ActivityWriter.NEW_DAY_EVENT, handle_new_day_event)
+
+        next_day_activity = Activity('wm_class2',
+                                     'window_name2',
+                                     datetime(2020, 7, 22, 0, 0, 0, 2),
+                                     is_work_time=True).set_end_time(datetime(2020, 7, 22, 0, 30, 0, 8))
+
+        writer.write(self.activity)
+        writer.write(next_day_activity)
+
+        handle_new_day_event.assert_called_once_with(Path('/root_dir/speaky/data/2020-07-21_speaking_eye_raw_data.tsv'))
+
+        writer.close()
+        writer.close()  # already closed
+
+        mock_open_res.assert_has_calls([
+            call('/root_dir/speaky/data/2020-07-21_speaking_eye_raw_data.tsv', 'a'),
+            call().write('2020-07-21 20:30:00.000001\t2020-07-21 21:30:00.000002\t'
+                         '1:00:00.000001\twm_class1\twindow_name1\tTrue\n'),
+            call().flush(),
+            call().close(),
+            call('/root_dir/speaky/data/2020-07-22_speaking_eye_raw_data.tsv', 'a'),
+            call().write('2020-07-22 00:00:00.000002\t2020-07-22 00:30:00.000008\t'
+                         '0:30:00.000006\twm_class2\twindow_name2\tTrue\n'),
+            call().flush(),
+            call().close(),
+        ])
+
+    def test_wrong_flush_max_activities(self) -> None:
+        with self.assertRaisesRegex(ValueError, expected_regex='flush_max_activities \\[0\\] should be positive!'):
+            ActivityWriter(Mock(), FlushMode.BATCHED, flush_max_activities=0)
+
+    def test_write_binary_raw_data(self) -> None:
+        with tempfile.TemporaryDirectory() as raw_data_dir:
+            files_provider = Mock()
+            files_provider.get_raw_data_file_path = \
+                lambda day: Path(raw_data_dir) / f'{day}_speaking_eye_raw_data.bin'
+
+            next_day_activity = Activity('wm_class2',
+                                         'window_name2',
+                                         datetime(2020, 7, 22, 0, 0, 0, 2),
+                                         is_work_time=False).set_end_time(datetime(2020, 7, 22, 0, 30, 0, 8))
+
+            writer = ActivityWriter(files_provider, FlushMode.BATCHED, flush_max_activities=100)
+            writer.write(self.activity)
+            writer.write(next_day_activity)
+            writer.close()
+
+            # NOTE: the file is continued after restart
+            writer = ActivityWriter(files_provider)
+            writer.write(next_day_activity)
+            writer.close()
+
+            first_day_file = Path(raw_data_dir) / '2020-07-21_speaking_eye_raw_data.bin'
+            second_day_file = Path(raw_data_dir) / '2020-07-22_speaking_eye_raw_data.bin'
+
+            self.assertEqual([self.activity], list(ActivityReader.iter_raw_data_file(first_day_file)))
+            self.assertEqual([next_day_activity, next_day_activity],
+                             list(ActivityReader.iter_raw_data_file(second_day_file)))
@@ -0,0 +1,98 @@
+import re
+import unittest
+from datetime import datetime
+from typing import List, Optional
+
+from speaking_eye.activity import Activity
+from speaking_eye.application_info import ApplicationInfo
+from speaking_eye.application_info_matcher import ApplicationInfoMatcher
+
+
+def find_naively(app_infos: List[ApplicationInfo], wm_class: str, window_name: str) -> Optional[ApplicationInfo]:
+    """Reference implementation: check all infos in order with re.search()"""
+    for app_info in app_infos:
+        if re.search(app_info.wm_name_re, wm_class) and re.search(app_info.tab_re, window_name):
+            return app_info
+
+    return None
+
+
+class ApplicationInfoMatcherTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.detailed_app_infos = [
+            ApplicationInfo('Jupyter', 'Chromium', 'Jupyter Notebook', False),
+            ApplicationInfo('Internet', 'Chromium|Firefox', '', False),
+            ApplicationInfo('Never reached', 'Chromium', 'YouTube', False),
+            ApplicationInfo('IDE', r'^jetbrains-(pycharm|idea)$', '', False),
+            ApplicationInfo('Terminal', 'Gnome-terminal', r'\.py$|make', False),
+            ApplicationInfo('Terminal vim', 'Gnome-terminal', '(?i)vim', False),
+            ApplicationInfo('Docs', r'Evince|libre.*', r'report \d+', False),
+        ]
+        self.distracting_app_infos = [
+            ApplicationInfo('YouTube', 'Chromium|Firefox', 'YouTube', True),
+            ApplicationInfo('Telegram', 'Telegram', '', True),
+        ]
+        self.matcher = ApplicationInfoMatcher(self.detailed_app_infos, self.distracting_app_infos)
+
+    def test_when_set_if_matched(self) -> None:
+        for (wm_class, window_name, expected_title) in [
+            ('Chromium', 'Jupyter Notebook - lab', 'Jupyter'),
+            ('Chromium', 'YouTube - Chromium', 'YouTube'),
+            ('Firefox', 'Jupyter Notebook', 'Internet'),
+            ('Telegram', 'chat', 'Telegram'),
+            ('jetbrains-idea', 'project', 'IDE'),
+            ('jetbrains-idea-ce', 'project', None),
+            ('Gnome-terminal', 'make test', 'Terminal'),
+            ('Gnome-terminal', 'VIM main.py', 'Terminal'),
+            ('Gnome-terminal', 'VIM readme', 'Terminal vim'),
+            ('Gnome-terminal', 'bash', None),
+            ('libreoffice-writer', 'report 42', 'Docs'),
+            ('Nautilus', 'Downloads', None),
+        ]:
+            with self.subTest(wm_class=wm_class, window_name=window_name):
+                activity = Activity(wm_class, window_name, datetime(2021, 7, 4, 20, 30), True)
+                self.matcher.set_if_matched(activity)
+
+                title = None if activity.application_info is None else activity.application_info.title
+                self.assertEqual(title, expected_title)
+
+    def test_when_result_is_the_same_as_naive_search(self) -> None:
+        app_infos = self.distracting_app_infos + self.detailed_app_infos
+        wm_classes = ['Chromium', 'Firefox', 'Telegram', 'jetbrains-pycharm', 'Gnome-terminal', 'Evince', 'Other']
+        window_names = ['', 'Jupyter Notebook', 'YouTube', 'a.py', 'vim', 'make', 'report 1', 'new\nline', 'x']
+
+        for wm_class in wm_classes:
+            for window_name in window_names:
+                with self.subTest(wm_class=wm_class, window_name=window_name):
+                    self.assertIs(self.matcher.find(wm_class, window_name),
+                                  find_naively(app_infos, wm_class, window_name))
+
+    def test_when_result_is_cached(self) -> None:
+        self.assertEqual(self.matcher.find('Chromium', 'YouTube').title, 'YouTube')
+        self.assertIsNone(self.matcher.find('Nautilus', 'Downloads'))
+        self.assertEqual(self.matcher.find('Chromium', 'YouTube').title, 'YouTube')
+        self.assertIsNone(self.matcher.find('Nautilus', 'Downloads'))
+
+        cache_info = self.matcher.cache_info()
+        self.assertEqual(cache_info.hits, 2)
+        self.assertEqual(cache_info.misses, 2)
+        self.assertEqual(cache_info.current_size, 2)
+
+    def test_when_app_infos_changed(self) -> None:
+        self.assertEqual(self.matcher.find('Chromium', 'YouTube').title, 'YouTube')
+
+        self.matcher.distracting_app_infos = []
+        self.assertEqual(self.matcher.cache_info().current_size, 0)
+        self.assertEqual(self.matcher.find('Chromium', 'YouTube').title, 'Internet')
+
+        self.matcher.detailed_app_infos = [ApplicationInfo('Browser', 'Chromium', '', False)]
+        self.assertEqual(self.matcher.find('Chromium', 'YouTube').title, 'Browser')
+
+    def test_when_fingerprint_changed(self) -> None:
+        fingerprint = self.matcher.fingerprint
+        self.assertEqual(ApplicationInfoMatcher(self.detailed_app_infos, self.distracting_app_infos).fingerprint,
+                         fingerprint)
+
+        self.matcher.detailed_app_infos = self.detailed_app_infos[1:]
+        self.assertNotEqual(self.matcher.fingerprint, fingerprint)
@@ -0,0 +1,111 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_reader import ActivityReader
+from speaking_eye.binary_activity_log import BinaryActivityDecoder, BinaryActivityEncoder, BinaryActivityLog, \
+    read_varint, write_varint, zigzag_decode, zigzag_encode
+
+
+class BinaryActivityLogTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        start_time = datetime(2021, 7, 4, 9)
+
+        self.activities = [
+            Activity('Chromium', 'Tab 1', start_time, True).set_end_time(start_time + timedelta(minutes=5)),
+            Activity('Chromium', 'Таб 2 ✨', start_time + timedelta(minutes=5), False)
+            .set_end_time(start_time + timedelta(minutes=5, microseconds=1)),
+            # NOTE: clock can go back
+            Activity('Chromium', 'Tab 1', start_time + timedelta(minutes=4), True)
+            .set_end_time(start_time + timedelta(hours=2, microseconds=999_999)),
+            Activity('Slack', '', start_time + timedelta(hours=3), True).set_end_time(start_time + timedelta(hours=3)),
+        ]
+
+    def encode(self) -> bytes:
+        encoder = BinaryActivityEncoder()
+
+        return b''.join(encoder.encode(activity) for activity in self.activities)
+
+    def test_varint(self) -> None:
+        for value in [0, 1, 127, 128, 300, 2 ** 63]:
+            buffer = bytearray(b'x')
+            write_varint(buffer, value)
+
+            self.assertEqual((value, len(buffer)), read_varint(bytes(buffer), 1))
+
+        self.assertEqual(b'\xac\x02', bytes(self.__varint(300)))
+
+        with self.assertRaises(IndexError):
+            read_varint(b'\xac', 0)
+
+    @staticmethod
+    def __varint(value: int) -> bytearray:
+        buffer = bytearray()
+        write_varint(buffer, value)
+
+        return buffer
+
+    def test_zigzag(self) -> None:
+        self.assertEqual([0, 1, 2, 3, 4], [zigzag_encode(value) for value in [0, -1, 1, -2, 2]])
+
+        for value in [0, -1, 1, -2, 2, -10 ** 15, 10 ** 15]:
+            self.assertEqual(value, zigzag_decode(zigzag_encode(value)))
+
+    def test_encode_decode(self) -> None:
+        data = self.encode()
+
+        self.assertTrue(data.startswith(BinaryActivityLog.HEADER))
+        self.assertEqual(self.activities, list(BinaryActivityDecoder().iter_decode(data)))
+        self.assertEqual([], list(BinaryActivityDecoder().iter_decode(b'')))
+        self.assertEqual([], list(BinaryActivityDecoder().iter_decode(BinaryActivityLog.HEADER[:2])))
+
+    def test_decode_wrong_data(self) -> None:
+        with self.assertRaisesRegex(ValueError, expected_regex='Unexpected header'):
+            list(BinaryActivityDecoder().iter_decode(b'2021-07-04 09:00:00\t'))
+
+        with self.assertRaisesRegex(ValueError, expected_regex='Unknown tag \\[255\\] at \\[5\\]'):
+            list(BinaryActivityDecoder().iter_decode(BinaryActivityLog.HEADER + b'\xff'))
+
+    def test_decode_not_fully_written_record(self) -> None:
+        data = self.encode()
+
+        for size in range(len(BinaryActivityLog.HEADER), len(data)):
+            decoder = BinaryActivityDecoder()
+            activities = list(decoder.iter_decode(data[:size]))
+
+            self.assertEqual(self.activities[:len(activities)], activities)
+            self.assertLessEqual(decoder.offset, size)
+
+    def test_decode_by_parts(self) -> None:
+        data = self.encode()
+
+        for size in range(len(data) + 1):
+            decoder = BinaryActivityDecoder()
+            activities = list(decoder.iter_decode(data[:size]))
+            activities += decoder.iter_decode(data[decoder.offset:], decoder.offset)
+
+            self.assertEqual(self.activities, activities)
+            self.assertEqual(len(data), decoder.offset)
+
+        with self.assertRaisesRegex(ValueError, expected_regex='offset'):
+            list(BinaryActivityDecoder().iter_decode(data[1:], 1))
+
+    def test_for_appending(self) -> None:
+        with tempfile.TemporaryDirectory() as raw_data_dir:
+            raw_data_file = Path(raw_data_dir) / '2021-07-04_speaking_eye_raw_data.bin'
+
+            encoder = BinaryActivityEncoder.for_appending(raw_data_file)
+            data = b''.join(encoder.encode(activity) for activity in self.activities[:2])
+            # NOTE: the last byte of the second activity is lost
+            raw_data_file.write_bytes(data[:-1])
+
+            encoder = BinaryActivityEncoder.for_appending(raw_data_file)
+
+            with open(str(raw_data_file), 'ab') as file:
+                for activity in self.activities[1:]:
+                    file.write(encoder.encode(activity))
+
+            self.assertEqual(self.activities, list(ActivityReader.iter_raw_data_file(raw_data_file)))
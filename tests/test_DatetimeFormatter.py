@@ -20,3 +20,25 @@ class DatetimeFormatterTestCase(unittest.TestCase):
             ('2021-07-04 20:20:20', datetime(2021, 7, 4, 20, 20, 20)),
         ]:
             self.assertEqual(DatetimeFormatter.parse_string_with_optional_milliseconds(value), expected)
+
+    def test_when_parse_str_datetime(self) -> None:
+        for (value, expected) in [
+            (str(datetime(2021, 7, 4, 20, 20, 20, 1)), datetime(2021, 7, 4, 20, 20, 20, 1)),
+            (str(datetime(2021, 7, 4, 20, 20, 20)), datetime(2021, 7, 4, 20, 20, 20)),
+            ('2021-07-04 20:20:20.100000', datetime(2021, 7, 4, 20, 20, 20, 100000)),
+        ]:
+            self.assertEqual(DatetimeFormatter.parse_str_datetime(value), expected)
+
+    def test_when_parse_str_datetime_with_unexpected_layout(self) -> None:
+        for value in [
+            '',
+            '2021-07-04',
+            '2021-07-04T20:20:20',
+            '2021-07-04 20:20:20+03:00',
+            '2021-07-04 20:20:20.0000001',
+            '2021-07-04 20:20:20-000001',
+            '2021-07-04 25:20:20.000001',
+        ]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    DatetimeFormatter.parse_str_datetime(value)
@@ -1,5 +1,5 @@
 import unittest
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 from speaking_eye.datetime_helper import DatetimeHelper
 
@@ -28,3 +28,8 @@ class DatetimeHelperTestCase(unittest.TestCase):
             (date(2020, 1, 27), (datetime(2020, 1, 27), datetime(2020, 1, 27, 23, 59, 59, 999_999))),
         ]:
             self.assertEqual(expected, DatetimeHelper.get_date_range(date_))
+
+    def test_to_microseconds(self):
+        self.assertEqual(0, DatetimeHelper.to_microseconds(timedelta()))
+        self.assertEqual(90 * 60 * 10 ** 6 + 1, DatetimeHelper.to_microseconds(timedelta(minutes=90, microseconds=1)))
+        self.assertEqual(-1, DatetimeHelper.to_microseconds(timedelta(microseconds=-1)))
@@ -0,0 +1,102 @@
+import logging
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_converter import ActivityConverter
+from speaking_eye.activity_reader import ActivityReader
+from speaking_eye.application_info import ApplicationInfo
+from speaking_eye.application_info_matcher import ApplicationInfoMatcher
+from speaking_eye.compression import Compression
+from speaking_eye.day_stat_loader import DayStatLoader
+from speaking_eye.day_stat_store import DayStatStore
+from speaking_eye.pool_type import PoolType
+from speaking_eye.raw_data_compressor import RawDataCompressor
+from speaking_eye.report_aggregation import ReportAggregation
+
+
+class DayStatLoaderTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.raw_data_files = []
+
+        for day in range(3):
+            raw_data_file = Path(self.tmp_dir.name) / f'2021-07-0{day + 1}_speaking_eye_raw_data.tsv'
+            start_time = datetime(2021, 7, day + 1, 10)
+
+            with open(str(raw_data_file), 'w') as file:
+                for i in range(day + 1):
+                    activity = Activity(f'wm_name{i}', 'tab', start_time, is_work_time=i % 2 == 0)
+                    file.write(ActivityConverter.to_string(activity.set_end_time(start_time + timedelta(minutes=5))))
+                    start_time += timedelta(minutes=5)
+
+            self.raw_data_files.append(raw_data_file)
+
+        self.raw_data_files.append(Path(self.tmp_dir.name) / 'non_existent_file.tsv')
+
+        matcher = ApplicationInfoMatcher([ApplicationInfo('title', 'wm_name1', '', False)], [])
+        self.reader = ActivityReader(logging.Logger('DayStatLoaderTestCase'), matcher)
+        self.expected_holders = [
+            {'Others': (timedelta(minutes=5), timedelta())},
+            {'Others': (timedelta(minutes=5), timedelta()), 'title': (timedelta(), timedelta(minutes=5))},
+            {'Others': (timedelta(minutes=10), timedelta()), 'title': (timedelta(), timedelta(minutes=5))},
+            {},
+        ]
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def assert_holders(self, loader: DayStatLoader) -> None:
+        holders = list(loader.load(self.raw_data_files))
+        loader.shutdown()
+
+        self.assertListEqual(
+            [{title: (stat.work_time, stat.off_time) for title, stat in holder.items()} for holder in holders],
+            self.expected_holders
+        )
+
+    def test_when_load_sequentially(self) -> None:
+        self.assert_holders(DayStatLoader(self.reader, workers=0, pool_type=PoolType.PROCESS))
+
+    def test_when_load_with_threads(self) -> None:
+        self.assert_holders(DayStatLoader(self.reader, workers=2, pool_type=PoolType.THREAD))
+
+    def test_when_load_with_processes(self) -> None:
+        self.assert_holders(DayStatLoader(self.reader, workers=2, pool_type=PoolType.PROCESS))
+
+    def test_when_load_with_vectorized_aggregation(self) -> None:
+        self.assert_holders(DayStatLoader(self.reader, workers=0, pool_type=PoolType.PROCESS,
+                                          aggregation=ReportAggregation.VECTORIZED))
+        self.assert_holders(DayStatLoader(self.reader, workers=2, pool_type=PoolType.PROCESS,
+                                          aggregation=ReportAggregation.VECTORIZED))
+
+    def test_when_workers_number_is_negative(self) -> None:
+        with self.assertRaisesRegex(ValueError, expected_regex='workers \\[-1\\] should not be negative!'):
+            DayStatLoader(self.reader, workers=-1, pool_type=PoolType.THREAD)
+
+    def test_when_load_with_day_stat_store(self) -> None:
+        day_stat_store = DayStatStore(self.reader.logger)
+        open_raw_data_file = self.raw_data_files[2]
+
+        loader = DayStatLoader(self.reader, workers=0, pool_type=PoolType.PROCESS, day_stat_store=day_stat_store)
+        self.assertEqual(len(list(loader.load(self.raw_data_files, open_raw_data_file))), 4)
+
+        fingerprint = self.reader.matcher.fingerprint
+        self.assertIsNotNone(day_stat_store.read(self.raw_data_files[0], fingerprint))
+        self.assertIsNotNone(day_stat_store.read(self.raw_data_files[1], fingerprint))
+        self.assertIsNone(day_stat_store.read(open_raw_data_file, fingerprint))
+
+        self.assert_holders(loader)
+
+    def test_when_files_are_compressed_after_listing(self) -> None:
+        # NOTE: report server takes paths from RawDataCatalog while closed days are compressed in background
+        compressor = RawDataCompressor(self.reader.logger, Compression.GZIP)
+
+        for raw_data_file in self.raw_data_files[:-1]:
+            compressor.compress(raw_data_file)
+
+        self.assert_holders(DayStatLoader(self.reader, workers=0, pool_type=PoolType.PROCESS,
+                                          day_stat_store=DayStatStore(self.reader.logger)))
@@ -0,0 +1,68 @@
+import logging
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+
+from speaking_eye.activity_stat import ActivityStat
+from speaking_eye.activity_stat_holder import ActivityStatHolder
+from speaking_eye.day_stat_store import DayStatStore
+
+
+class DayStatStoreTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.raw_data_file = Path(self.tmp_dir.name) / '2021-07-04_speaking_eye_raw_data.tsv'
+
+        with open(str(self.raw_data_file), 'w') as file:
+            file.write('raw data\n')
+
+        self.holder = ActivityStatHolder([])
+        self.holder.total_work_time = timedelta(hours=1, microseconds=1)
+        self.holder.total_off_time = timedelta(minutes=5)
+        self.holder.has_work_activities = True
+        self.holder['Працюю'] = ActivityStat(timedelta(hours=1, microseconds=1), timedelta())
+        self.holder['Others'] = ActivityStat(timedelta(), timedelta(minutes=5))
+
+        self.store = DayStatStore(logging.Logger('DayStatStoreTestCase'))
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def write(self) -> None:
+        self.store.write(self.raw_data_file, self.holder, self.raw_data_file.stat(), 'fingerprint')
+
+    def test_when_aggregate_does_not_exist(self) -> None:
+        self.assertIsNone(self.store.read(self.raw_data_file, 'fingerprint'))
+
+    def test_when_write_and_read(self) -> None:
+        self.write()
+
+        stat_file = DayStatStore.get_stat_file_path(self.raw_data_file)
+        self.assertEqual(stat_file.name, '.2021-07-04_speaking_eye_raw_data.tsv.stat.json')
+
+        holder = self.store.read(self.raw_data_file, 'fingerprint')
+        self.assertDictEqual(holder, self.holder)
+        self.assertEqual(holder.total_work_time, self.holder.total_work_time)
+        self.assertEqual(holder.total_off_time, self.holder.total_off_time)
+        self.assertTrue(holder.has_work_activities)
+
+    def test_when_fingerprint_changed(self) -> None:
+        self.write()
+        self.assertIsNone(self.store.read(self.raw_data_file, 'another fingerprint'))
+
+    def test_when_raw_data_file_changed(self) -> None:
+        self.write()
+
+        stat = self.raw_data_file.stat()
+        os.utime(str(self.raw_data_file), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        self.assertIsNone(self.store.read(self.raw_data_file, 'fingerprint'))
+
+    def test_when_aggregate_is_broken(self) -> None:
+        with open(str(DayStatStore.get_stat_file_path(self.raw_data_file)), 'w') as file:
+            file.write('{"version": 1')
+
+        self.assertIsNone(self.store.read(self.raw_data_file, 'fingerprint'))
@@ -0,0 +1,172 @@
+import logging
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_converter import ActivityConverter
+from speaking_eye.activity_reader import ActivityReader
+from speaking_eye.activity_stat_holder import ActivityStatHolder
+from speaking_eye.application_info import ApplicationInfo
+from speaking_eye.application_info_matcher import ApplicationInfoMatcher
+from speaking_eye.binary_activity_log import BinaryActivityEncoder
+from speaking_eye.day_stat_tail_reader import DayStatTailReader
+
+
+class DayStatTailReaderTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.raw_data_file = Path(self.tmp_dir.name) / '2021-07-04_speaking_eye_raw_data.tsv'
+        start_time = datetime(2021, 7, 4, 9)
+        self.activities = []
+
+        for i in range(6):
+            activity = Activity(f'wm_name{i % 3}', f'tab {i}', start_time, is_work_time=i % 2 == 0)
+            self.activities.append(activity.set_end_time(start_time + timedelta(minutes=i + 1)))
+            start_time += timedelta(minutes=i + 1)
+
+        matcher = ApplicationInfoMatcher([ApplicationInfo('title', 'wm_name1', '', False)], [])
+        self.activity_reader = ActivityReader(logging.Logger('DayStatTailReaderTestCase'), matcher)
+        self.tail_reader = DayStatTailReader(self.activity_reader)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def append(self, activities: List[Activity], raw_data_file: Optional[Path] = None) -> None:
+        with open(str(raw_data_file or self.raw_data_file), 'a') as file:
+            for activity in activities:
+                file.write(ActivityConverter.to_string(activity))
+
+    @staticmethod
+    def to_dict(holder: ActivityStatHolder) -> Dict[str, Tuple[timedelta, timedelta]]:
+        return {title: (stat.work_time, stat.off_time) for title, stat in holder.items()}
+
+    def assert_read(self, activities: List[Activity], raw_data_file: Optional[Path] = None) -> None:
+        holder = self.tail_reader.read(raw_data_file or self.raw_data_file)
+
+        for activity in activities:
+            self.activity_reader.matcher.set_if_matched(activity)
+
+        self.assertEqual(self.to_dict(ActivityStatHolder(activities)), self.to_dict(holder))
+
+    def test_read_appended(self) -> None:
+        self.assert_read([])
+
+        self.append(self.activities[:2])
+        self.assert_read(self.activities[:2])
+        self.assert_read(self.activities[:2])
+
+        self.append(self.activities[2:])
+        self.assert_read(self.activities)
+
+        full_holder = ActivityStatHolder(self.activity_reader.read(self.raw_data_file))
+        self.assertEqual(self.to_dict(full_holder), self.to_dict(self.tail_reader.read(self.raw_data_file)))
+
+    def test_read_partially_written_line(self) -> None:
+        self.append(self.activities[:1])
+        line = ActivityConverter.to_string(self.activities[1])
+
+        with open(str(self.raw_data_file), 'a') as file:
+            file.write(line[:10])
+
+        self.assert_read(self.activities[:1])
+
+        with open(str(self.raw_data_file), 'a') as file:
+            file.write(line[10:])
+
+        self.assert_read(self.activities[:2])
+
+    def test_read_malformed_line(self) -> None:
+        self.append(self.activities[:1])
+        self.assert_read(self.activities[:1])
+
+        self.append(self.activities[1:3])
+        lines = [ActivityConverter.to_string(activity) for activity in self.activities[:3]]
+        # NOTE: the last line is broken, but the line before it is parsed well
+        malformed_offset = len(''.join(lines[:2]).encode('utf-8'))
+
+        with open(str(self.raw_data_file), 'r+b') as file:
+            file.seek(malformed_offset)
+            file.write(lines[2].replace('\t', ' ').encode('utf-8'))
+
+        with self.assertRaisesRegex(ValueError, expected_regex='Unexpected columns number'):
+            self.tail_reader.read(self.raw_data_file)
+
+        # NOTE: the line is fixed in place (inode & size are the same)
+        with open(str(self.raw_data_file), 'r+b') as file:
+            file.seek(malformed_offset)
+            file.write(lines[2].encode('utf-8'))
+
+        self.assert_read(self.activities[:3])
+
+    def test_read_malformed_binary_record(self) -> None:
+        raw_data_file = self.raw_data_file.with_suffix('.bin')
+        encoder = BinaryActivityEncoder()
+        data = b''.join(encoder.encode(activity) for activity in self.activities)
+
+        raw_data_file.write_bytes(data[:len(data) // 2])
+        self.assert_read(list(ActivityReader.iter_raw_data_file(raw_data_file)), raw_data_file)
+        read_size = raw_data_file.stat().st_size
+
+        with open(str(raw_data_file), 'ab') as file:
+            file.write(data[read_size:] + b'\xff')
+
+        with self.assertRaisesRegex(ValueError, expected_regex='Unknown tag'):
+            self.tail_reader.read(raw_data_file)
+
+        os.truncate(str(raw_data_file), len(data))
+        self.assert_read(self.activities, raw_data_file)
+
+    def test_returned_holder_is_copy(self) -> None:
+        self.append(self.activities[:2])
+        self.tail_reader.read(self.raw_data_file).merge(ActivityStatHolder(self.activities))
+
+        self.assert_read(self.activities[:2])
+
+    def test_read_shrunk_file(self) -> None:
+        self.append(self.activities)
+        self.assert_read(self.activities)
+
+        os.truncate(str(self.raw_data_file), 0)
+        self.append(self.activities[:1])
+        self.assert_read(self.activities[:1])
+
+    def test_read_replaced_file(self) -> None:
+        self.append(self.activities[:2])
+        self.assert_read(self.activities[:2])
+
+        # NOTE: the new file is longer than already read part, so only inode tells that it is another file
+        new_file = Path(self.tmp_dir.name) / 'new_file.tsv'
+        self.append(self.activities[3:], new_file)
+        os.replace(str(new_file), str(self.raw_data_file))
+
+        self.assert_read(self.activities[3:])
+
+    def test_read_another_and_removed_file(self) -> None:
+        self.append(self.activities[:2])
+        self.assert_read(self.activities[:2])
+
+        another_file = Path(self.tmp_dir.name) / '2021-07-05_speaking_eye_raw_data.tsv'
+        self.append(self.activities[2:], another_file)
+        self.assert_read(self.activities[2:], another_file)
+
+        another_file.unlink()
+        self.assert_read([], another_file)
+
+    def test_read_appended_binary(self) -> None:
+        raw_data_file = self.raw_data_file.with_suffix('.bin')
+        encoder = BinaryActivityEncoder()
+        data = b''.join(encoder.encode(activity) for activity in self.activities)
+
+        for size in [3, 20, len(data) // 2, len(data)]:
+            with open(str(raw_data_file), 'ab') as file:
+                file.write(data[raw_data_file.stat().st_size if raw_data_file.exists() else 0:size])
+
+            expected_activities = list(ActivityReader.iter_raw_data_file(raw_data_file))
+            self.assert_read(expected_activities, raw_data_file)
+
+        self.assert_read(self.activities, raw_data_file)
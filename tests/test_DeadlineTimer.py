@@ -0,0 +1,123 @@
+import logging
+import sys
+import types
+import unittest
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Tuple
+from unittest import mock
+
+# NOTE: gi is not installed on CI and GLib main loop is not needed for the test, so gi is faked only for the import
+real_gi_modules = {name: sys.modules.get(name) for name in ['gi', 'gi.repository']}
+sys.modules.update({'gi': types.ModuleType('gi'), 'gi.repository': mock.MagicMock()})
+
+try:
+    from speaking_eye.deadline_timer import DeadlineTimer
+finally:
+    for name, module in real_gi_modules.items():
+        if module is None:
+            del sys.modules[name]
+        else:
+            sys.modules[name] = module
+
+
+class FakeGLib:
+    """GLib timeout sources that are fired by the test instead of the main loop"""
+
+    def __init__(self) -> None:
+        self.sources: Dict[int, Tuple[int, Callable[[], bool]]] = {}
+        self.__next_source_id = 1
+
+    def timeout_add(self, interval_ms: int, callback: Callable[[], bool]) -> int:
+        source_id = self.__next_source_id
+        self.__next_source_id += 1
+        self.sources[source_id] = (interval_ms, callback)
+
+        return source_id
+
+    def source_remove(self, source_id: int) -> None:
+        del self.sources[source_id]
+
+    def fire(self, source_id: int) -> None:
+        _, callback = self.sources[source_id]
+
+        if not callback():
+            self.sources.pop(source_id, None)
+
+    def get_intervals_ms(self) -> Dict[int, int]:
+        return {source_id: interval_ms for source_id, (interval_ms, _) in self.sources.items()}
+
+
+class DeadlineTimerTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.glib = FakeGLib()
+
+        for name in ['GLib', 'GObject']:
+            patcher = mock.patch(f'speaking_eye.deadline_timer.{name}', self.glib)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.now = datetime(2021, 7, 4, 9)
+        self.handler_calls = 0
+        self.timer = DeadlineTimer('test_timer', handler=self.handler, max_interval=timedelta(minutes=10),
+                                   logger=logging.Logger('DeadlineTimerTestCase'))
+
+    def handler(self) -> None:
+        self.handler_calls += 1
+
+    def test_schedule(self) -> None:
+        self.timer.schedule(self.now + timedelta(seconds=5), self.now)
+
+        self.assertEqual({1: 5000}, self.glib.get_intervals_ms())
+        self.assertEqual(self.now + timedelta(seconds=5), self.timer.deadline)
+
+        # NOTE: the previous deadline is replaced
+        self.timer.schedule(self.now + timedelta(seconds=1), self.now)
+        self.assertEqual({2: 1000}, self.glib.get_intervals_ms())
+
+        self.timer.schedule(None, self.now)
+        self.assertEqual({}, self.glib.get_intervals_ms())
+        self.assertFalse(self.timer.is_started)
+
+    def test_max_interval_and_min_interval(self) -> None:
+        self.timer.schedule(self.now + timedelta(hours=3), self.now)
+        self.assertEqual([10 * 60 * 1000], list(self.glib.get_intervals_ms().values()))
+
+        self.timer.schedule(self.now - timedelta(seconds=1), self.now)
+        self.assertEqual([DeadlineTimer.MIN_INTERVAL_MS], list(self.glib.get_intervals_ms().values()))
+
+    def test_fire(self) -> None:
+        self.timer.schedule(self.now + timedelta(seconds=5), self.now)
+        self.glib.fire(1)
+
+        self.assertEqual(1, self.handler_calls)
+        self.assertEqual({}, self.glib.get_intervals_ms())
+        self.assertFalse(self.timer.is_started)
+        self.assertIsNone(self.timer.deadline)
+
+    def test_schedule_in_handler(self) -> None:
+        def handler() -> None:
+            self.handler_calls += 1
+            self.timer.schedule(self.now + timedelta(seconds=2), self.now)
+
+        timer = DeadlineTimer('test_timer', handler=handler, max_interval=timedelta(minutes=10),
+                              logger=logging.Logger('DeadlineTimerTestCase'))
+        self.timer = timer
+
+        timer.schedule(self.now + timedelta(seconds=5), self.now)
+        self.glib.fire(1)
+
+        self.assertEqual({2: 2000}, self.glib.get_intervals_ms())
+        self.assertTrue(timer.is_started)
+
+        # NOTE: the source of the handler is replaced, not added
+        timer.schedule(self.now + timedelta(seconds=3), self.now)
+        self.assertEqual({3: 3000}, self.glib.get_intervals_ms())
+
+        self.glib.fire(3)
+        self.assertEqual({4: 2000}, self.glib.get_intervals_ms())
+        self.assertEqual(2, self.handler_calls)
+
+        timer.stop()
+        self.assertEqual({}, self.glib.get_intervals_ms())
+        self.assertFalse(timer.is_started)
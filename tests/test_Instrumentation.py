@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch
+
+from speaking_eye.instrumentation import Instrumentation, StageStat
+
+
+class InstrumentationTestCase(unittest.TestCase):
+
+    def test_when_disabled(self) -> None:
+        instrumentation = Instrumentation()
+
+        @instrumentation.timed('stage')
+        def function(value: int) -> int:
+            return value + 1
+
+        with instrumentation.measure('stage'):
+            self.assertEqual(2, function(1))
+
+        instrumentation.count('counter')
+
+        self.assertEqual('instrumentation is disabled', instrumentation.format())
+
+    @patch('time.perf_counter_ns')
+    def test_when_enabled(self, mock_perf_counter_ns) -> None:
+        instrumentation = Instrumentation()
+        instrumentation.enabled = True
+
+        @instrumentation.timed('timed_stage')
+        def function() -> None:
+            raise ValueError('error')
+
+        # NOTE: start & end of each measured block
+        mock_perf_counter_ns.side_effect = [0, 5_000, 100, 2_000_100, 0, 20 * 10 ** 9]
+
+        with instrumentation.measure('stage'):
+            pass
+
+        with instrumentation.measure('stage'):
+            pass
+
+        with self.assertRaisesRegex(ValueError, expected_regex='error'):
+            function()
+
+        instrumentation.count('counter')
+        instrumentation.count('counter', 2)
+
+        self.assertEqual('\n'.join([
+            'stage: count=2 total=2.0ms mean=1.0ms max=2.0ms [<10.0us:1 <10.0ms:1]',
+            'timed_stage: count=1 total=20.0s mean=20.0s max=20.0s [slower:1]',
+            'counter: 3',
+        ]), instrumentation.format())
+
+        instrumentation.reset()
+
+        self.assertEqual('', instrumentation.format())
+
+    def test_stage_stat_buckets(self) -> None:
+        stage_stat = StageStat()
+
+        for elapsed_ns in [10_000, 10_001, 10 ** 10, 10 ** 10 + 1]:
+            stage_stat.add(elapsed_ns)
+
+        self.assertEqual([1, 1, 0, 0, 0, 0, 1, 1], stage_stat.buckets)
+        self.assertEqual(10 ** 10 + 1, stage_stat.max_ns)
@@ -0,0 +1,67 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_stat_holder import ActivityStatHolder
+from speaking_eye.live_day_stat import LiveDayStat
+
+
+class LiveDayStatTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        start_time = datetime(2021, 7, 4, 9)
+        self.day = start_time.date()
+        self.activities = [
+            Activity('wm_name', f'tab {i}', start_time + timedelta(minutes=i), True)
+            .set_end_time(start_time + timedelta(minutes=i + 1))
+            for i in range(3)
+        ]
+
+    def test_get(self) -> None:
+        live_day_stat = LiveDayStat()
+
+        self.assertIsNone(live_day_stat.get(self.day))
+        self.assertIsNone(live_day_stat.get_version(self.day))
+
+        live_day_stat.reset(self.day, ActivityStatHolder(self.activities[:1]))
+        version = live_day_stat.get_version(self.day)
+        self.assertIsNotNone(version)
+
+        live_day_stat.update_stat(self.activities[1])
+        snapshot = live_day_stat.get(self.day)
+
+        assert snapshot is not None and version is not None
+        snapshot_version, holder = snapshot
+        self.assertGreater(snapshot_version, version)
+        self.assertEqual(timedelta(minutes=2), holder.total_work_time)
+
+        self.assertIsNone(live_day_stat.get(date(2021, 7, 5)))
+
+    def test_snapshot_is_not_changed(self) -> None:
+        live_day_stat = LiveDayStat()
+        holder = ActivityStatHolder(self.activities[:1])
+        live_day_stat.reset(self.day, holder)
+
+        # NOTE: holder of the tracker can be changed after reset
+        holder.update_stat(self.activities[1])
+        snapshot = live_day_stat.get(self.day)
+
+        live_day_stat.update_stat(self.activities[2])
+
+        assert snapshot is not None
+        self.assertEqual(timedelta(minutes=1), snapshot[1].total_work_time)
+        self.assertEqual(timedelta(minutes=2), live_day_stat.holder.total_work_time)
+
+    def test_reset_on_new_day(self) -> None:
+        live_day_stat = LiveDayStat()
+        live_day_stat.reset(self.day, ActivityStatHolder(self.activities))
+        version = live_day_stat.get_version(self.day)
+
+        next_day = date(2021, 7, 5)
+        live_day_stat.reset(next_day, ActivityStatHolder([]))
+
+        assert version is not None
+        self.assertEqual(next_day, live_day_stat.day)
+        self.assertIsNone(live_day_stat.get(self.day))
+        self.assertGreater(live_day_stat.get_version(next_day) or 0, version)
+        self.assertEqual(timedelta(), live_day_stat.holder.total_work_time)
@@ -0,0 +1,62 @@
+import unittest
+
+from speaking_eye.lru_cache import CacheInfo, LruCache
+
+
+class LruCacheTestCase(unittest.TestCase):
+
+    def test_when_lookup(self) -> None:
+        cache = LruCache(max_size=2)
+
+        self.assertEqual(cache.lookup('a'), (False, None))
+        cache.put('a', 1)
+        cache.put('b', None)
+
+        self.assertEqual(cache.lookup('a'), (True, 1))
+        self.assertEqual(cache.lookup('b'), (True, None))
+        self.assertEqual(cache.info(), CacheInfo(hits=2, misses=1, max_size=2, current_size=2))
+
+    def test_when_least_recently_used_is_evicted(self) -> None:
+        cache = LruCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.lookup('a')
+        cache.put('c', 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.lookup('b'), (False, None))
+        self.assertEqual(cache.lookup('a'), (True, 1))
+        self.assertEqual(cache.lookup('c'), (True, 3))
+
+    def test_when_clear(self) -> None:
+        cache = LruCache(max_size=2)
+        cache.put('a', 1)
+        cache.lookup('a')
+        cache.clear()
+
+        self.assertEqual(cache.lookup('a'), (False, None))
+        self.assertEqual(cache.info(), CacheInfo(hits=1, misses=1, max_size=2, current_size=0))
+
+    def test_when_max_size_is_zero(self) -> None:
+        cache = LruCache(max_size=0)
+        cache.put('a', 1)
+
+        self.assertEqual(cache.lookup('a'), (False, None))
+
+    def test_when_max_size_is_negative(self) -> None:
+        with self.assertRaisesRegex(ValueError, expected_regex='max_size \\[-1\\] should not be negative!'):
+            LruCache(max_size=-1)
+
+    def test_when_item_is_expired(self) -> None:
+        now = 100.0
+        cache = LruCache(max_size=2, clock=lambda: now)
+        cache.put('a', 1, ttl=10)
+        cache.put('b', 2)
+
+        now = 109.0
+        self.assertEqual(cache.lookup('a'), (True, 1))
+
+        now = 110.0
+        self.assertEqual(cache.lookup('a'), (False, None))
+        self.assertEqual(cache.lookup('b'), (True, 2))
+        self.assertEqual(cache.info(), CacheInfo(hits=2, misses=1, max_size=2, current_size=1))
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional, Tuple
+
+from speaking_eye.raw_data_catalog import RawDataCatalog
+
+
+def parse_file_name(file_name: str) -> Optional[Tuple[date, int]]:
+    name, _, suffix = file_name.partition('.')
+
+    if suffix not in ['tsv', 'tsv.gz']:
+        return None
+
+    try:
+        return datetime.strptime(name, '%Y-%m-%d').date(), ['tsv', 'tsv.gz'].index(suffix)
+    except ValueError:
+        return None
+
+
+class RawDataCatalogTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.raw_data_dir = Path(self.tmp_dir.name)
+        self.catalog = RawDataCatalog(self.raw_data_dir, parse_file_name)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_empty_or_missing_dir(self) -> None:
+        self.assertEqual(0, len(self.catalog))
+        self.assertEqual(date(2021, 7, 4), self.catalog.get_first_date(date(2021, 7, 4)))
+        self.assertEqual(date(2021, 7, 4), self.catalog.get_last_date(date(2021, 7, 4)))
+
+        missing_dir_catalog = RawDataCatalog(self.raw_data_dir / 'missing', parse_file_name)
+
+        self.assertEqual([], missing_dir_catalog.get_dates(date(2021, 1, 1), date(2021, 12, 31)))
+        self.assertIsNone(missing_dir_catalog.get_file_path(date(2021, 7, 4)))
+
+    def test_queries(self) -> None:
+        (self.raw_data_dir / '2021-07-04.tsv').write_text('12345')
+        (self.raw_data_dir / '2021-07-01.tsv.gz').write_text('123')
+        (self.raw_data_dir / '2021-07-10.tsv').write_text('')
+        (self.raw_data_dir / '2021-07-10.tsv.gz').write_text('1')
+        (self.raw_data_dir / '.2021-07-05.tsv').write_text('hidden')
+        (self.raw_data_dir / '2021-07-06.tsv.bak').write_text('unknown suffix')
+        (self.raw_data_dir / '2021-13-06.tsv').write_text('wrong date')
+
+        self.assertEqual(3, len(self.catalog))
+        self.assertEqual(date(2021, 7, 1), self.catalog.get_first_date(date.today()))
+        self.assertEqual(date(2021, 7, 10), self.catalog.get_last_date(date.today()))
+        self.assertEqual([date(2021, 7, 4), date(2021, 7, 10)],
+                         self.catalog.get_dates(date(2021, 7, 2), date(2021, 7, 10)))
+        self.assertEqual([], self.catalog.get_dates(date(2021, 7, 5), date(2021, 7, 9)))
+        self.assertEqual(5, self.catalog.get_file_size(date(2021, 7, 4)))
+        self.assertEqual(0, self.catalog.get_file_size(date(2021, 7, 5)))
+        # NOTE: the file with the higher priority is chosen among files for the same date
+        self.assertEqual(self.raw_data_dir / '2021-07-10.tsv', self.catalog.get_file_path(date(2021, 7, 10)))
+        self.assertEqual([date(2021, 7, 1), date(2021, 7, 4), date(2021, 7, 10)],
+                         [file_date for file_date, _ in self.catalog.items()])
+
+    def test_refresh_when_dir_is_changed(self) -> None:
+        old_file = self.raw_data_dir / '2021-07-04.tsv'
+        old_file.write_text('')
+
+        self.assertEqual([date(2021, 7, 4)], self.catalog.get_dates(date.min, date.max))
+
+        old_file.rename(self.raw_data_dir / '2021-07-04.tsv.gz')
+        (self.raw_data_dir / '2021-07-05.tsv').write_text('')
+
+        self.assertEqual([date(2021, 7, 4), date(2021, 7, 5)], self.catalog.get_dates(date.min, date.max))
+        self.assertEqual(self.raw_data_dir / '2021-07-04.tsv.gz', self.catalog.get_file_path(date(2021, 7, 4)))
+
+    def test_dir_is_not_scanned_when_it_is_not_changed(self) -> None:
+        (self.raw_data_dir / '2021-07-04.tsv').write_text('')
+        old_time_ns = 1_500_000_000 * 10 ** 9
+        os.utime(str(self.raw_data_dir), ns=(old_time_ns, old_time_ns))
+
+        self.assertEqual([date(2021, 7, 4)], self.catalog.get_dates(date.min, date.max))
+
+        (self.raw_data_dir / '2021-07-05.tsv').write_text('')
+        # NOTE: pretend that the change of dir was not noticed
+        os.utime(str(self.raw_data_dir), ns=(old_time_ns, old_time_ns))
+
+        self.assertEqual([date(2021, 7, 4)], self.catalog.get_dates(date.min, date.max))
+
+        self.catalog.invalidate()
+
+        self.assertEqual([date(2021, 7, 4), date(2021, 7, 5)], self.catalog.get_dates(date.min, date.max))
+
+    def test_add(self) -> None:
+        old_time_ns = 1_500_000_000 * 10 ** 9
+        os.utime(str(self.raw_data_dir), ns=(old_time_ns, old_time_ns))
+
+        self.assertEqual(0, len(self.catalog))
+
+        self.catalog.add(date(2021, 7, 4), self.raw_data_dir / '2021-07-04.tsv')
+
+        self.assertEqual([date(2021, 7, 4)], self.catalog.get_dates(date.min, date.max))
+        self.assertEqual(self.raw_data_dir / '2021-07-04.tsv', self.catalog.get_file_path(date(2021, 7, 4)))
+
+    def test_get_version(self) -> None:
+        for day in [3, 4, 5]:
+            (self.raw_data_dir / f'2021-07-0{day}.tsv').write_text('1')
+
+        version = self.catalog.get_version(date(2021, 7, 3), date(2021, 7, 5))
+
+        self.assertEqual(version, self.catalog.get_version(date(2021, 7, 3), date(2021, 7, 5)))
+        self.assertNotEqual(version, self.catalog.get_version(date(2021, 7, 3), date(2021, 7, 4)))
+
+        # NOTE: the middle day of the range is changed in place, so mtime of dir is the same
+        with open(str(self.raw_data_dir / '2021-07-04.tsv'), 'a') as file:
+            file.write('2')
+
+        middle_day_version = self.catalog.get_version(date(2021, 7, 3), date(2021, 7, 5))
+        self.assertNotEqual(version, middle_day_version)
+
+        (self.raw_data_dir / '2021-07-04.tsv').rename(self.raw_data_dir / '2021-07-04.tsv.gz')
+        self.assertNotEqual(middle_day_version, self.catalog.get_version(date(2021, 7, 3), date(2021, 7, 5)))
+
+        self.assertEqual(self.catalog.get_version(date(2021, 7, 6), date(2021, 7, 9)),
+                         self.catalog.get_version(date(2021, 8, 6), date(2021, 8, 9)))
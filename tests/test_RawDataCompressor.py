@@ -0,0 +1,92 @@
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_converter import ActivityConverter
+from speaking_eye.activity_day_cache import ActivityDayCache
+from speaking_eye.activity_reader import ActivityReader
+from speaking_eye.compression import Compression
+from speaking_eye.files_provider import FilesProvider
+from speaking_eye.raw_data_compressor import RawDataCompressor
+from speaking_eye.raw_data_format import RawDataFormat
+
+
+class RawDataCompressorTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        start_time = datetime(2021, 7, 4, 9)
+        self.activities = [
+            Activity('Chromium', f'Tab {i}', start_time + timedelta(minutes=i), i % 2 == 0)
+            .set_end_time(start_time + timedelta(minutes=i + 1))
+            for i in range(100)
+        ]
+        self.tsv_content = ''.join(ActivityConverter.to_string(activity) for activity in self.activities)
+
+    def test_compress_and_decompress(self) -> None:
+        for compression in [Compression.GZIP, Compression.XZ]:
+            with tempfile.TemporaryDirectory() as raw_data_dir:
+                raw_data_file = Path(raw_data_dir) / '2021-07-04_speaking_eye_raw_data.tsv'
+                raw_data_file.write_text(self.tsv_content)
+                ActivityDayCache(Mock()).get_cache_file_path(raw_data_file).write_bytes(b'stale cache')
+
+                compressor = RawDataCompressor(Mock(), compression)
+                compressed_file = compressor.compress(raw_data_file)
+
+                self.assertEqual(Path(f'{raw_data_file}.{compression.value}'), compressed_file)
+                self.assertEqual([compressed_file], list(Path(raw_data_dir).iterdir()))
+                self.assertLess(compressed_file.stat().st_size, len(self.tsv_content))
+                self.assertEqual(RawDataFormat.TSV, RawDataFormat.from_path(compressed_file))
+                self.assertEqual(self.activities, list(ActivityReader.iter_raw_data_file(compressed_file)))
+
+                self.assertFalse(compressor.should_compress(compressed_file))
+                self.assertEqual(compressed_file, compressor.compress(compressed_file))
+
+                self.assertEqual(raw_data_file, RawDataCompressor.decompress(compressed_file))
+                self.assertEqual([raw_data_file], list(Path(raw_data_dir).iterdir()))
+                self.assertEqual(self.tsv_content, raw_data_file.read_text())
+
+    def test_compression_is_disabled(self) -> None:
+        compressor = RawDataCompressor(Mock(), Compression.NONE)
+        raw_data_file = Path('/root_dir/2021-07-04_speaking_eye_raw_data.tsv')
+
+        self.assertFalse(compressor.should_compress(raw_data_file))
+        self.assertEqual(raw_data_file, compressor.compress(raw_data_file))
+
+    def test_resolve(self) -> None:
+        with tempfile.TemporaryDirectory() as raw_data_dir:
+            raw_data_file = Path(raw_data_dir) / '2021-07-04_speaking_eye_raw_data.tsv'
+            self.assertEqual(raw_data_file, RawDataCompressor.resolve(raw_data_file))
+
+            raw_data_file.write_text(self.tsv_content)
+            self.assertEqual(raw_data_file, RawDataCompressor.resolve(raw_data_file))
+
+            compressed_file = RawDataCompressor(Mock(), Compression.XZ).compress(raw_data_file)
+            self.assertEqual(compressed_file, RawDataCompressor.resolve(raw_data_file))
+            self.assertEqual(compressed_file, RawDataCompressor.resolve(compressed_file))
+
+    @patch('speaking_eye.files_provider.xdg_config_home')
+    @patch('speaking_eye.files_provider.xdg_data_home')
+    def test_files_provider_finds_compressed_files(self, mock_xdg_data_home, mock_xdg_config_home) -> None:
+        with tempfile.TemporaryDirectory() as root_dir:
+            mock_xdg_data_home.return_value = Path(root_dir)
+            mock_xdg_config_home.return_value = Path(root_dir)
+            package_root_dir = Path(__file__).parent.parent / 'src' / 'speaking_eye'
+            files_provider = FilesProvider(package_root_dir, 'speaky')
+
+            day = date(2021, 7, 4)
+            raw_data_file = files_provider.get_raw_data_file_path(day)
+            self.assertEqual(files_provider.raw_data_dir / '2021-07-04_speaking_eye_raw_data.tsv', raw_data_file)
+
+            raw_data_file.write_text(self.tsv_content)
+            compressed_file = RawDataCompressor(Mock(), Compression.XZ).compress(raw_data_file)
+            (files_provider.raw_data_dir / '2021-07-05_speaking_eye_raw_data.bin').write_bytes(b'')
+            (files_provider.raw_data_dir / '2021-07-06_speaking_eye_raw_data.tsv.bak').write_bytes(b'')
+
+            self.assertEqual(compressed_file, files_provider.get_raw_data_file_path(day))
+            self.assertEqual([(day, compressed_file),
+                              (date(2021, 7, 5), files_provider.raw_data_dir / '2021-07-05_speaking_eye_raw_data.bin')],
+                             sorted(files_provider.iter_raw_data_files()))
+            self.assertEqual(day, files_provider.get_date_of_first_raw_data_file())
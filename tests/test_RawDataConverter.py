@@ -0,0 +1,83 @@
+import gzip
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_converter import ActivityConverter
+from speaking_eye.activity_reader import ActivityReader
+from speaking_eye.files_provider import FilesProvider
+from speaking_eye.raw_data_converter import RawDataConverter
+from speaking_eye.raw_data_format import RawDataFormat
+
+
+class RawDataConverterTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        start_time = datetime(2021, 7, 4, 9)
+        self.activities = [
+            Activity('Chromium', 'Tab 1', start_time, True).set_end_time(start_time + timedelta(minutes=5)),
+            Activity('Telegram', 'Чат', start_time + timedelta(minutes=5), False)
+            .set_end_time(start_time + timedelta(minutes=5, microseconds=1)),
+        ]
+
+    def test_convert(self) -> None:
+        converter = RawDataConverter(Mock())
+
+        with tempfile.TemporaryDirectory() as raw_data_dir:
+            tsv_file = Path(raw_data_dir) / '2021-07-04_speaking_eye_raw_data.tsv'
+            tsv_content = ''.join(ActivityConverter.to_string(activity) for activity in self.activities)
+            tsv_file.write_text(tsv_content)
+
+            binary_file = converter.convert(tsv_file, RawDataFormat.BINARY, keep_source=True)
+
+            self.assertEqual(Path(raw_data_dir) / '2021-07-04_speaking_eye_raw_data.bin', binary_file)
+            self.assertLess(binary_file.stat().st_size, tsv_file.stat().st_size)
+
+            with self.assertRaisesRegex(ValueError, expected_regex='already exists'):
+                converter.convert(tsv_file, RawDataFormat.BINARY)
+
+            tsv_file.unlink()
+
+            self.assertEqual(tsv_file, converter.convert(binary_file, RawDataFormat.TSV))
+            self.assertEqual(tsv_content, tsv_file.read_text())
+            self.assertFalse(binary_file.exists())
+            self.assertEqual(['2021-07-04_speaking_eye_raw_data.tsv'],
+                             [path.name for path in Path(raw_data_dir).iterdir()])
+
+    def test_convert_compressed(self) -> None:
+        converter = RawDataConverter(Mock())
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            package_root_dir = Path(tmp_dir) / 'package'
+
+            for dir_name in ['i18n', 'icon']:
+                (package_root_dir / dir_name).mkdir(parents=True)
+
+            with patch('speaking_eye.files_provider.xdg_config_home', return_value=Path(tmp_dir) / 'config'), \
+                    patch('speaking_eye.files_provider.xdg_data_home', return_value=Path(tmp_dir) / 'data'):
+                files_provider = FilesProvider(package_root_dir, 'speaky')
+
+            tsv_gz_file = files_provider.raw_data_dir / '2021-07-04_speaking_eye_raw_data.tsv.gz'
+
+            with gzip.open(str(tsv_gz_file), 'wt') as file:
+                file.write(''.join(ActivityConverter.to_string(activity) for activity in self.activities))
+
+            binary_file = converter.convert(tsv_gz_file, RawDataFormat.BINARY)
+
+            self.assertEqual(files_provider.raw_data_dir / '2021-07-04_speaking_eye_raw_data.bin.gz', binary_file)
+            self.assertFalse(tsv_gz_file.exists())
+
+            files_provider.raw_data_catalog.invalidate()
+
+            self.assertEqual([(date(2021, 7, 4), binary_file)], list(files_provider.iter_raw_data_files()))
+            self.assertEqual(self.activities, list(ActivityReader.iter_raw_data_file(binary_file)))
+
+            # NOTE: the day already has file in the target format even though it is compressed
+            tsv_file = files_provider.raw_data_dir / '2021-07-04_speaking_eye_raw_data.tsv'
+            tsv_file.touch()
+
+            with self.assertRaisesRegex(ValueError, expected_regex='already exists'):
+                converter.convert(tsv_file, RawDataFormat.BINARY)
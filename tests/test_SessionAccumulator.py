@@ -0,0 +1,91 @@
+import unittest
+from datetime import datetime, timedelta
+
+from speaking_eye.activity import Activity
+from speaking_eye.activity_stat_holder import ActivityStatHolder
+from speaking_eye.application_info import ApplicationInfo
+from speaking_eye.datetime_helper import DatetimeHelper
+from speaking_eye.session_accumulator import SessionAccumulator
+
+ONE_HOUR_US = 60 * 60 * 10 ** 6
+
+
+def to_us(value: datetime) -> int:
+    return DatetimeHelper.to_epoch_microseconds(value)
+
+
+class SessionAccumulatorTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.distracting_info = ApplicationInfo('distracting', 'Telegram', '', True)
+
+        finished_activity = Activity('Telegram', 'chat', datetime(2021, 7, 4, 9), True)
+        finished_activity.set_end_time(datetime(2021, 7, 4, 10))
+        finished_activity.set_application_info(self.distracting_info)
+
+        off_activity = Activity('Telegram', 'chat', datetime(2021, 7, 4, 10), False)
+        off_activity.set_end_time(datetime(2021, 7, 4, 12))
+
+        self.holder = ActivityStatHolder([finished_activity, off_activity])
+
+    def test_from_holder(self) -> None:
+        accumulator = SessionAccumulator.from_holder(self.holder)
+
+        self.assertEqual(ONE_HOUR_US, accumulator.total_work_us)
+        self.assertEqual(ONE_HOUR_US, accumulator.get_title_work_us('distracting'))
+        self.assertEqual(0, accumulator.get_title_work_us('Others'))
+        self.assertEqual(0, accumulator.get_title_work_us('unknown'))
+
+    def test_current_activity(self) -> None:
+        accumulator = SessionAccumulator.from_holder(self.holder)
+        current_activity = Activity('Telegram', 'chat', datetime(2021, 7, 4, 12), True) \
+            .set_application_info(self.distracting_info)
+        now_us = to_us(datetime(2021, 7, 4, 12, 30))
+
+        self.assertEqual(ONE_HOUR_US, accumulator.get_work_us(now_us))
+        self.assertEqual(0, accumulator.get_current_title_work_us(now_us))
+        self.assertIsNone(accumulator.get_work_limit_time_us(2 * ONE_HOUR_US))
+
+        accumulator.start(current_activity)
+
+        self.assertEqual(ONE_HOUR_US * 3 // 2, accumulator.get_work_us(now_us))
+        self.assertEqual(ONE_HOUR_US * 3 // 2, accumulator.get_current_title_work_us(now_us))
+        self.assertEqual(to_us(datetime(2021, 7, 4, 13)), accumulator.get_work_limit_time_us(2 * ONE_HOUR_US))
+        self.assertEqual(to_us(datetime(2021, 7, 4, 12, 30)),
+                         accumulator.get_current_title_limit_time_us(ONE_HOUR_US * 3 // 2))
+
+        accumulator.finish(current_activity, datetime(2021, 7, 4, 12, 45))
+
+        self.assertEqual(ONE_HOUR_US * 7 // 4, accumulator.total_work_us)
+        self.assertEqual(ONE_HOUR_US * 7 // 4, accumulator.get_title_work_us('distracting'))
+        self.assertEqual(ONE_HOUR_US * 7 // 4, accumulator.get_work_us(now_us))
+        self.assertIsNone(accumulator.get_current_title_limit_time_us(ONE_HOUR_US))
+
+    def test_off_time_activity_is_not_counted(self) -> None:
+        accumulator = SessionAccumulator()
+        off_activity = Activity('Telegram', 'chat', datetime(2021, 7, 4, 12), False)
+
+        accumulator.start(off_activity)
+        self.assertEqual(0, accumulator.get_work_us(to_us(datetime(2021, 7, 4, 13))))
+
+        accumulator.finish(off_activity, datetime(2021, 7, 4, 13))
+        self.assertEqual(0, accumulator.total_work_us)
+
+    def test_matches_holder(self) -> None:
+        accumulator = SessionAccumulator()
+        holder = ActivityStatHolder([])
+        start_time = datetime(2021, 7, 4, 9)
+
+        for i in range(10):
+            activity = Activity('Telegram', f'chat {i}', start_time + timedelta(seconds=i * 7), i % 3 != 0)
+            if i % 2 == 0:
+                activity.set_application_info(self.distracting_info)
+
+            accumulator.start(activity)
+            end_time = start_time + timedelta(seconds=(i + 1) * 7, microseconds=i)
+            accumulator.finish(activity, end_time)
+            holder.update_stat(activity.set_end_time(end_time))
+
+        self.assertEqual(holder.total_work_time, timedelta(microseconds=accumulator.total_work_us))
+        for title, stat in holder.items():
+            self.assertEqual(stat.work_time, timedelta(microseconds=accumulator.get_title_work_us(title)))
@@ -0,0 +1,75 @@
+import logging
+import sys
+import types
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+# NOTE: gi is not installed on CI and GTK main loop is not needed for the test, so gi is faked only for the import;
+#       Gtk.Application is a real class to be a base class of SpeakingEyeApp
+real_gi_modules = {name: sys.modules.get(name) for name in ['gi', 'gi.repository']}
+fake_gi_repository = mock.MagicMock()
+fake_gi_repository.Gtk.Application = type('Application', (), {})
+sys.modules.update({'gi': types.ModuleType('gi'), 'gi.repository': fake_gi_repository})
+
+try:
+    from speaking_eye.activity import Activity
+    from speaking_eye.speaking_eye_app import SpeakingEyeApp
+finally:
+    for name, module in real_gi_modules.items():
+        if module is None:
+            del sys.modules[name]
+        else:
+            sys.modules[name] = module
+
+
+class SpeakingEyeAppTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        on_activity_changed_patcher = mock.patch.object(SpeakingEyeApp, '_SpeakingEyeApp__on_activity_changed')
+        on_activity_changed_patcher.start()
+        self.addCleanup(on_activity_changed_patcher.stop)
+
+        # NOTE: only the state that is used by set_work_time_state() is set, GTK parts are not created
+        self.app = SpeakingEyeApp.__new__(SpeakingEyeApp)
+        self.app.logger = logging.Logger('SpeakingEyeAppTestCase')
+        self.app.work_state_checkbox_item = mock.Mock()
+        self.app.tray_icon = mock.Mock()
+        self.app.active_icon = Path('active.png')
+        self.app.disabled_icon = Path('disabled.png')
+        self.app.notification_timer = mock.Mock()
+        self.app.session = mock.Mock()
+        self.app.session.get_work_limit_time_us.return_value = None
+        self.app.is_work_time = False
+        self.app.is_lock_screen_activated = False
+        self.app.is_break_notification_allowed_to_show = True
+        self.app.has_distracting_app_overtime_notification_shown = False
+        self.app.user_breaks_interval_hours = 2
+        self.app.user_work_time_limit_us = 8 * 60 * 60 * 10 ** 6
+        self.app.current_activity = Activity('wm_class1', 'window_name1', datetime.now(), is_work_time=False)
+
+        # NOTE: state of the previous work time
+        previous_work_time = datetime.now() - timedelta(days=1)
+        self.app.is_work_time_update_time = previous_work_time
+        self.app.last_lock_screen_time = previous_work_time
+        self.app.last_break_notification = mock.Mock(last_shown=previous_work_time)
+        self.app.last_overtime_notification = mock.Mock(last_shown=previous_work_time)
+
+    def test_set_work_time_state_schedules_notifications_after_reset(self) -> None:
+        self.app.set_work_time_state(True)
+
+        self.assertIsNone(self.app.last_break_notification)
+        self.assertIsNone(self.app.last_overtime_notification)
+
+        deadline, _ = self.app.notification_timer.schedule.call_args.args
+        self.assertEqual(self.app.is_work_time_update_time + timedelta(hours=2), deadline)
+
+    def test_set_work_time_state_off(self) -> None:
+        self.app.set_work_time_state(False)
+        self.app.notification_timer.schedule.assert_not_called()
+
+        self.app.is_work_time = True
+        self.app.set_work_time_state(False)
+
+        self.app.notification_timer.schedule.assert_called_once_with(None, mock.ANY)
@@ -0,0 +1,73 @@
+import logging
+import sys
+import types
+import unittest
+from typing import Optional
+from unittest import mock
+
+# NOTE: gi is not installed on CI and Wnck is not needed for the test, so gi is faked only for the import
+real_gi_modules = {name: sys.modules.get(name) for name in ['gi', 'gi.repository']}
+sys.modules.update({'gi': types.ModuleType('gi'), 'gi.repository': mock.MagicMock()})
+
+try:
+    from speaking_eye.wm_class_provider import WmClassProvider
+finally:
+    for name, module in real_gi_modules.items():
+        if module is None:
+            del sys.modules[name]
+        else:
+            sys.modules[name] = module
+
+
+class FakeWindow:
+    """The part of Wnck.Window that is used by WmClassProvider"""
+
+    def __init__(self, xid: int, class_group_name: Optional[str]) -> None:
+        self.xid = xid
+        self.class_group_name = class_group_name
+
+    def get_xid(self) -> int:
+        return self.xid
+
+    def get_class_group_name(self) -> Optional[str]:
+        return self.class_group_name
+
+
+class WmClassProviderTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.provider = WmClassProvider(logging.Logger('WmClassProviderTestCase'))
+        get_wm_class_patcher = mock.patch('speaking_eye.wm_class_provider.get_wm_class', return_value='xprop-class')
+        self.get_wm_class = get_wm_class_patcher.start()
+        self.addCleanup(get_wm_class_patcher.stop)
+
+    def test_get_from_wnck(self) -> None:
+        self.assertEqual('Chromium', self.provider.get(FakeWindow(1, 'Chromium')))
+        self.get_wm_class.assert_not_called()
+
+    def test_get_from_xprop(self) -> None:
+        for class_group_name in [None, '']:
+            self.assertEqual('xprop-class', self.provider.get(FakeWindow(2, class_group_name)))
+            self.provider.forget(FakeWindow(2, class_group_name))
+
+        self.get_wm_class.assert_called_with(2)
+        self.assertEqual(2, self.get_wm_class.call_count)
+
+    def test_get_cached(self) -> None:
+        window = FakeWindow(3, None)
+
+        self.assertEqual('xprop-class', self.provider.get(window))
+        window.class_group_name = 'Changed'
+        self.assertEqual('xprop-class', self.provider.get(window))
+
+        self.get_wm_class.assert_called_once_with(3)
+
+    def test_forget(self) -> None:
+        self.assertEqual('Chromium', self.provider.get(FakeWindow(4, 'Chromium')))
+
+        # NOTE: X server can reuse XID of the closed window for another window
+        self.provider.forget(FakeWindow(4, 'Chromium'))
+        self.assertEqual('Slack', self.provider.get(FakeWindow(4, 'Slack')))
+
+        # NOTE: unknown window is ignored
+        self.provider.forget(FakeWindow(5, None))